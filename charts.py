@@ -0,0 +1,211 @@
+from gantt_view import nice_step
+
+# Above this many processes the charts show distributions instead of one bar per process
+AGGREGATE_THRESHOLD = 100
+
+# Value labels above the bars are only drawn up to this many processes
+LABEL_LIMIT = 30
+
+# Process ID tick labels shown at most
+MAX_TICK_LABELS = 20
+
+HISTOGRAM_BINS = 40
+
+# Room left above the tallest bar, as a fraction of its height
+HEADROOM = 0.15
+
+class _Panel:
+    """One of the two charts: its axes and the artists updated in place"""
+    def __init__(self, ax, name, color):
+        self.ax = ax
+        self.cdf_ax = ax.twinx()
+        self.name = name
+        self.color = color
+        self.bars = []
+        self.labels = []
+        self.cdf_line = None
+        self.limits = None
+    
+    def artists(self):
+        """Artists that change with the data; they are animated, so drawn only by MetricCharts"""
+        artists = self.bars + self.labels
+        if self.cdf_line is not None:
+            artists.append(self.cdf_line)
+        return artists
+    
+    def reset(self):
+        """Empty both axes and give them the dark style"""
+        for ax in (self.ax, self.cdf_ax):
+            ax.cla()
+            ax.tick_params(axis='both', colors='white')
+        self.ax.set_facecolor('#2D2D2D')
+        self.ax.grid(axis='y', alpha=0.3, color='white')
+        self.cdf_ax.set_visible(False)
+        self.bars = []
+        self.labels = []
+        self.cdf_line = None
+        self.limits = None
+    
+    def _animate(self):
+        for artist in self.artists():
+            artist.set_animated(True)
+    
+    def bar_layout(self, pids, colors):
+        """One bar per process, labelled with its value when there are few"""
+        self.reset()
+        n = len(pids)
+        container = self.ax.bar(range(n), [0] * n, color=colors, edgecolor='white',
+                                linewidth=1.5 if n <= LABEL_LIMIT else 0.5)
+        self.bars = list(container.patches)
+        if n <= LABEL_LIMIT:
+            self.labels = [
+                self.ax.text(i, 0, '', ha='center', va='bottom', fontsize=9, fontweight='bold', color='white')
+                for i in range(n)
+            ]
+        
+        step = -(-n // MAX_TICK_LABELS)
+        self.ax.set_xticks(range(0, n, step))
+        self.ax.set_xticklabels(pids[::step])
+        self.ax.set_xlim(-0.6, n - 0.4)
+        self._animate()
+        self.ax.set_xlabel('Process ID', fontsize=10, fontweight='bold', color='white')
+        self.ax.set_ylabel(self.name, fontsize=10, fontweight='bold', color='white')
+        self.ax.set_title(f'{self.name} per Process', fontsize=12, fontweight='bold', color='white')
+    
+    def aggregate_layout(self):
+        """Histogram of the values with their cumulative distribution on a second axis"""
+        self.reset()
+        container = self.ax.bar(range(HISTOGRAM_BINS), [0] * HISTOGRAM_BINS, width=1, align='edge',
+                                color=self.color, edgecolor='white', linewidth=0.5)
+        self.bars = list(container.patches)
+        self.cdf_line, = self.cdf_ax.plot([], [], color='white', linewidth=1.5)
+        self._animate()
+        
+        self.cdf_ax.set_visible(True)
+        self.cdf_ax.yaxis.tick_right()
+        self.cdf_ax.yaxis.set_label_position('right')
+        self.cdf_ax.set_ylim(0, 1.05)
+        self.cdf_ax.set_ylabel('Cumulative share', fontsize=10, color='white')
+        self.ax.set_xlabel(self.name, fontsize=10, fontweight='bold', color='white')
+        self.ax.set_ylabel('Processes', fontsize=10, fontweight='bold', color='white')
+        self.ax.set_title(f'{self.name} Distribution', fontsize=12, fontweight='bold', color='white')
+    
+    def show_bars(self, values, colors):
+        """Set bar heights and labels; returns the y limit the panel needs"""
+        top = max(values)
+        for bar, value, color in zip(self.bars, values, colors):
+            bar.set_height(value)
+            bar.set_facecolor(color)
+        for label, value in zip(self.labels, values):
+            label.set_text(str(value))
+            label.set_y(value + 0.01 * top)
+        return (nice_step(top * (1 + HEADROOM)),)
+    
+    def show_distribution(self, values):
+        """Bin the values into the histogram and the CDF line; returns the limits the panel needs"""
+        import numpy as np
+        
+        values = np.asarray(values)
+        x_limit = nice_step(int(values.max()) + 1)
+        counts, edges = np.histogram(values, bins=HISTOGRAM_BINS, range=(0, x_limit))
+        width = edges[1] - edges[0]
+        for bar, left, count in zip(self.bars, edges, counts):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(count)
+        self.cdf_line.set_data(edges, np.concatenate(([0.0], np.cumsum(counts) / len(values))))
+        return x_limit, nice_step(int(counts.max() * (1 + HEADROOM)))
+    
+    def apply_limits(self, limits):
+        """Set the axis limits; returns True if they changed"""
+        if limits == self.limits:
+            return False
+        self.limits = limits
+        if len(limits) == 2:
+            self.ax.set_xlim(0, limits[0])
+        self.ax.set_ylim(0, limits[-1])
+        return True
+
+class MetricCharts:
+    """Waiting and turnaround time charts whose artists persist across runs
+    
+    Axes, bars and labels are created only when the layout changes (another
+    number of processes, other pids, or a switch between modes) and are
+    otherwise updated in place. When the axis limits still fit the new
+    values, only the changed artists are redrawn over a saved background
+    and blitted; otherwise the figure is redrawn once. Up to
+    AGGREGATE_THRESHOLD processes get one bar each; beyond that each chart
+    becomes a fixed-size histogram with a CDF line, so the cost of a redraw
+    does not grow with the number of processes.
+    """
+    def __init__(self, canvas, facecolor):
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self.figure.clear()
+        self.figure.patch.set_facecolor(facecolor)
+        self.panels = [
+            _Panel(self.figure.add_subplot(121), 'Waiting Time', '#FFC107'),
+            _Panel(self.figure.add_subplot(122), 'Turnaround Time', '#0078D4'),
+        ]
+        self.layout = None
+        self._background = None
+        canvas.mpl_connect('draw_event', self._on_draw)
+        self.clear()
+    
+    def clear(self):
+        """Hide both charts until the next update"""
+        for panel in self.panels:
+            panel.reset()
+            panel.ax.set_visible(False)
+        self.layout = None
+        self._redraw()
+    
+    def update(self, pids, waiting_times, turnaround_times, colors):
+        """Show the waiting and turnaround time of every process"""
+        n = len(pids)
+        if not n:
+            return self.clear()
+        
+        aggregate = n > AGGREGATE_THRESHOLD
+        layout = ('aggregate',) if aggregate else ('bars', tuple(pids))
+        full_redraw = layout != self.layout
+        if full_redraw:
+            for panel in self.panels:
+                panel.ax.set_visible(True)
+                if aggregate:
+                    panel.aggregate_layout()
+                else:
+                    panel.bar_layout(pids, colors)
+            self.figure.tight_layout()
+            self.layout = layout
+        
+        for panel, values in zip(self.panels, (waiting_times, turnaround_times)):
+            if aggregate:
+                limits = panel.show_distribution(values)
+            else:
+                limits = panel.show_bars(values, colors)
+            full_redraw |= panel.apply_limits(limits)
+        
+        if full_redraw or self._background is None:
+            self._redraw()
+        else:
+            self._blit()
+    
+    def _redraw(self):
+        self._background = None
+        self.canvas.draw_idle()
+    
+    def _on_draw(self, event):
+        # A full draw leaves out the animated artists: keep it as the background, then add them
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_artists()
+    
+    def _blit(self):
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.figure.bbox)
+    
+    def _draw_artists(self):
+        for panel in self.panels:
+            for artist in panel.artists():
+                artist.axes.draw_artist(artist)
@@ -1,327 +1,75 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import random
 import csv
+from collections import OrderedDict
 from datetime import datetime
-import copy
 
-class Process:
-    """Process class to store process information"""
-    def __init__(self, pid, arrival_time, burst_time, priority=0):
-        self.pid = pid
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.remaining_time = burst_time
-        self.priority = priority
-        self.start_time = -1
-        self.finish_time = 0
-        self.turnaround_time = 0
-        self.waiting_time = 0
-        self.response_time = 0
-        self.color = self.generate_color()
-    
-    def generate_color(self):
-        """Generate a unique color for the process"""
-        colors = [
-            '#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8',
-            '#F7DC6F', '#BB8FCE', '#85C1E2', '#F8B739', '#52B788',
-            '#E63946', '#F4A261', '#2A9D8F', '#264653', '#E76F51'
-        ]
-        return colors[int(self.pid[1:]) % len(colors)]
-
-class SchedulingAlgorithm:
-    """Base class for scheduling algorithms"""
-    
-    @staticmethod
-    def fcfs(processes):
-        """First Come First Serve"""
-        processes = sorted(processes, key=lambda x: x.arrival_time)
-        timeline = []
-        current_time = 0
-        
-        for process in processes:
-            if current_time < process.arrival_time:
-                current_time = process.arrival_time
-            
-            process.start_time = current_time
-            process.finish_time = current_time + process.burst_time
-            process.turnaround_time = process.finish_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
-            
-            timeline.append({
-                'pid': process.pid,
-                'start': current_time,
-                'end': process.finish_time,
-                'color': process.color
-            })
-            
-            current_time = process.finish_time
-        
-        return processes, timeline
-    
-    @staticmethod
-    def sjf_non_preemptive(processes):
-        """Shortest Job First - Non-preemptive"""
-        timeline = []
-        current_time = 0
-        completed = []
-        ready_queue = []
-        remaining_processes = copy.deepcopy(processes)
-        
-        while len(completed) < len(processes):
-            # Add arrived processes to ready queue
-            arrived = [p for p in remaining_processes if p.arrival_time <= current_time]
-            ready_queue.extend(arrived)
-            for p in arrived:
-                remaining_processes.remove(p)
-            
-            if not ready_queue:
-                if remaining_processes:
-                    current_time = min(p.arrival_time for p in remaining_processes)
-                continue
-            
-            # Select process with shortest burst time
-            process = min(ready_queue, key=lambda x: x.burst_time)
-            ready_queue.remove(process)
-            
-            process.start_time = current_time
-            process.finish_time = current_time + process.burst_time
-            process.turnaround_time = process.finish_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
-            
-            timeline.append({
-                'pid': process.pid,
-                'start': current_time,
-                'end': process.finish_time,
-                'color': process.color
-            })
-            
-            current_time = process.finish_time
-            completed.append(process)
-        
-        return completed, timeline
-    
-    @staticmethod
-    def sjf_preemptive(processes):
-        """Shortest Job First - Preemptive (SRTF)"""
-        timeline = []
-        current_time = 0
-        completed = []
-        remaining_processes = copy.deepcopy(processes)
-        
-        for p in remaining_processes:
-            p.remaining_time = p.burst_time
-        
-        while len(completed) < len(processes):
-            # Get available processes
-            available = [p for p in remaining_processes if p.arrival_time <= current_time and p.remaining_time > 0]
-            
-            if not available:
-                current_time += 1
-                continue
-            
-            # Select process with shortest remaining time
-            process = min(available, key=lambda x: x.remaining_time)
-            
-            if process.start_time == -1:
-                process.start_time = current_time
-            
-            # Execute for 1 time unit
-            timeline.append({
-                'pid': process.pid,
-                'start': current_time,
-                'end': current_time + 1,
-                'color': process.color
-            })
-            
-            process.remaining_time -= 1
-            current_time += 1
-            
-            if process.remaining_time == 0:
-                process.finish_time = current_time
-                process.turnaround_time = process.finish_time - process.arrival_time
-                process.waiting_time = process.turnaround_time - process.burst_time
-                completed.append(process)
-        
-        return completed, timeline
-    
-    @staticmethod
-    def round_robin(processes, time_quantum):
-        """Round Robin with time quantum"""
-        timeline = []
-        current_time = 0
-        ready_queue = []
-        
-        # Create working copies and keep reference to originals
-        working_processes = copy.deepcopy(processes)
-        process_map = {wp.pid: wp for wp in working_processes}
-        original_map = {p.pid: p for p in processes}
-        
-        for p in working_processes:
-            p.remaining_time = p.burst_time
-            p.start_time = -1
-        
-        # Sort by arrival time
-        working_processes.sort(key=lambda x: x.arrival_time)
-        remaining_processes = working_processes.copy()
-        
-        while remaining_processes or ready_queue:
-            # Add arrived processes to ready queue
-            while remaining_processes and remaining_processes[0].arrival_time <= current_time:
-                ready_queue.append(remaining_processes.pop(0))
-            
-            if not ready_queue:
-                if remaining_processes:
-                    current_time = remaining_processes[0].arrival_time
-                continue
-            
-            process = ready_queue.pop(0)
-            
-            if process.start_time == -1:
-                process.start_time = current_time
-            
-            # Execute for time quantum or remaining time
-            exec_time = min(time_quantum, process.remaining_time)
-            
-            timeline.append({
-                'pid': process.pid,
-                'start': current_time,
-                'end': current_time + exec_time,
-                'color': process.color
-            })
-            
-            process.remaining_time -= exec_time
-            current_time += exec_time
-            
-            # Add newly arrived processes
-            while remaining_processes and remaining_processes[0].arrival_time <= current_time:
-                ready_queue.append(remaining_processes.pop(0))
-            
-            if process.remaining_time > 0:
-                ready_queue.append(process)
-            else:
-                process.finish_time = current_time
-                process.turnaround_time = process.finish_time - process.arrival_time
-                process.waiting_time = process.turnaround_time - process.burst_time
-                
-                # Update the original process with results
-                original_process = original_map[process.pid]
-                original_process.start_time = process.start_time
-                original_process.finish_time = process.finish_time
-                original_process.turnaround_time = process.turnaround_time
-                original_process.waiting_time = process.waiting_time
-        
-        return processes, timeline
-    
-    @staticmethod
-    def priority_non_preemptive(processes):
-        """Priority Scheduling - Non-preemptive"""
-        timeline = []
-        current_time = 0
-        completed = []
-        ready_queue = []
-        remaining_processes = copy.deepcopy(processes)
-        
-        while len(completed) < len(processes):
-            # Add arrived processes to ready queue
-            arrived = [p for p in remaining_processes if p.arrival_time <= current_time]
-            ready_queue.extend(arrived)
-            for p in arrived:
-                remaining_processes.remove(p)
-            
-            if not ready_queue:
-                if remaining_processes:
-                    current_time = min(p.arrival_time for p in remaining_processes)
-                continue
-            
-            # Select process with highest priority (lower number = higher priority)
-            process = min(ready_queue, key=lambda x: (x.priority, x.arrival_time))
-            ready_queue.remove(process)
-            
-            process.start_time = current_time
-            process.finish_time = current_time + process.burst_time
-            process.turnaround_time = process.finish_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
-            
-            timeline.append({
-                'pid': process.pid,
-                'start': current_time,
-                'end': process.finish_time,
-                'color': process.color
-            })
-            
-            current_time = process.finish_time
-            completed.append(process)
-        
-        return completed, timeline
-    
-    @staticmethod
-    def priority_preemptive(processes):
-        """Priority Scheduling - Preemptive"""
-        timeline = []
-        current_time = 0
-        completed = []
-        remaining_processes = copy.deepcopy(processes)
-        
-        for p in remaining_processes:
-            p.remaining_time = p.burst_time
-        
-        while len(completed) < len(processes):
-            # Get available processes
-            available = [p for p in remaining_processes if p.arrival_time <= current_time and p.remaining_time > 0]
-            
-            if not available:
-                current_time += 1
-                continue
-            
-            # Select process with highest priority
-            process = min(available, key=lambda x: (x.priority, x.arrival_time))
-            
-            if process.start_time == -1:
-                process.start_time = current_time
-            
-            # Execute for 1 time unit
-            timeline.append({
-                'pid': process.pid,
-                'start': current_time,
-                'end': current_time + 1,
-                'color': process.color
-            })
-            
-            process.remaining_time -= 1
-            current_time += 1
-            
-            if process.remaining_time == 0:
-                process.finish_time = current_time
-                process.turnaround_time = process.finish_time - process.arrival_time
-                process.waiting_time = process.turnaround_time - process.burst_time
-                completed.append(process)
-        
-        return completed, timeline
+from scheduler_engine import (
+    ResultCache,
+    SchedulingAlgorithm,
+    SimulationWorker,
+    WorkloadError,
+    load_workload,
+    workload_key,
+    write_trace,
+)
+from scheduler_engine.draft import DraftError, WorkloadDraft
+from scheduler_engine.explain import Explanation
+from scheduler_engine.trace import TRACE_SUFFIX, TraceError, TraceFile, TraceTable
+
+from charts import AGGREGATE_THRESHOLD, MetricCharts
+from explanation_view import ExplanationView
+from gantt_view import PLAYBACK_SPEEDS, GanttView, Playback
+from process_editor import ProcessEditor
+from results_view import ResultsView
+
+# Upper limit of the process count spinbox
+MAX_PROCESSES = 1000000
+
+# How often a running simulation is checked for progress and new segments
+POLL_MS = 50
+
+# Ready processes listed under the seek bar
+QUEUE_SHOWN = 12
+
+# Finished runs kept by workload key, so cached results still show their ready queue
+RECENT_RUNS = 8
 
 class SchedulerVisualizerApp:
     """Main application class"""
     
-    def __init__(self, root):
+    def __init__(self, root, figure=None):
         self.root = root
         self.root.title("CPU Scheduling Algorithms Visualizer - SeanScript Development")
         
+        # Chart figure pre-built by the loading page, if any
+        self.prepared_figure = figure
+        
         # Make fullscreen
         self.root.state('zoomed')  # Windows
         # self.root.attributes('-zoomed', True)  # Linux
         
         # Variables
-        self.processes = []
+        self.table = None
         self.timeline = []
+        self.result = None
+        self.trace = None
+        # (algorithm, time quantum, coalesced) of the run or trace shown
+        self.run_settings = None
+        self.draft = WorkloadDraft()
+        self.worker = None
+        self.worker_key = None
+        self.last_run = None
+        self.shown_run = None
+        self.recent_runs = OrderedDict()
+        self.result_cache = ResultCache()
         self.current_algorithm = tk.StringVar(value="FCFS")
         self.time_quantum = tk.IntVar(value=2)
         self.num_processes = tk.IntVar(value=4)
         self.dark_mode = tk.BooleanVar(value=True)  # Dark mode enabled by default
-        self.animation_speed = tk.IntVar(value=100)
-        self.animation_running = False
+        self.playback_speed = tk.StringVar(value="10×")
+        self.per_tick_timeline = tk.BooleanVar(value=False)
+        self._syncing_seek = False
         
         # Colors
         self.set_dark_colors()
@@ -413,14 +161,7 @@ class SchedulerVisualizerApp:
             fg='white'
         ).pack(side=tk.LEFT, padx=5)
 
-        algorithms = [
-            "FCFS",
-            "SJF (Non-preemptive)",
-            "SJF (Preemptive)",
-            "Round Robin",
-            "Priority (Non-preemptive)",
-            "Priority (Preemptive)"
-        ]
+        algorithms = list(SchedulingAlgorithm.ALGORITHMS)
 
         algo_combo = ttk.Combobox(
             controls_frame,
@@ -451,6 +192,24 @@ class SchedulerVisualizerApp:
         self.run_btn.pack(side=tk.LEFT, padx=10)
         self.run_btn.bind("<Enter>", lambda e: self.run_btn.config(bg='#218838'))
         self.run_btn.bind("<Leave>", lambda e: self.run_btn.config(bg='#28A745'))
+        
+        # Cancel button, enabled while a simulation is running
+        self.cancel_btn = tk.Button(
+            controls_frame,
+            text="✖ Cancel",
+            command=self.cancel_simulation,
+            font=('Arial', 12, 'bold'),
+            bg='#DC3545',
+            fg='white',
+            disabledforeground='#E0A0A6',
+            padx=15,
+            pady=8,
+            relief=tk.FLAT,
+            cursor='hand2',
+            bd=0,
+            state=tk.DISABLED
+        )
+        self.cancel_btn.pack(side=tk.LEFT)
     
     def create_left_panel(self, parent):
         """Create left input panel"""
@@ -481,15 +240,18 @@ class SchedulerVisualizerApp:
             fg=self.fg_color
         ).pack(side=tk.LEFT)
         
-        tk.Spinbox(
+        num_spinbox = tk.Spinbox(
             num_frame,
             from_=1,
-            to=99,
+            to=MAX_PROCESSES,
             textvariable=self.num_processes,
             font=('Arial', 11),
-            width=5,
+            width=7,
             command=self.update_process_inputs
-        ).pack(side=tk.RIGHT)
+        )
+        num_spinbox.pack(side=tk.RIGHT)
+        num_spinbox.bind('<Return>', lambda e: self.update_process_inputs())
+        num_spinbox.bind('<FocusOut>', lambda e: self.update_process_inputs())
         
         # Time quantum (for Round Robin) - only show for Round Robin
         self.quantum_frame = tk.Frame(left_panel, bg=self.panel_bg)
@@ -510,6 +272,21 @@ class SchedulerVisualizerApp:
             width=5
         ).pack(side=tk.RIGHT)
         
+        # Raw uncoalesced blocks: per tick for SJF/Priority preemptive, per quantum for Round Robin
+        self.per_tick_check = tk.Checkbutton(
+            left_panel,
+            text="Show uncoalesced blocks",
+            variable=self.per_tick_timeline,
+            font=('Arial', 10),
+            bg=self.panel_bg,
+            fg=self.fg_color,
+            selectcolor=self.input_bg,
+            activebackground=self.panel_bg,
+            activeforeground=self.fg_color,
+            anchor='w'
+        )
+        self.per_tick_check.pack(fill=tk.X, padx=15, pady=5)
+        
         # Buttons with hover effects
         self.btn_frame = tk.Frame(left_panel, bg=self.panel_bg)
         self.btn_frame.pack(fill=tk.X, padx=15, pady=10)
@@ -519,6 +296,7 @@ class SchedulerVisualizerApp:
         self.btn_frame.grid_columnconfigure(1, weight=1)
         self.btn_frame.grid_rowconfigure(0, weight=1)
         self.btn_frame.grid_rowconfigure(1, weight=1)
+        self.btn_frame.grid_rowconfigure(2, weight=1)
 
         self.generate_btn = tk.Button(
             self.btn_frame,
@@ -572,6 +350,32 @@ class SchedulerVisualizerApp:
         )
         self.process_btn.grid(row=1, column=1, padx=2, pady=2, sticky='ew')
 
+        self.import_btn = tk.Button(
+            self.btn_frame,
+            text="📂 Import",
+            command=self.import_workload,
+            font=('Arial', 10, 'bold'),
+            bg='#6C757D',
+            fg='white',
+            relief=tk.FLAT,
+            cursor='hand2',
+            pady=8
+        )
+        self.import_btn.grid(row=2, column=0, padx=2, pady=2, sticky='ew')
+
+        self.paste_btn = tk.Button(
+            self.btn_frame,
+            text="📋 Paste",
+            command=self.paste_workload,
+            font=('Arial', 10, 'bold'),
+            bg='#6C757D',
+            fg='white',
+            relief=tk.FLAT,
+            cursor='hand2',
+            pady=8
+        )
+        self.paste_btn.grid(row=2, column=1, padx=2, pady=2, sticky='ew')
+
         # Add hover effects
         self.generate_btn.bind("<Enter>", lambda e: self.generate_btn.config(bg='#005a9e'))
         self.generate_btn.bind("<Leave>", lambda e: self.generate_btn.config(bg=self.button_bg))
@@ -584,26 +388,24 @@ class SchedulerVisualizerApp:
 
         self.process_btn.bind("<Enter>", lambda e: self.process_btn.config(bg='#218838'))
         self.process_btn.bind("<Leave>", lambda e: self.process_btn.config(bg='#28A745'))
-        
-        # Scrollable process input area
-        input_canvas = tk.Canvas(left_panel, bg=self.panel_bg, highlightthickness=0)
-        scrollbar = tk.Scrollbar(left_panel, orient="vertical", command=input_canvas.yview)
-        self.process_input_frame = tk.Frame(input_canvas, bg=self.panel_bg)
-        
-        self.process_input_frame.bind(
-            "<Configure>",
-            lambda e: input_canvas.configure(scrollregion=input_canvas.bbox("all"))
+
+        for button in (self.import_btn, self.paste_btn):
+            button.bind("<Enter>", lambda e: e.widget.config(bg='#5a6268'))
+            button.bind("<Leave>", lambda e: e.widget.config(bg='#6C757D'))
+        
+        # Process grid: only the visible rows are drawn
+        input_canvas = tk.Canvas(left_panel, bg=self.panel_bg, highlightthickness=0, takefocus=1)
+        scrollbar = tk.Scrollbar(left_panel, orient="vertical")
+        self.process_editor = ProcessEditor(
+            input_canvas,
+            scrollbar,
+            self.draft,
+            on_resize=self.num_processes.set
         )
         
-        input_canvas.create_window((0, 0), window=self.process_input_frame, anchor="nw")
-        input_canvas.configure(yscrollcommand=scrollbar.set)
-        
         input_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Bind mouse wheel
-        input_canvas.bind("<MouseWheel>", lambda e: input_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-        
         # Initial process inputs
         self.update_process_inputs()
         self.update_quantum_visibility()
@@ -611,7 +413,7 @@ class SchedulerVisualizerApp:
     def update_quantum_visibility(self):
         """Show/hide time quantum input based on algorithm"""
         if self.current_algorithm.get() == "Round Robin":
-            self.quantum_frame.pack(fill=tk.X, padx=15, pady=5, before=self.btn_frame)
+            self.quantum_frame.pack(fill=tk.X, padx=15, pady=5, before=self.per_tick_check)
         else:
             self.quantum_frame.pack_forget()
 
@@ -630,36 +432,87 @@ class SchedulerVisualizerApp:
         )
         header.pack(pady=10)
         
-        # Animation speed control
+        # Playback controls
         speed_frame = tk.Frame(center_panel, bg=self.panel_bg)
         speed_frame.pack(fill=tk.X, padx=20, pady=5)
         
+        self.play_btn = tk.Button(
+            speed_frame,
+            text="▶ Play",
+            command=lambda: self.playback.toggle(),
+            font=('Arial', 10, 'bold'),
+            bg=self.button_bg,
+            fg='white',
+            relief=tk.FLAT,
+            cursor='hand2',
+            width=8
+        )
+        self.play_btn.pack(side=tk.LEFT)
+        
+        tk.Button(
+            speed_frame,
+            text="⏭ End",
+            command=lambda: self.playback.jump_to_end(),
+            font=('Arial', 10, 'bold'),
+            bg=self.button_bg,
+            fg='white',
+            relief=tk.FLAT,
+            cursor='hand2'
+        ).pack(side=tk.LEFT, padx=5)
+        
         tk.Label(
             speed_frame,
-            text="Animation Speed:",
+            text="Speed:",
             font=('Arial', 10),
             bg=self.panel_bg,
             fg=self.fg_color
-        ).pack(side=tk.LEFT)
+        ).pack(side=tk.LEFT, padx=(10, 0))
         
-        tk.Scale(
+        speed_combo = ttk.Combobox(
             speed_frame,
-            from_=10,
-            to=500,
+            textvariable=self.playback_speed,
+            values=[f"{speed}×" for speed in PLAYBACK_SPEEDS],
+            state='readonly',
+            width=6,
+            font=('Arial', 10)
+        )
+        speed_combo.pack(side=tk.LEFT, padx=5)
+        speed_combo.bind("<<ComboboxSelected>>", lambda e: self.update_playback_speed())
+        
+        # Seek bar over simulated time; its range is set when a timeline is loaded
+        self.seek_scale = tk.Scale(
+            speed_frame,
+            from_=0,
+            to=0,
             orient=tk.HORIZONTAL,
-            variable=self.animation_speed,
+            command=self.seek_playback,
+            showvalue=False,
             bg=self.panel_bg,
             fg=self.fg_color,
             highlightthickness=0
-        ).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=10)
+        )
+        self.seek_scale.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=10)
         
-        tk.Label(
+        self.time_label = tk.Label(
             speed_frame,
-            text="ms",
+            text="t = 0 / 0",
             font=('Arial', 10),
             bg=self.panel_bg,
             fg=self.fg_color
-        ).pack(side=tk.RIGHT)
+        )
+        self.time_label.pack(side=tk.RIGHT)
+        
+        # Scheduler state at the seek bar position
+        self.queue_label = tk.Label(
+            center_panel,
+            text="",
+            font=('Arial', 10),
+            bg=self.panel_bg,
+            fg=self.fg_color,
+            anchor='w',
+            justify=tk.LEFT
+        )
+        self.queue_label.pack(fill=tk.X, padx=20)
         
         # Gantt chart canvas
         self.gantt_canvas = tk.Canvas(
@@ -671,11 +524,10 @@ class SchedulerVisualizerApp:
         )
         self.gantt_canvas.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        # Horizontal scrollbar for Gantt chart
-        self.gantt_hsb = tk.Scrollbar(center_panel, orient="horizontal", command=self.gantt_canvas.xview)
-        self.gantt_canvas.configure(xscrollcommand=self.gantt_hsb.set)
-        # Bind mouse wheel for horizontal scrolling
-        self.gantt_canvas.bind("<MouseWheel>", lambda e: self.gantt_canvas.xview_scroll(int(-1*(e.delta/120)), "units"))
+        # Only the visible time window is drawn; wheel pans, Ctrl+wheel zooms
+        self.gantt_view = GanttView(self.gantt_canvas)
+        self.playback = Playback(self.gantt_view, on_change=self.update_playback_controls)
+        self.update_playback_speed()
 
         # Status label
         self.status_label = tk.Label(
@@ -704,6 +556,31 @@ class SchedulerVisualizerApp:
         )
         header.pack(pady=10)
         
+        # Filter, e.g. "WT > 5", "TAT 10..20" or "P12"
+        filter_frame = tk.Frame(right_panel, bg=self.panel_bg)
+        filter_frame.pack(fill=tk.X, padx=10)
+        
+        tk.Label(
+            filter_frame,
+            text="Filter:",
+            font=('Arial', 10),
+            bg=self.panel_bg,
+            fg=self.fg_color
+        ).pack(side=tk.LEFT)
+        
+        self.filter_entry = tk.Entry(filter_frame, font=('Arial', 10), width=16)
+        self.filter_entry.pack(side=tk.LEFT, padx=5)
+        self.filter_entry.bind('<Return>', lambda e: self.apply_results_filter())
+        
+        self.results_count_label = tk.Label(
+            filter_frame,
+            text="",
+            font=('Arial', 9),
+            bg=self.panel_bg,
+            fg=self.fg_color
+        )
+        self.results_count_label.pack(side=tk.LEFT, padx=5)
+        
         # Table frame
         table_frame = tk.Frame(right_panel, bg=self.panel_bg)
         table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -737,14 +614,12 @@ class SchedulerVisualizerApp:
             table_frame,
             columns=columns,
             show='headings',
-            yscrollcommand=vsb.set,
             xscrollcommand=hsb.set,
             height=18,
             style="Results.Treeview"
         )
         
-        # Configure scrollbars
-        vsb.config(command=self.results_tree.yview)
+        # Configure scrollbars; the vertical one pages through ResultsView
         hsb.config(command=self.results_tree.xview)
         
         # Column headings
@@ -773,6 +648,9 @@ class SchedulerVisualizerApp:
             self.results_tree.heading(col, text=headings[col])
             self.results_tree.column(col, width=column_widths[col], anchor='center')
         
+        # Only the visible page of rows is kept in the tree
+        self.results_view = ResultsView(self.results_tree, vsb, row_height=28)
+        
         # Pack table and scrollbars using grid for better control
         self.results_tree.grid(row=0, column=0, sticky='nsew')
         vsb.grid(row=0, column=1, sticky='ns')
@@ -790,11 +668,28 @@ class SchedulerVisualizerApp:
             cursor='hand2',
             pady=10
         )
-        self.export_btn.pack(fill=tk.X, padx=10, pady=10)
+        self.export_btn.pack(fill=tk.X, padx=10, pady=(10, 0))
         
         # Add hover effect
         self.export_btn.bind("<Enter>", lambda e: self.export_btn.config(bg='#138496'))
         self.export_btn.bind("<Leave>", lambda e: self.export_btn.config(bg='#17A2B8'))
+        
+        # Open a saved binary trace
+        self.open_trace_btn = tk.Button(
+            right_panel,
+            text="📂 Open Trace",
+            command=self.open_trace,
+            font=('Arial', 11, 'bold'),
+            bg='#6C757D',
+            fg='white',
+            relief=tk.FLAT,
+            cursor='hand2',
+            pady=10
+        )
+        self.open_trace_btn.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.open_trace_btn.bind("<Enter>", lambda e: self.open_trace_btn.config(bg='#5a6268'))
+        self.open_trace_btn.bind("<Leave>", lambda e: self.open_trace_btn.config(bg='#6C757D'))
     
     def create_bottom_panel(self):
         """Create bottom summary and charts panel"""
@@ -873,105 +768,82 @@ class SchedulerVisualizerApp:
         charts_frame = tk.Frame(bottom_panel, bg=self.panel_bg)
         charts_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Matplotlib figure for charts
-        self.fig = Figure(figsize=(12, 3), dpi=80, facecolor=self.panel_bg)
-        self.chart_canvas = FigureCanvasTkAgg(self.fig, charts_frame)
-        self.chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Matplotlib figure is created on first draw to keep startup fast
+        self.charts_frame = charts_frame
+        self.fig = None
+        self.chart_canvas = None
+        self.charts = None
+    
+    def ensure_chart_canvas(self):
+        """Import matplotlib and create the chart figure on first use"""
+        if self.fig is None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            
+            if self.prepared_figure is not None:
+                self.fig = self.prepared_figure
+            else:
+                from matplotlib.figure import Figure
+                self.fig = Figure(figsize=(12, 3), dpi=80, facecolor=self.panel_bg)
+            self.chart_canvas = FigureCanvasTkAgg(self.fig, self.charts_frame)
+            self.chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.charts = MetricCharts(self.chart_canvas, self.panel_bg)
     
     def update_process_inputs(self):
-        """Generate input fields for processes"""
-        # Clear existing inputs
-        for widget in self.process_input_frame.winfo_children():
-            widget.destroy()
-        
-        n = self.num_processes.get()
-        self.process_entries = []
-        show_priority = "Priority" in self.current_algorithm.get()
-
-        # Set background color for process input frame and its parent canvas
-        bg_color = self.panel_bg
-        parent_canvas = self.process_input_frame.master
-        parent_canvas.config(bg=bg_color, highlightthickness=0)
-        self.process_input_frame.config(bg=bg_color)
-
-        for i in range(n):
-            process_frame = tk.LabelFrame(
-                self.process_input_frame,
-                text=f"Process P{i+1}",
-                font=('Arial', 11, 'bold'),
-                bg=bg_color,
-                fg='white',
-                relief=tk.GROOVE,
-                bd=2
-            )
-            process_frame.pack(fill=tk.X, padx=10, pady=8)
-            entries = {}
-
-            # Arrival Time
-            at_frame = tk.Frame(process_frame, bg=bg_color)
-            at_frame.pack(fill=tk.X, padx=10, pady=3)
-            tk.Label(
-                at_frame,
-                text="Arrival Time:",
-                font=('Arial', 10),
-                bg=bg_color,
-                fg='white'
-            ).pack(side=tk.LEFT)
-            at_entry = tk.Entry(at_frame, font=('Arial', 10), width=8, bg='#3C3C3C', fg='white', insertbackground='white')
-            at_entry.pack(side=tk.RIGHT)
-            entries['at'] = at_entry
-
-            # Burst Time
-            bt_frame = tk.Frame(process_frame, bg=bg_color)
-            bt_frame.pack(fill=tk.X, padx=10, pady=3)
-            tk.Label(
-                bt_frame,
-                text="Burst Time:",
-                font=('Arial', 10),
-                bg=bg_color,
-                fg='white'
-            ).pack(side=tk.LEFT)
-            bt_entry = tk.Entry(bt_frame, font=('Arial', 10), width=8, bg='#3C3C3C', fg='white', insertbackground='white')
-            bt_entry.pack(side=tk.RIGHT)
-            entries['bt'] = bt_entry
-
-            # Priority (only for Priority Scheduling)
-            if show_priority:
-                priority_frame = tk.Frame(process_frame, bg=bg_color)
-                priority_frame.pack(fill=tk.X, padx=10, pady=3)
-                tk.Label(
-                    priority_frame,
-                    text="Priority:",
-                    font=('Arial', 10),
-                    bg=bg_color,
-                    fg='white'
-                ).pack(side=tk.LEFT)
-                priority_entry = tk.Entry(priority_frame, font=('Arial', 10), width=8, bg='#3C3C3C', fg='white', insertbackground='white')
-                priority_entry.pack(side=tk.RIGHT)
-                entries['priority'] = priority_entry
-            self.process_entries.append(entries)
+        """Resize the process grid to the process count and show or hide priorities"""
+        try:
+            n = max(1, min(MAX_PROCESSES, self.num_processes.get()))
+        except tk.TclError:  # Not a number (yet)
+            return
+        self.process_editor.commit()
+        self.draft.resize(n)
+        self.process_editor.set_priority_visible("Priority" in self.current_algorithm.get())
+        self.process_editor.refresh()
     
     def random_fill(self):
         """Fill inputs with random values"""
-        show_priority = "Priority" in self.current_algorithm.get()
-        for i, entries in enumerate(self.process_entries):
-            entries['at'].delete(0, tk.END)
-            entries['at'].insert(0, str(random.randint(0, 10)))
-            
-            entries['bt'].delete(0, tk.END)
-            entries['bt'].insert(0, str(random.randint(1, 10)))
-            
-            if show_priority and 'priority' in entries:
-                entries['priority'].delete(0, tk.END)
-                entries['priority'].insert(0, str(random.randint(1, 5)))
+        self.process_editor.commit()
+        self.draft.fill_random(with_priority="Priority" in self.current_algorithm.get())
+        self.process_editor.refresh()
     
     def clear_inputs(self):
         """Clear all input fields"""
-        for entries in self.process_entries:
-            entries['at'].delete(0, tk.END)
-            entries['bt'].delete(0, tk.END)
-            if 'priority' in entries:
-                entries['priority'].delete(0, tk.END)
+        self.draft.clear()
+        self.process_editor.refresh()
+    
+    def import_workload(self):
+        """Load the process grid from a CSV or JSONL workload file"""
+        filename = filedialog.askopenfilename(
+            filetypes=[
+                ("Workload files", "*.csv *.jsonl *.ndjson *.gz"),
+                ("All files", "*.*")
+            ]
+        )
+        if not filename:
+            return
+        
+        try:
+            table = load_workload(filename)
+        except (OSError, WorkloadError) as e:
+            messagebox.showerror("Import Error", f"Failed to import workload:\n{str(e)}")
+            return
+        if not len(table):
+            messagebox.showwarning("Import", "The workload file has no processes.")
+            return
+        
+        self.process_editor.cancel()
+        self.draft.load_table(table)
+        self.num_processes.set(len(table))
+        self.process_editor.refresh()
+        self.status_label.config(text=f"✓ Imported {len(table)} processes", fg='#28A745')
+    
+    def paste_workload(self):
+        """Paste a block of cells from the clipboard at the selected cell"""
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            messagebox.showwarning("Paste", "The clipboard is empty.")
+            return
+        self.process_editor.paste(text)
     
     def toggle_dark_mode(self):
         """No-op: dark mode is always enabled"""
@@ -979,126 +851,176 @@ class SchedulerVisualizerApp:
 
     def validate_inputs(self):
         """Validate all process inputs"""
+        self.process_editor.commit()
         try:
-            processes = []
-            show_priority = "Priority" in self.current_algorithm.get()
-            for i, entries in enumerate(self.process_entries):
-                at = int(entries['at'].get())
-                bt = int(entries['bt'].get())
-                if show_priority and 'priority' in entries:
-                    priority = int(entries['priority'].get()) if entries['priority'].get() else 0
-                else:
-                    priority = 0
-                
-                if at < 0 or bt <= 0:
-                    raise ValueError(f"Process P{i+1}: Times must be non-negative and burst time > 0")
-                
-                process = Process(f"P{i+1}", at, bt, priority)
-                processes.append(process)
-            
-            return True, processes
-        except ValueError as e:
+            table = self.draft.to_table(with_priority="Priority" in self.current_algorithm.get())
+        except DraftError as e:
             messagebox.showerror("Input Error", str(e))
+            self.process_editor.show_row(e.row)
             return False, None
-        except Exception as e:
-            messagebox.showerror("Input Error", "Please fill all fields with valid numbers")
-            return False, None
+        
+        return True, table
     
     def run_simulation(self):
-        """Run the scheduling simulation"""
-        if self.animation_running:
-            messagebox.showwarning("Running", "Animation is already running!")
+        """Start the scheduling simulation on a background worker"""
+        if self.worker is not None and self.worker.running:
+            messagebox.showwarning("Running", "A simulation is already running!")
             return
         
         # Validate inputs
-        valid, processes = self.validate_inputs()
+        valid, table = self.validate_inputs()
         if not valid:
             return
 
-        self.processes = processes
         algorithm = self.current_algorithm.get()
+        time_quantum = self.time_quantum.get()
+        coalesce = not self.per_tick_timeline.get()
+        key = workload_key(algorithm, table, time_quantum, coalesce)
+        
+        self.playback.stop()
+        self.close_trace()
+        # The worker fills the table in as it goes; show_result publishes it once it is done
+        self.table = None
+        self.timeline = []
+        self.result = None
+        
+        # The same workload was run before: no need to schedule it again
+        result = self.result_cache.get(key, table)
+        if result is not None:
+            # Its run, while still kept, shows the ready queue and is resumed from after edits
+            run = self.recent_runs.get(key)
+            if run is not None:
+                self.recent_runs.move_to_end(key)
+                self.last_run = run
+            self.show_result(result, (algorithm, time_quantum, coalesce), run)
+            self.status_label.config(text=f"✓ Simulation completed using {algorithm} (cached)", fg='#28A745')
+            return
         
-        # Run scheduling algorithm
-        try:
-            if algorithm == "FCFS":
-                result_processes, timeline = SchedulingAlgorithm.fcfs(copy.deepcopy(self.processes))
-            elif algorithm == "SJF (Non-preemptive)":
-                result_processes, timeline = SchedulingAlgorithm.sjf_non_preemptive(copy.deepcopy(self.processes))
-            elif algorithm == "SJF (Preemptive)":
-                result_processes, timeline = SchedulingAlgorithm.sjf_preemptive(copy.deepcopy(self.processes))
-            elif algorithm == "Round Robin":
-                result_processes, timeline = SchedulingAlgorithm.round_robin(
-                    copy.deepcopy(self.processes),
-                    self.time_quantum.get()
-                )
-            elif algorithm == "Priority (Non-preemptive)":
-                result_processes, timeline = SchedulingAlgorithm.priority_non_preemptive(copy.deepcopy(self.processes))
-            elif algorithm == "Priority (Preemptive)":
-                result_processes, timeline = SchedulingAlgorithm.priority_preemptive(copy.deepcopy(self.processes))
-            else:
-                messagebox.showerror("Error", "Unknown algorithm selected")
-                return
-            
-            # Update processes with results
-            for original_p in self.processes:
-                for result_p in result_processes:
-                    if original_p.pid == result_p.pid:
-                        original_p.finish_time = result_p.finish_time
-                        original_p.turnaround_time = result_p.turnaround_time
-                        original_p.waiting_time = result_p.waiting_time
-                        break
-            
-            self.timeline = timeline
-            
-            # Update results table
-            self.update_results_table()
-            
-            # Update summary
-            self.update_summary()
-            
-            # Animate Gantt chart
-            self.animate_gantt_chart()
-            
-            # Draw charts
-            self.draw_charts()
-            
-            self.status_label.config(text=f"✓ Simulation completed using {algorithm}", fg='#28A745')
-            
-        except Exception as e:
-            messagebox.showerror("Simulation Error", f"An error occurred: {str(e)}")
-            self.status_label.config(text=f"✗ Simulation failed", fg='#DC3545')
+        # An edit of the last run's workload only reschedules from the first edited process
+        previous = self.last_run
+        if previous is not None and (previous.algorithm, previous.time_quantum, previous.coalesce) != (algorithm, time_quantum, coalesce):
+            previous = None
+        self.last_run = None
+        self.shown_run = None
+        # The worker rewrites the run it resumes, so it no longer stands for its old workload
+        for old_key, kept in list(self.recent_runs.items()):
+            if kept is previous:
+                del self.recent_runs[old_key]
+        
+        # Segments are shown as they arrive from the worker
+        self.worker = SimulationWorker(algorithm, table, time_quantum, coalesce=coalesce, previous=previous).start()
+        self.worker_key = key
+        self.gantt_view.set_timeline(self.worker.timeline)
+        
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.status_label.config(text=f"⏳ Simulating {algorithm}...", fg='#0078D4')
+        self.root.after(POLL_MS, self.poll_simulation, self.worker)
     
-    def update_results_table(self):
-        """Update the results table with process data"""
-        # Clear existing data
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        show_priority = "Priority" in self.current_algorithm.get()
-        # Insert new data
-        for process in self.processes:
-            self.results_tree.insert('', tk.END, values=(
-                process.pid,
-                process.arrival_time,
-                process.burst_time,
-                process.priority if show_priority else "--",
-                process.finish_time,
-                process.turnaround_time,
-                process.waiting_time
-            ))
+    def poll_simulation(self, worker):
+        """Show the progress of the running simulation; finish up once it ends"""
+        if worker is not self.worker:  # Cancelled and replaced or discarded
+            return
+        
+        running = worker.poll()
+        self.gantt_view.reveal(len(worker.timeline))
+        if running:
+            self.status_label.config(
+                text=f"⏳ Simulating {worker.algorithm}: {worker.finished}/{worker.total} processes finished",
+                fg='#0078D4'
+            )
+            self.root.after(POLL_MS, self.poll_simulation, worker)
+            return
+        
+        self.worker = None
+        self.cancel_btn.config(state=tk.DISABLED)
+        if worker.state == 'cancelled':
+            self.status_label.config(
+                text=f"✗ Simulation cancelled after {worker.finished} of {worker.total} processes",
+                fg='#DC3545'
+            )
+            return
+        if worker.state == 'failed':
+            messagebox.showerror("Simulation Error", f"An error occurred: {str(worker.error)}")
+            self.status_label.config(text="✗ Simulation failed", fg='#DC3545')
+            return
+        
+        self.result_cache.put(self.worker_key, worker.result, worker.algorithm,
+                              worker.time_quantum, worker.coalesce)
+        self.last_run = worker.checkpointed
+        self.recent_runs[self.worker_key] = worker.checkpointed
+        self.recent_runs.move_to_end(self.worker_key)
+        if len(self.recent_runs) > RECENT_RUNS:
+            self.recent_runs.popitem(last=False)
+        self.show_result(worker.result, (worker.algorithm, worker.time_quantum, worker.coalesce), worker.checkpointed)
+        status = f"✓ Simulation completed using {worker.algorithm}"
+        resumed_from = worker.checkpointed.resumed_from
+        if resumed_from is not None and resumed_from.time > 0:
+            status += f" (rescheduled from t = {resumed_from.time})"
+        self.status_label.config(text=status, fg='#28A745')
+    
+    def show_result(self, result, settings, run=None):
+        """Show a finished run in the results table, summary, Gantt chart and charts
+        
+        ``settings`` is the (algorithm, time quantum, coalesced) it was run
+        with and ``run`` its CheckpointedRun, when one is kept.
+        """
+        self.run_settings = settings
+        self.shown_run = run
+        self.table = result.table
+        self.timeline = result.timeline
+        self.result = result
+        
+        # Update results table
+        self.update_results_table(result.table)
+        
+        # Update summary
+        self.update_summary()
+        
+        # Animate Gantt chart
+        self.animate_gantt_chart()
+        
+        # Draw charts
+        self.draw_charts()
+    
+    def cancel_simulation(self):
+        """Stop the running simulation, if any"""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_btn.config(state=tk.DISABLED)
+    
+    def discard_simulation(self):
+        """Cancel the running simulation and stop following it"""
+        self.cancel_simulation()
+        self.worker = None
+    
+    def update_results_table(self, table):
+        """Show the results of ``table`` in the results table"""
+        self.filter_entry.delete(0, tk.END)
+        self.results_view.set_table(table, show_priority="Priority" in self.run_settings[0])
+        self.results_count_label.config(text=f"{len(table)} processes", fg=self.fg_color)
+    
+    def apply_results_filter(self):
+        """Filter the results table by the expression in the filter box"""
+        try:
+            count = self.results_view.set_filter(self.filter_entry.get())
+        except ValueError as e:
+            self.results_count_label.config(text=str(e), fg='#DC3545')
+            return
+        self.results_count_label.config(text=f"{count} of {len(self.results_view)} processes", fg=self.fg_color)
     
     def update_summary(self):
         """Update summary statistics"""
-        if not self.processes:
+        table = self.table
+        if not table:
             return
         
-        avg_tat = sum(p.turnaround_time for p in self.processes) / len(self.processes)
-        avg_wt = sum(p.waiting_time for p in self.processes) / len(self.processes)
+        avg_tat = sum(table.tat) / len(table)
+        avg_wt = sum(table.wt) / len(table)
         
         # Calculate throughput
         if self.timeline:
-            total_time = max(t['end'] for t in self.timeline)
-            throughput = len(self.processes) / total_time if total_time > 0 else 0
+            total_time = self.timeline.makespan()
+            throughput = len(table) / total_time if total_time > 0 else 0
         else:
             throughput = 0
         
@@ -1107,192 +1029,113 @@ class SchedulerVisualizerApp:
         self.throughput_label.config(text=f"Throughput: {throughput:.3f} processes/unit")
     
     def animate_gantt_chart(self):
-        """Animate the Gantt chart"""
+        """Play the Gantt chart from time 0"""
         if not self.timeline:
             return
 
-        self.animation_running = True
         self.gantt_canvas.config(bg='#30394c')
-        self.gantt_canvas.delete("all")
-
-        # Calculate dimensions
-        canvas_width = self.gantt_canvas.winfo_width()
-        canvas_height = self.gantt_canvas.winfo_height()
-
-        if canvas_width <= 1:  # Canvas not yet rendered
-            canvas_width = 800
-            canvas_height = 200
-
-        margin = 50
-        self.pixels_per_unit = 20  # Fixed pixels per time unit to prevent shrinking
-
-        # Get max time
-        max_time = max(t['end'] for t in self.timeline) if self.timeline else 0
-        self.required_width = margin + max_time * self.pixels_per_unit + margin
-
-        # Set scrollregion to full chart width to allow scrolling
-        self.gantt_canvas.configure(scrollregion=(0, 0, self.required_width, canvas_height))
-
-        # Always hide horizontal scrollbar
-        self.gantt_hsb.pack_forget()
-
-        # Draw axes
-        self.gantt_canvas.create_line(
-            margin, canvas_height - margin,
-            self.required_width - margin, canvas_height - margin,
-            width=2, fill='white'
-        )
-
-        # Draw time labels
-        for i in range(0, max_time + 1, max(1, max_time // 10)):
-            x = margin + i * self.pixels_per_unit
-            self.gantt_canvas.create_line(
-                x, canvas_height - margin,
-                x, canvas_height - margin + 10,
-                width=2, fill='white'
-            )
-            self.gantt_canvas.create_text(
-                x, canvas_height - margin + 20,
-                text=str(i), font=('Arial', 9),
-                fill='white'
-            )
-
-        # Animate timeline
-        self.current_animation_index = 0
-        self.animate_next_block()
+        self.playback.load(self.timeline)
+        self.playback.play()
+    
+    def update_playback_speed(self):
+        """Apply the speed multiplier picked in the combobox"""
+        self.playback.speed = int(self.playback_speed.get().rstrip("×"))
     
-    def animate_next_block(self):
-        """Animate next block in timeline"""
-        if self.current_animation_index >= len(self.timeline):
-            self.animation_running = False
+    def seek_playback(self, value):
+        """Seek bar callback; ignores the moves made by update_playback_controls"""
+        if not self._syncing_seek:
+            self.playback.seek(float(value))
+    
+    def update_playback_controls(self):
+        """Show the playback state on the play button, seek bar and time label"""
+        end = self.playback.end_time()
+        self.play_btn.config(text="⏸ Pause" if self.playback.playing else "▶ Play")
+        self._syncing_seek = True
+        try:
+            self.seek_scale.config(to=end)
+            self.seek_scale.set(int(self.playback.time))
+        finally:
+            self._syncing_seek = False
+        self.time_label.config(text=f"t = {int(self.playback.time)} / {end}")
+        self.update_queue_state()
+    
+    def update_queue_state(self):
+        """Show what the scheduler holds at the seek bar position, while playback is paused"""
+        run = self.shown_run
+        if self.playback.timeline is None or self.result is None:
+            self.queue_label.config(text="")
             return
-
-        block = self.timeline[self.current_animation_index]
-
-        canvas_height = self.gantt_canvas.winfo_height()
-
-        if canvas_height <= 1:
-            canvas_height = 200
-
-        margin = 50
-        chart_height = canvas_height - 2 * margin
-
-        # Calculate block position using fixed pixels_per_unit
-        x1 = margin + block['start'] * self.pixels_per_unit
-        x2 = margin + block['end'] * self.pixels_per_unit
-        y1 = margin + chart_height * 0.2
-        y2 = margin + chart_height * 0.8
-
-        # Draw block
-        rect_id = self.gantt_canvas.create_rectangle(
-            x1, y1, x2, y2,
-            fill=block['color'],
-            outline='black',
-            width=2
-        )
-
-        # Add process label
-        label_color = 'white'
-        text_id = self.gantt_canvas.create_text(
-            (x1 + x2) / 2, (y1 + y2) / 2,
-            text=block['pid'],
-            font=('Arial', 12, 'bold'),
-            fill=label_color
-        )
-
-        # Add time labels
-        self.gantt_canvas.create_text(
-            x1, y1 - 10,
-            text=str(block['start']),
-            font=('Arial', 9),
-            fill='white'
+        if run is None:
+            self.queue_label.config(text="Ready queue: not recorded for this run")
+            return
+        if self.playback.playing:
+            self.queue_label.config(text="Ready queue: pause or drag the seek bar to inspect it")
+            return
+        
+        # Rebuilt from the nearest checkpoint, so this costs the same anywhere in the run
+        state = run.state_at(int(self.playback.time), limit=QUEUE_SHOWN)
+        table = self.table  # Same columns as run.table; the pids may have been renamed since
+        if state.running is None:
+            running = "idle"
+        else:
+            running = f"{table.pid(state.running)} ({state.remaining} left)"
+        ready = ", ".join(f"{table.pid(index)} ({remaining})" for index, remaining in state.ready)
+        if state.waiting > len(state.ready):
+            ready += f", … +{state.waiting - len(state.ready)} more"
+        self.queue_label.config(
+            text=f"CPU: {running}   Ready queue: {ready or 'empty'}   Finished: {state.finished}/{len(table)}"
         )
-
-        if self.current_animation_index == len(self.timeline) - 1 or \
-           self.timeline[self.current_animation_index + 1]['start'] != block['end']:
-            self.gantt_canvas.create_text(
-                x2, y1 - 10,
-                text=str(block['end']),
-                font=('Arial', 9),
-                fill='white'
-            )
-
-        self.current_animation_index += 1
-
-        # Schedule next animation
-        self.root.after(self.animation_speed.get(), self.animate_next_block)
     
     def draw_charts(self):
         """Draw waiting time and turnaround time charts"""
-        if not self.processes:
+        table = self.table
+        if not table:
             return
         
-        self.fig.clear()
-        
-        # Create subplots
-        ax1 = self.fig.add_subplot(121)
-        ax2 = self.fig.add_subplot(122)
-        
-        # Set dark background for charts
-        self.fig.patch.set_facecolor(self.panel_bg)
-        ax1.set_facecolor('#2D2D2D')
-        ax2.set_facecolor('#2D2D2D')
-        
-        # Extract data
-        pids = [p.pid for p in self.processes]
-        waiting_times = [p.waiting_time for p in self.processes]
-        turnaround_times = [p.turnaround_time for p in self.processes]
-        colors = [p.color for p in self.processes]
-        
-        # Waiting Time Chart
-        bars1 = ax1.bar(pids, waiting_times, color=colors, edgecolor='white', linewidth=1.5)
-        ax1.set_xlabel('Process ID', fontsize=10, fontweight='bold', color='white')
-        ax1.set_ylabel('Waiting Time', fontsize=10, fontweight='bold', color='white')
-        ax1.set_title('Waiting Time per Process', fontsize=12, fontweight='bold', color='white')
-        ax1.grid(axis='y', alpha=0.3, color='white')
-        ax1.tick_params(axis='both', colors='white')
-        
-        # Add value labels on bars
-        for i, (pid, wt) in enumerate(zip(pids, waiting_times)):
-            ax1.text(i, wt + 0.1, str(wt), ha='center', va='bottom', fontsize=9, fontweight='bold', color='white')
-        
-        # Turnaround Time Chart
-        bars2 = ax2.bar(pids, turnaround_times, color=colors, edgecolor='white', linewidth=1.5)
-        ax2.set_xlabel('Process ID', fontsize=10, fontweight='bold', color='white')
-        ax2.set_ylabel('Turnaround Time', fontsize=10, fontweight='bold', color='white')
-        ax2.set_title('Turnaround Time per Process', fontsize=12, fontweight='bold', color='white')
-        ax2.grid(axis='y', alpha=0.3, color='white')
-        ax2.tick_params(axis='both', colors='white')
-        
-        # Add value labels on bars
-        for i, (pid, tat) in enumerate(zip(pids, turnaround_times)):
-            ax2.text(i, tat + 0.1, str(tat), ha='center', va='bottom', fontsize=9, fontweight='bold', color='white')
-        
-        self.fig.tight_layout()
-        self.chart_canvas.draw()
+        # Labels and colors are per bar; the histograms of large runs need neither
+        rows = range(len(table))
+        bars = len(table) <= AGGREGATE_THRESHOLD
+        self.ensure_chart_canvas()
+        self.charts.update(
+            [table.pid(i) for i in rows] if bars else rows,
+            table.wt,
+            table.tat,
+            [table.color(i) for i in rows] if bars else None
+        )
     
     def export_results(self):
-        """Export results to CSV file"""
-        if not self.processes:
+        """Export results to CSV file, or the whole run to a binary trace"""
+        if not self.table:
             messagebox.showwarning("No Data", "No results to export. Run a simulation first.")
             return
         
         # Ask for save location
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=[("CSV files", "*.csv"), ("Binary trace", f"*{TRACE_SUFFIX}"), ("All files", "*.*")],
             initialfile=f"scheduling_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         )
         
         if not filename:
             return
         
+        if filename.endswith(TRACE_SUFFIX):
+            try:
+                algorithm, time_quantum, coalesced = self.run_settings
+                write_trace(
+                    filename, self.result or self.trace.result(), algorithm, time_quantum, coalesced=coalesced
+                )
+                messagebox.showinfo("Export Successful", f"Trace exported to:\n{filename}")
+            except Exception as e:
+                messagebox.showerror("Export Error", f"Failed to export trace:\n{str(e)}")
+            return
+        
         try:
             with open(filename, 'w', newline='') as csvfile:
                 writer = csv.writer(csvfile)
                 
                 # Write header
-                show_priority = "Priority" in self.current_algorithm.get()
+                show_priority = "Priority" in self.run_settings[0]
                 writer.writerow([
                     'Process ID', 'Arrival Time', 'Burst Time', 'Priority' if show_priority else '',
                     'Finish Time', 'Turnaround Time', 'Waiting Time'
@@ -1302,35 +1145,36 @@ class SchedulerVisualizerApp:
                 ])
                 
                 # Write process data
-                for process in self.processes:
+                table = self.table
+                for i in range(len(table)):
                     if show_priority:
                         writer.writerow([
-                            process.pid,
-                            process.arrival_time,
-                            process.burst_time,
-                            process.priority,
-                            process.finish_time,
-                            process.turnaround_time,
-                            process.waiting_time
+                            table.pid(i),
+                            table.arrival[i],
+                            table.burst[i],
+                            table.priority[i],
+                            table.finish[i],
+                            table.tat[i],
+                            table.wt[i]
                         ])
                     else:
                         writer.writerow([
-                            process.pid,
-                            process.arrival_time,
-                            process.burst_time,
-                            process.finish_time,
-                            process.turnaround_time,
-                            process.waiting_time
+                            table.pid(i),
+                            table.arrival[i],
+                            table.burst[i],
+                            table.finish[i],
+                            table.tat[i],
+                            table.wt[i]
                         ])
                 
                 # Write summary
                 writer.writerow([])
                 writer.writerow(['Summary Statistics'])
-                avg_tat = sum(p.turnaround_time for p in self.processes) / len(self.processes)
-                avg_wt = sum(p.waiting_time for p in self.processes) / len(self.processes)
+                avg_tat = sum(table.tat) / len(table)
+                avg_wt = sum(table.wt) / len(table)
                 writer.writerow(['Average Turnaround Time', f'{avg_tat:.2f}'])
                 writer.writerow(['Average Waiting Time', f'{avg_wt:.2f}'])
-                writer.writerow(['Algorithm', self.current_algorithm.get()])
+                writer.writerow(['Algorithm', self.run_settings[0]])
                 writer.writerow(['Export Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
             
             messagebox.showinfo("Export Successful", f"Results exported to:\n{filename}")
@@ -1338,9 +1182,60 @@ class SchedulerVisualizerApp:
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export results:\n{str(e)}")
 
+    def open_trace(self):
+        """Show a saved binary trace without re-simulating it"""
+        filename = filedialog.askopenfilename(
+            filetypes=[("Binary trace", f"*{TRACE_SUFFIX}"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        try:
+            trace = TraceFile(filename)
+        except (OSError, TraceError) as e:
+            messagebox.showerror("Open Error", f"Failed to open trace:\n{str(e)}")
+            return
+        
+        # Segments stay in the file and are paged in as the Gantt view needs them
+        self.discard_simulation()
+        self.playback.load(trace)
+        self.playback.jump_to_end()
+        self.close_trace()
+        self.trace = trace
+        self.timeline = trace
+        self.result = None
+        
+        # The table reads the mapped columns too; only the visible rows are touched
+        table = trace.table(copy=False)
+        self.table = table
+        self.run_settings = (trace.algorithm, trace.time_quantum, trace.coalesced)
+        self.shown_run = None
+        if trace.algorithm in SchedulingAlgorithm.ALGORITHMS:
+            self.current_algorithm.set(trace.algorithm)
+        if trace.algorithm == "Round Robin":
+            self.time_quantum.set(trace.time_quantum)
+        
+        self.update_results_table(table)
+        self.update_summary()
+        self.draw_charts()
+        self.gantt_view.fit()
+        
+        self.status_label.config(
+            text=f"✓ Opened trace: {trace.algorithm}, {trace.process_count} processes, {len(trace)} segments",
+            fg='#28A745'
+        )
+    
+    def close_trace(self):
+        """Release the trace file opened by open_trace, if any"""
+        if self.trace is not None:
+            if isinstance(self.results_view.table, TraceTable):  # Its rows are read from the mapping
+                self.results_view.clear()
+            self.trace.close()
+            self.trace = None
+    
     def show_process(self):
         """Show step-by-step explanation of the scheduling process"""
-        if not self.processes or not self.timeline:
+        if not self.table or not self.timeline:
             messagebox.showwarning("No Data", "Run a simulation first to see process.")
             return
 
@@ -1360,6 +1255,27 @@ class SchedulerVisualizerApp:
         )
         title_label.pack(pady=10)
 
+        # Navigation: pages, jump to a time, search
+        nav_frame = tk.Frame(explanation_window, bg=self.bg_color)
+        nav_frame.pack(fill=tk.X, padx=20)
+
+        nav_button = dict(font=('Arial', 10, 'bold'), bg=self.button_bg, fg='white', relief=tk.FLAT, cursor='hand2')
+        prev_btn = tk.Button(nav_frame, text="◀ Prev", **nav_button)
+        prev_btn.pack(side=tk.LEFT)
+        next_btn = tk.Button(nav_frame, text="Next ▶", **nav_button)
+        next_btn.pack(side=tk.LEFT, padx=5)
+
+        tk.Label(nav_frame, text="Time:", font=('Arial', 10), bg=self.bg_color, fg=self.fg_color).pack(side=tk.LEFT, padx=(10, 0))
+        time_entry = tk.Entry(nav_frame, font=('Arial', 10), bg=self.input_bg, fg='white', insertbackground='white', width=8)
+        time_entry.pack(side=tk.LEFT, padx=5)
+
+        tk.Label(nav_frame, text="Find:", font=('Arial', 10), bg=self.bg_color, fg=self.fg_color).pack(side=tk.LEFT, padx=(10, 0))
+        find_entry = tk.Entry(nav_frame, font=('Arial', 10), bg=self.input_bg, fg='white', insertbackground='white', width=12)
+        find_entry.pack(side=tk.LEFT, padx=5)
+
+        position_label = tk.Label(nav_frame, text="", font=('Arial', 10), bg=self.bg_color, fg=self.fg_color)
+        position_label.pack(side=tk.RIGHT)
+
         # Text area with scrollbar
         text_frame = tk.Frame(explanation_window, bg=self.bg_color)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -1379,10 +1295,27 @@ class SchedulerVisualizerApp:
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Generate explanation
-        explanation = self.generate_explanation()
-        text_widget.insert(tk.END, explanation)
-        text_widget.config(state=tk.DISABLED)
+        # Generate explanation; only the page being read is formatted
+        def show_position():
+            position_label.config(
+                text=f"{view.first + 1}–{view.last() + 1} of {len(view)}", fg=self.fg_color
+            )
+
+        def jump_to_time(event=None):
+            try:
+                view.jump_to_time(int(time_entry.get()))
+            except ValueError:
+                position_label.config(text="Time must be a whole number", fg='#DC3545')
+
+        def find_next(event=None):
+            if find_entry.get().strip() and not view.find_next(find_entry.get()):
+                position_label.config(text=f"'{find_entry.get().strip()}' not found", fg='#DC3545')
+
+        view = ExplanationView(text_widget, self.generate_explanation(), on_change=show_position)
+        prev_btn.config(command=view.previous_page)
+        next_btn.config(command=view.next_page)
+        time_entry.bind('<Return>', jump_to_time)
+        find_entry.bind('<Return>', find_next)
 
         # Close button
         close_btn = tk.Button(
@@ -1399,78 +1332,24 @@ class SchedulerVisualizerApp:
         close_btn.pack(pady=10)
 
     def generate_explanation(self):
-        """Generate the step-by-step explanation text"""
-        explanation = f"Scheduling Algorithm: {self.current_algorithm.get()}\n\n"
-
-        # Get all arrival events
-        arrivals = []
-        for process in self.processes:
-            arrivals.append({
-                'time': process.arrival_time,
-                'type': 'arrival',
-                'pid': process.pid
-            })
-
-        # Get all execution events from timeline
-        executions = []
-        for block in self.timeline:
-            executions.append({
-                'time': block['start'],
-                'type': 'start',
-                'pid': block['pid']
-            })
-            executions.append({
-                'time': block['end'],
-                'type': 'end',
-                'pid': block['pid']
-            })
-
-        # Combine and sort all events
-        all_events = arrivals + executions
-        all_events.sort(key=lambda x: (x['time'], 0 if x['type'] == 'arrival' else 1 if x['type'] == 'start' else 2))
-
-        # Generate explanation text
-        current_time = 0
-        for event in all_events:
-            if event['time'] > current_time:
-                explanation += f"\n"
-            explanation += f"Time {event['time']}: "
-
-            if event['type'] == 'arrival':
-                explanation += f"Process {event['pid']} arrived\n"
-            elif event['type'] == 'start':
-                explanation += f"Process {event['pid']} started executing\n"
-            elif event['type'] == 'end':
-                explanation += f"Process {event['pid']} finished executing\n"
-
-            current_time = event['time']
-
-        # Add final statistics
-        explanation += f"\nFinal Results:\n"
-        for process in self.processes:
-            explanation += f"Process {process.pid}: Arrival={process.arrival_time}, Burst={process.burst_time}, "
-            explanation += f"Start={process.start_time}, Finish={process.finish_time}, "
-            explanation += f"Turnaround={process.turnaround_time}, Waiting={process.waiting_time}\n"
-
-        return explanation
+        """Step-by-step explanation of the run shown, produced page by page as it is read"""
+        return Explanation(self.run_settings[0], self.table, self.timeline)
 
     def restart_simulation(self):
         """Restart the simulation"""
         # Clear Gantt chart
-        self.gantt_canvas.delete("all")
-
-        # Reset scrollbar
-        self.gantt_hsb.pack_forget()
-        self.gantt_canvas.configure(scrollregion=None)
-        self.gantt_canvas.unbind("<MouseWheel>")
+        self.discard_simulation()
+        self.playback.clear()
+        self.close_trace()
 
         # Clear results table
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_view.clear()
+        self.filter_entry.delete(0, tk.END)
+        self.results_count_label.config(text="")
 
         # Clear charts
-        self.fig.clear()
-        self.chart_canvas.draw()
+        if self.charts is not None:
+            self.charts.clear()
 
         # Reset summary
         self.avg_tat_label.config(text="Average Turnaround Time: --")
@@ -1487,9 +1366,11 @@ class SchedulerVisualizerApp:
         self.clear_inputs()
 
         # Reset variables
-        self.processes = []
+        self.table = None
         self.timeline = []
-        self.animation_running = False
+        self.result = None
+        self.run_settings = None
+        self.shown_run = None
 
 def main():
     """Main function to run the application"""
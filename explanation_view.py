@@ -0,0 +1,90 @@
+import tkinter as tk
+
+# Items (events or result lines) shown on one page
+PAGE_SIZE = 200
+
+FOUND_BG = '#0078D4'
+
+class ExplanationView:
+    """Pages of an Explanation in a read-only Text widget
+    
+    Only the page being read is formatted and inserted, so opening the
+    explanation of a long run is as quick as that of a short one. A page
+    starts at any item, so jumping to a time or to a search match shows the
+    page that begins right there. ``on_change`` is called after every page
+    change, for the caller to update its position label.
+    """
+    def __init__(self, text, explanation, on_change=None):
+        self.text = text
+        self.explanation = explanation
+        self.on_change = on_change
+        self.first = 0
+        self.found = None
+        self.search = None
+        text.tag_configure('found', background=FOUND_BG)
+        text.bind('<Prior>', lambda e: self._page_by(-1))
+        text.bind('<Next>', lambda e: self._page_by(1))
+        self.show(0)
+    
+    def __len__(self):
+        return len(self.explanation)
+    
+    def show(self, first):
+        """Show the page starting at item ``first``"""
+        self.first = max(0, min(int(first), len(self) - 1))
+        lines = self.explanation.lines(self.first, PAGE_SIZE)
+        text = self.text
+        text.config(state=tk.NORMAL)
+        text.delete('1.0', tk.END)
+        text.insert(tk.END, "\n".join(line for _, line in lines))
+        for number, (position, _) in enumerate(lines, 1):
+            if position is not None and position == self.found:
+                text.tag_add('found', f'{number}.0', f'{number}.end')
+                text.see(f'{number}.0')
+        text.config(state=tk.DISABLED)
+        if self.on_change is not None:
+            self.on_change()
+    
+    def last(self):
+        """Position of the last item on the page"""
+        return min(self.first + PAGE_SIZE, len(self)) - 1
+    
+    def next_page(self):
+        """Show the page after this one"""
+        if self.first + PAGE_SIZE < len(self):
+            self.show(self.first + PAGE_SIZE)
+    
+    def previous_page(self):
+        """Show the page before this one"""
+        if self.first > 0:
+            self.show(max(0, self.first - PAGE_SIZE))
+    
+    def _page_by(self, pages):
+        if pages > 0:
+            self.next_page()
+        else:
+            self.previous_page()
+        return "break"
+    
+    def jump_to_time(self, time):
+        """Show the page starting at the first event at or after ``time``"""
+        self.found = None
+        self.show(self.explanation.position_at(time))
+    
+    def find_next(self, text):
+        """Show the next item mentioning ``text``; False if there is none
+        
+        A new search starts at the page being read, a repeated one after
+        its last match.
+        """
+        if text == self.search and self.found is not None:
+            start = self.found + 1
+        else:
+            start = self.first
+        self.search = text
+        position = self.explanation.find(text, start)
+        if position is None:
+            return False
+        self.found = position
+        self.show(position)
+        return True
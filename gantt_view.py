@@ -0,0 +1,403 @@
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from math import ceil, floor, log10
+from operator import sub
+
+# Scale a timeline is first shown at, the same as the old fixed-width chart
+DEFAULT_PIXELS_PER_UNIT = 20
+MAX_PIXELS_PER_UNIT = 400
+
+# Below this many pixels per segment (on average) the window is drawn as density bars
+MIN_BLOCK_PIXELS = 3
+DENSITY_COLUMN_PIXELS = 2
+
+MARGIN = 50
+ZOOM_STEP = 1.25
+WHEEL_PAN_PIXELS = 60
+MIN_TICK_PIXELS = 80
+
+# Playback: simulated time units per second at 1x, and the frame interval
+BASE_UNITS_PER_SECOND = 5
+PLAYBACK_SPEEDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+FRAME_MS = 16
+
+def nice_step(minimum):
+    """Smallest 1, 2 or 5 times a power of ten that is at least ``minimum`` (and at least 1)"""
+    if minimum <= 1:
+        return 1
+    power = 10 ** floor(log10(minimum))
+    for factor in (1, 2, 5, 10):
+        if factor * power >= minimum:
+            return factor * power
+
+class GanttView:
+    """Viewport-virtualised Gantt chart drawn on a Tk canvas
+    
+    Only the segments inside the visible time window become canvas items.
+    The window is found by binary search over the timeline's start and end
+    columns, which are sorted because segments are appended in time order,
+    so the number of items depends on the canvas width rather than on the
+    trace length. When segments average fewer than MIN_BLOCK_PIXELS the
+    window is drawn as density bars instead: one bar per couple of pixels,
+    as tall as the fraction of that slice the CPU was busy (from a prefix
+    sum of segment lengths) and colored by the process running at its
+    middle.
+    
+    The mouse wheel pans, Ctrl+wheel zooms around the pointer, dragging pans
+    and a double click fits the whole run. Redraws are coalesced with
+    after_idle. Any Timeline or TraceFile can be shown.
+    """
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.timeline = None
+        self.visible_rows = 0
+        self.pixels_per_unit = DEFAULT_PIXELS_PER_UNIT
+        self.view_start = 0.0
+        self._busy_before = None
+        self._redraw_pending = False
+        self._drag_x = None
+        
+        canvas.bind('<Configure>', lambda e: self.schedule_redraw())
+        canvas.bind('<MouseWheel>', lambda e: self._on_wheel(e, e.delta))
+        canvas.bind('<Button-4>', lambda e: self._on_wheel(e, 120))  # Linux
+        canvas.bind('<Button-5>', lambda e: self._on_wheel(e, -120))
+        canvas.bind('<ButtonPress-1>', self._on_press)
+        canvas.bind('<B1-Motion>', self._on_drag)
+        canvas.bind('<Double-Button-1>', lambda e: self.fit())
+    
+    def set_timeline(self, timeline, visible_rows=None):
+        """Show a timeline from time 0 at the default scale
+        
+        ``visible_rows`` limits drawing to the first segments, for playback;
+        by default all of them are shown.
+        """
+        self.timeline = timeline
+        self.visible_rows = len(timeline) if visible_rows is None else visible_rows
+        self.pixels_per_unit = DEFAULT_PIXELS_PER_UNIT
+        self.view_start = 0.0
+        self._busy_before = None
+        self.schedule_redraw()
+    
+    def clear(self):
+        """Forget the timeline and empty the canvas"""
+        self.timeline = None
+        self.visible_rows = 0
+        self._busy_before = None
+        self.canvas.delete("all")
+    
+    def reveal(self, rows, follow=True):
+        """Show the first ``rows`` segments, scrolling to the newest one if ``follow``"""
+        self.visible_rows = rows
+        if follow and rows:
+            end = self.timeline.ends[rows - 1]
+            start, finish = self.time_range()
+            if end > finish or end < start:
+                self.view_start = max(0.0, end - 0.9 * (finish - start))
+        self.schedule_redraw()
+    
+    def schedule_redraw(self):
+        """Redraw once the event loop is idle, however many changes come first"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.canvas.after_idle(self.flush)
+    
+    def flush(self):
+        """Carry out a scheduled redraw now rather than when the event loop is idle"""
+        if self._redraw_pending:
+            self.redraw()
+    
+    def plot_width(self):
+        """Width in pixels of the area between the margins"""
+        width = self.canvas.winfo_width()
+        if width <= 1:  # Canvas not yet rendered
+            width = 800
+        return max(1, width - 2 * MARGIN)
+    
+    def end_time(self):
+        """End of the last segment, or 0 without a timeline"""
+        if self.timeline is None or not len(self.timeline):
+            return 0
+        return self.timeline.ends[len(self.timeline) - 1]
+    
+    def time_range(self):
+        """(first, last) time unit inside the viewport"""
+        return self.view_start, self.view_start + self.plot_width() / self.pixels_per_unit
+    
+    def fit(self):
+        """Zoom so that the whole run fills the viewport"""
+        end = self.end_time()
+        if end > 0:
+            self.pixels_per_unit = min(MAX_PIXELS_PER_UNIT, self.plot_width() / end)
+            self.view_start = 0.0
+            self.schedule_redraw()
+    
+    def zoom(self, factor, anchor_x=None):
+        """Multiply the scale by ``factor``, keeping the time under ``anchor_x`` in place"""
+        if anchor_x is None:
+            anchor_x = MARGIN + self.plot_width() / 2
+        anchor_time = self.view_start + (anchor_x - MARGIN) / self.pixels_per_unit
+        
+        # Never zoom out further than the whole run fitting twice over
+        smallest = min(DEFAULT_PIXELS_PER_UNIT, self.plot_width() / max(1, 2 * self.end_time()))
+        self.pixels_per_unit = min(MAX_PIXELS_PER_UNIT, max(smallest, self.pixels_per_unit * factor))
+        self.view_start = anchor_time - (anchor_x - MARGIN) / self.pixels_per_unit
+        self._clamp()
+        self.schedule_redraw()
+    
+    def pan(self, pixels):
+        """Scroll the viewport by ``pixels`` (positive moves later in time)"""
+        self.view_start += pixels / self.pixels_per_unit
+        self._clamp()
+        self.schedule_redraw()
+    
+    def _clamp(self):
+        span = self.plot_width() / self.pixels_per_unit
+        self.view_start = max(0.0, min(self.view_start, max(0.0, self.end_time() - span / 2)))
+    
+    def _on_wheel(self, event, delta):
+        if event.state & 0x4:  # Control held
+            self.zoom(ZOOM_STEP ** (delta / 120), event.x)
+        else:
+            self.pan(-delta / 120 * WHEEL_PAN_PIXELS)
+    
+    def _on_press(self, event):
+        self._drag_x = event.x
+    
+    def _on_drag(self, event):
+        if self._drag_x is not None:
+            self.pan(self._drag_x - event.x)
+            self._drag_x = event.x
+    
+    def rows_in(self, start, end):
+        """Rows of the visible segments overlapping [start, end), as a range"""
+        first = bisect_right(self.timeline.ends, start, 0, self.visible_rows)
+        last = bisect_left(self.timeline.starts, end, first, self.visible_rows)
+        return range(first, max(first, last))
+    
+    def busy_until(self, t):
+        """CPU time spent on segments before time ``t``"""
+        timeline = self.timeline
+        if self._busy_before is None:
+            self._busy_before = array('q', accumulate(map(sub, timeline.ends, timeline.starts), initial=0))
+        elif len(self._busy_before) <= len(timeline):
+            # The timeline grew (a run still in progress): extend the prefix sums
+            known = len(self._busy_before) - 1
+            grown = accumulate(map(sub, timeline.ends[known:], timeline.starts[known:]), initial=self._busy_before[-1])
+            next(grown)
+            self._busy_before.extend(grown)
+        
+        row = bisect_right(self.timeline.ends, t)
+        busy = self._busy_before[row]
+        if row < len(self.timeline) and self.timeline.starts[row] < t:
+            busy += t - self.timeline.starts[row]
+        return busy
+    
+    def redraw(self):
+        """Draw the axis and the segments inside the viewport"""
+        self._redraw_pending = False
+        self.canvas.delete("all")
+        if self.timeline is None:
+            return
+        
+        canvas_height = self.canvas.winfo_height()
+        if canvas_height <= 1:
+            canvas_height = 200
+        chart_height = canvas_height - 2 * MARGIN
+        y1 = MARGIN + chart_height * 0.2
+        y2 = MARGIN + chart_height * 0.8
+        
+        start, end = self.time_range()
+        self._draw_axis(start, end, canvas_height - MARGIN)
+        
+        rows = self.rows_in(start, end)
+        if len(rows) * MIN_BLOCK_PIXELS > self.plot_width():
+            self._draw_density(start, end, y1, y2)
+        else:
+            self._draw_blocks(rows, y1, y2)
+    
+    def _x(self, t):
+        return MARGIN + (t - self.view_start) * self.pixels_per_unit
+    
+    def _draw_axis(self, start, end, axis_y):
+        self.canvas.create_line(
+            self._x(max(start, 0)), axis_y,
+            self._x(min(end, max(self.end_time(), start))), axis_y,
+            width=2, fill='white'
+        )
+        
+        step = nice_step(MIN_TICK_PIXELS / self.pixels_per_unit)
+        tick = ceil(start / step) * step
+        while tick <= min(end, self.end_time()):
+            x = self._x(tick)
+            self.canvas.create_line(x, axis_y, x, axis_y + 10, width=2, fill='white')
+            self.canvas.create_text(x, axis_y + 20, text=str(tick), font=('Arial', 9), fill='white')
+            tick += step
+    
+    def _draw_blocks(self, rows, y1, y2):
+        timeline = self.timeline
+        processes = timeline.processes
+        for row in rows:
+            index = timeline.process_index[row]
+            block_start, block_end = timeline.starts[row], timeline.ends[row]
+            x1, x2 = self._x(block_start), self._x(block_end)
+            pid = processes.pid(index)
+            
+            self.canvas.create_rectangle(
+                x1, y1, x2, y2,
+                fill=processes.color(index),
+                outline='black',
+                width=2 if x2 - x1 > 6 else 1
+            )
+            
+            # Labels only where they fit
+            if x2 - x1 >= 10 * len(pid) + 6:
+                self.canvas.create_text(
+                    (x1 + x2) / 2, (y1 + y2) / 2,
+                    text=pid,
+                    font=('Arial', 12, 'bold'),
+                    fill='white'
+                )
+            if x2 - x1 >= 24:
+                self.canvas.create_text(x1, y1 - 10, text=str(block_start), font=('Arial', 9), fill='white')
+                if row == self.visible_rows - 1 or timeline.starts[row + 1] != block_end:
+                    self.canvas.create_text(x2, y1 - 10, text=str(block_end), font=('Arial', 9), fill='white')
+    
+    def _draw_density(self, start, end, y1, y2):
+        timeline = self.timeline
+        processes = timeline.processes
+        last_end = timeline.ends[self.visible_rows - 1]
+        width = DENSITY_COLUMN_PIXELS / self.pixels_per_unit
+        
+        column_start = start
+        busy_before = self.busy_until(column_start)
+        while column_start < min(end, last_end):
+            column_end = min(column_start + width, last_end)
+            busy_after = self.busy_until(column_end)
+            fraction = (busy_after - busy_before) / (column_end - column_start)
+            
+            if fraction > 0:
+                row = bisect_right(timeline.starts, (column_start + column_end) / 2, 0, self.visible_rows) - 1
+                x = self._x(column_start)
+                self.canvas.create_rectangle(
+                    x, y2 - (y2 - y1) * min(fraction, 1.0), x + DENSITY_COLUMN_PIXELS, y2,
+                    fill=processes.color(timeline.process_index[max(row, 0)]),
+                    outline=''
+                )
+            
+            column_start, busy_before = column_end, busy_after
+
+class Playback:
+    """Time-based playback of a timeline on a GanttView
+    
+    Simulated time advances with the wall clock, BASE_UNITS_PER_SECOND times
+    ``speed``. Every frame reveals all segments that have started by then
+    with a single GanttView.reveal, so a frame costs the same whether it
+    covers one segment or a million. If a frame takes longer than its
+    FRAME_MS budget, the next one is pushed back so the event loop always
+    gets at least half the time. ``on_change`` is called after every
+    frame, seek, play and pause.
+    """
+    def __init__(self, view, on_change=None):
+        self.view = view
+        self.on_change = on_change
+        self.speed = 1
+        self.time = 0.0
+        self.playing = False
+        self._last_tick = None
+        self._after_id = None
+    
+    @property
+    def timeline(self):
+        return self.view.timeline
+    
+    def end_time(self):
+        """Time at which the last segment ends"""
+        return self.view.end_time()
+    
+    def load(self, timeline):
+        """Show ``timeline`` with nothing revealed yet, paused at time 0"""
+        self.stop()
+        self.time = 0.0
+        self.view.set_timeline(timeline, visible_rows=0)
+        self._changed()
+    
+    def play(self):
+        """Start or resume playback, from the beginning if it had finished"""
+        if self.timeline is None or self.playing:
+            return
+        if self.time >= self.end_time():
+            self.seek(0)
+        self.playing = True
+        self._last_tick = time.perf_counter()
+        self._after_id = self.view.canvas.after(FRAME_MS, self._frame)
+        self._changed()
+    
+    def pause(self):
+        """Stop advancing, keeping what has been revealed"""
+        self.stop()
+        self._changed()
+    
+    def toggle(self):
+        """Pause when playing, play otherwise"""
+        if self.playing:
+            self.pause()
+        else:
+            self.play()
+    
+    def stop(self):
+        """Cancel the pending frame without notifying ``on_change``"""
+        self.playing = False
+        if self._after_id is not None:
+            self.view.canvas.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def clear(self):
+        """Stop, rewind and empty the view"""
+        self.stop()
+        self.time = 0.0
+        self.view.clear()
+        self._changed()
+    
+    def seek(self, t):
+        """Show the timeline as it was at time ``t``"""
+        if self.timeline is None:
+            return
+        self.time = min(max(0.0, float(t)), self.end_time())
+        self._last_tick = time.perf_counter()
+        self._show(follow=True)
+        self._changed()
+    
+    def jump_to_end(self):
+        """Reveal the whole timeline and stop"""
+        self.stop()
+        self.seek(self.end_time())
+    
+    def _show(self, follow):
+        rows = bisect_right(self.timeline.starts, self.time, 0, len(self.timeline))
+        self.view.reveal(rows, follow)
+    
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+    
+    def _frame(self):
+        self._after_id = None
+        if not self.playing or self.timeline is None:
+            return
+        
+        started = time.perf_counter()
+        self.time += (started - self._last_tick) * BASE_UNITS_PER_SECOND * self.speed
+        self._last_tick = started
+        if self.time >= self.end_time():
+            self.time = self.end_time()
+            self.playing = False
+        
+        self._show(follow=True)
+        self.view.flush()
+        self._changed()
+        
+        if self.playing:
+            cost_ms = (time.perf_counter() - started) * 1000
+            self._after_id = self.view.canvas.after(max(FRAME_MS, int(2 * cost_ms)), self._frame)
@@ -0,0 +1,227 @@
+import tkinter as tk
+
+from scheduler_engine.draft import DRAFT_COLUMNS
+
+ROW_HEIGHT = 24
+PID_WIDTH = 70
+CELL_WIDTH = 80
+
+HEADINGS = {
+    'arrival': "Arrival",
+    'burst': "Burst",
+    'priority': "Priority",
+}
+
+GRID_COLOR = '#555555'
+HEADER_BG = '#2D2D2D'
+CELL_BG = '#3C3C3C'
+INVALID_BG = '#7A2E35'
+CURSOR_COLOR = '#0078D4'
+
+class ProcessEditor:
+    """Spreadsheet-style editor for a WorkloadDraft, drawn on a Tk canvas
+    
+    Only the rows that fit in the canvas are drawn, as text on the canvas,
+    and a single Entry is placed over the cell being edited, so the editor
+    costs the same for ten processes as for a hundred thousand. Enter, Tab
+    and the arrow keys commit the cell and move; Escape abandons the edit.
+    Ctrl+V pastes a block of cells copied from a spreadsheet or a CSV file
+    at the current cell. ``on_resize`` is called with the new number of
+    rows when a paste grows the draft.
+    """
+    def __init__(self, canvas, scrollbar, draft, on_resize=None):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.draft = draft
+        self.on_resize = on_resize
+        self.columns = DRAFT_COLUMNS
+        self.first = 0
+        self.cursor = (0, 'arrival')
+        self.editing = False
+        
+        self.entry = tk.Entry(canvas, font=('Arial', 10), bg=CELL_BG, fg='white',
+                              insertbackground='white', relief=tk.FLAT, justify='center')
+        self.entry.bind('<Return>', lambda e: self._commit_and_move(1, 0))
+        self.entry.bind('<Down>', lambda e: self._commit_and_move(1, 0))
+        self.entry.bind('<Up>', lambda e: self._commit_and_move(-1, 0))
+        self.entry.bind('<Tab>', lambda e: self._commit_and_move(0, 1))
+        self.entry.bind('<Shift-Tab>', lambda e: self._commit_and_move(0, -1))
+        self.entry.bind('<ISO_Left_Tab>', lambda e: self._commit_and_move(0, -1))  # Shift-Tab on X11
+        self.entry.bind('<Escape>', lambda e: self.cancel())
+        self.entry.bind('<Control-v>', self._on_paste)
+        
+        scrollbar.config(command=self._on_scrollbar)
+        canvas.bind('<Configure>', lambda e: self.redraw())
+        canvas.bind('<Button-1>', self._on_click)
+        canvas.bind('<MouseWheel>', lambda e: self.scroll_to(self.first - 3 * e.delta // 120))
+        canvas.bind('<Button-4>', lambda e: self.scroll_to(self.first - 3))  # Linux
+        canvas.bind('<Button-5>', lambda e: self.scroll_to(self.first + 3))
+        canvas.bind('<Control-v>', self._on_paste)
+    
+    def set_priority_visible(self, visible):
+        """Show or hide the priority column"""
+        self.cancel()
+        self.columns = DRAFT_COLUMNS if visible else DRAFT_COLUMNS[:2]
+        if self.cursor[1] not in self.columns:
+            self.cursor = (self.cursor[0], self.columns[-1])
+        self.redraw()
+    
+    def page_size(self):
+        """Rows that fit below the heading"""
+        height = self.canvas.winfo_height()
+        if height <= 1:  # Canvas not yet rendered
+            height = 400
+        return max(1, height // ROW_HEIGHT - 1)
+    
+    def refresh(self):
+        """Redraw after the draft was changed from outside the editor"""
+        self.cancel()
+        row, column = self.cursor
+        self.cursor = (min(row, max(0, len(self.draft) - 1)), column)
+        self.first = max(0, min(self.first, len(self.draft) - self.page_size()))
+        self.redraw()
+    
+    def _cell_x(self, column):
+        return PID_WIDTH + self.columns.index(column) * CELL_WIDTH
+    
+    def _cell_y(self, row):
+        return (row - self.first + 1) * ROW_HEIGHT
+    
+    def redraw(self):
+        """Draw the heading and the rows that fit in the canvas"""
+        canvas = self.canvas
+        canvas.delete("all")
+        width = PID_WIDTH + len(self.columns) * CELL_WIDTH
+        
+        canvas.create_rectangle(0, 0, width, ROW_HEIGHT, fill=HEADER_BG, outline=GRID_COLOR)
+        canvas.create_text(PID_WIDTH / 2, ROW_HEIGHT / 2, text="Process", fill='white', font=('Arial', 10, 'bold'))
+        for column in self.columns:
+            x = self._cell_x(column)
+            canvas.create_rectangle(x, 0, x + CELL_WIDTH, ROW_HEIGHT, fill=HEADER_BG, outline=GRID_COLOR)
+            canvas.create_text(x + CELL_WIDTH / 2, ROW_HEIGHT / 2, text=HEADINGS[column],
+                               fill='white', font=('Arial', 10, 'bold'))
+        
+        last = min(len(self.draft), self.first + self.page_size())
+        for row in range(self.first, last):
+            y = self._cell_y(row)
+            canvas.create_rectangle(0, y, PID_WIDTH, y + ROW_HEIGHT, fill=HEADER_BG, outline=GRID_COLOR)
+            canvas.create_text(PID_WIDTH / 2, y + ROW_HEIGHT / 2, text=self.draft.pid(row),
+                               fill='white', font=('Arial', 10))
+            for column in self.columns:
+                x = self._cell_x(column)
+                fill = INVALID_BG if self.draft.is_invalid(row, column) else CELL_BG
+                canvas.create_rectangle(x, y, x + CELL_WIDTH, y + ROW_HEIGHT, fill=fill, outline=GRID_COLOR)
+                canvas.create_text(x + CELL_WIDTH / 2, y + ROW_HEIGHT / 2, text=self.draft.text(row, column),
+                                   fill='white', font=('Arial', 10))
+        
+        row, column = self.cursor
+        if self.first <= row < last:
+            x, y = self._cell_x(column), self._cell_y(row)
+            canvas.create_rectangle(x + 1, y + 1, x + CELL_WIDTH - 1, y + ROW_HEIGHT - 1,
+                                    outline=CURSOR_COLOR, width=2)
+        self._place_entry()
+        
+        total = len(self.draft)
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.page_size()) / total))
+        else:
+            self.scrollbar.set(0, 1)
+    
+    def scroll_to(self, first):
+        """Make ``first`` the top row, as far as the draft allows"""
+        first = max(0, min(int(first), len(self.draft) - self.page_size()))
+        if first != self.first:
+            self.first = first
+            self.redraw()
+    
+    def show_row(self, row):
+        """Scroll ``row`` into view and put the cursor on it"""
+        self.cursor = (row, self.cursor[1])
+        page_size = self.page_size()
+        if not self.first <= row < self.first + page_size:
+            self.first = max(0, min(row - page_size // 2, len(self.draft) - page_size))
+        self.redraw()
+    
+    def edit(self, row, column):
+        """Start editing a cell in the entry"""
+        if not 0 <= row < len(self.draft):
+            return
+        self.cursor = (row, column)
+        self.editing = True
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, self.draft.text(row, column))
+        self.entry.select_range(0, tk.END)
+        self.show_row(row)
+        self.entry.focus_set()
+    
+    def commit(self):
+        """Write the entry back to the draft"""
+        if self.editing:
+            row, column = self.cursor
+            self.draft.set_text(row, column, self.entry.get())
+            self.editing = False
+            self.entry.place_forget()
+    
+    def cancel(self):
+        """Stop editing without writing the entry back"""
+        if self.editing:
+            self.editing = False
+            self.entry.place_forget()
+            self.canvas.focus_set()
+    
+    def _place_entry(self):
+        row, column = self.cursor
+        if self.editing and self.first <= row < self.first + self.page_size():
+            self.entry.place(x=self._cell_x(column) + 1, y=self._cell_y(row) + 1,
+                             width=CELL_WIDTH - 1, height=ROW_HEIGHT - 1)
+        else:
+            self.entry.place_forget()
+    
+    def _commit_and_move(self, rows, columns):
+        self.commit()
+        row, column = self.cursor
+        position = self.columns.index(column) + columns
+        if position >= len(self.columns):
+            position, row = 0, row + 1
+        elif position < 0:
+            position, row = len(self.columns) - 1, row - 1
+        row = max(0, min(row + rows, len(self.draft) - 1))
+        self.edit(row, self.columns[position])
+        return "break"
+    
+    def _on_click(self, event):
+        self.commit()
+        row = self.first + event.y // ROW_HEIGHT - 1
+        position = (event.x - PID_WIDTH) // CELL_WIDTH
+        if row < self.first or not 0 <= position < len(self.columns):
+            self.redraw()
+            return
+        self.edit(row, self.columns[position])
+    
+    def paste(self, text):
+        """Paste a block of cells at the cursor"""
+        self.cancel()
+        row, column = self.cursor
+        size = len(self.draft)
+        self.draft.paste(row, column, text)
+        if len(self.draft) != size and self.on_resize is not None:
+            self.on_resize(len(self.draft))
+        self.redraw()
+    
+    def _on_paste(self, event):
+        try:
+            text = self.canvas.clipboard_get()
+        except tk.TclError:
+            return "break"
+        # A single value typed into a cell is pasted by the Entry itself
+        if event.widget is self.entry and '\n' not in text.strip() and '\t' not in text:
+            return None
+        self.paste(text)
+        return "break"
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.draft))
+        elif action == 'scroll':
+            step = self.page_size() if unit == 'pages' else 1
+            self.scroll_to(self.first + int(amount) * step)
@@ -2,9 +2,6 @@ import tkinter as tk
 from tkinter import ttk
 import threading
 import time
-import subprocess
-import sys
-import os
 
 class LoadingPage:
     def __init__(self, root):
@@ -22,6 +19,10 @@ class LoadingPage:
         self.accent_green = '#28A745'
         self.accent_blue = '#17A2B8'
         
+        # Objects produced by the warm-up thread for the main app
+        self.figure = None
+        self.animating = True
+        
         self.root.configure(bg=self.bg_color)
         self.setup_ui()
         
@@ -207,11 +208,14 @@ class LoadingPage:
         # Start CPU animation
         self.animate_cpu()
         
-        # Start progress simulation in a separate thread
+        # Start warm-up in a separate thread
         threading.Thread(target=self.simulate_loading, daemon=True).start()
 
     def animate_cpu(self):
         """Animate the CPU loader"""
+        if not self.animating:
+            return
+        
         self.cpu_canvas.delete("all")
         
         width = self.cpu_canvas.winfo_width()
@@ -265,23 +269,66 @@ class LoadingPage:
         self.root.after(100, self.animate_cpu)
 
     def simulate_loading(self):
-        """Simulate loading progress"""
+        """Warm up the engine and matplotlib while the splash is shown"""
         loading_steps = [
-            (10, "Loading scheduling algorithms..."),
-            (25, "Initializing process visualizer..."),
-            (45, "Setting up Gantt chart components..."),
-            (65, "Preparing performance metrics..."),
-            (85, "Finalizing user interface..."),
-            (100, "Ready to launch!")
+            (10, "Loading scheduling algorithms...", self.warm_engine),
+            (35, "Loading chart libraries...", self.warm_matplotlib),
+            (60, "Building font cache...", self.warm_fonts),
+            (80, "Preparing performance charts...", self.warm_figure),
+            (95, "Loading user interface...", self.warm_app),
         ]
         
-        for progress, message in loading_steps:
+        for progress, message, step in loading_steps:
             self.update_progress(progress, message)
-            time.sleep(0.8)  # Simulate work being done
+            try:
+                step()
+            except Exception as e:
+                # The main app reports missing pieces when they are used
+                self.update_progress(progress, f"{message} skipped ({e})")
+        
+        self.update_progress(100, "Ready to launch!")
         
         # Enable launch button
         self.root.after(0, self.enable_launch)
 
+    def warm_engine(self):
+        """Import the engine and run a small schedule through every algorithm"""
+        from scheduler_engine import Process, SchedulingAlgorithm
+        
+        processes = [Process(f"P{i + 1}", i, i % 3 + 1, i % 2) for i in range(4)]
+        for algorithm in SchedulingAlgorithm.ALGORITHMS:
+            SchedulingAlgorithm.run(algorithm, processes)
+
+    def warm_matplotlib(self):
+        """Import the matplotlib modules used by the charts"""
+        import matplotlib.figure
+        import matplotlib.backends.backend_agg
+        import matplotlib.backends.backend_tkagg
+
+    def warm_fonts(self):
+        """Load the font cache and resolve the chart font"""
+        from matplotlib import font_manager
+        
+        font_manager.findfont(font_manager.FontProperties(weight='bold'))
+
+    def warm_figure(self):
+        """Pre-create the chart figure and render it once off-screen"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        figure = Figure(figsize=(12, 3), dpi=80, facecolor=self.panel_bg)
+        FigureCanvasAgg(figure)
+        ax = figure.add_subplot(111)
+        ax.bar(['P1'], [1])
+        ax.set_title('Warm-up', fontsize=12, fontweight='bold')
+        figure.canvas.draw()
+        figure.clear()
+        self.figure = figure
+
+    def warm_app(self):
+        """Import the main application module"""
+        import cpu_scheduler_visualizer
+
     def update_progress(self, value, message):
         """Update progress bar and text"""
         def update():
@@ -319,22 +366,22 @@ class LoadingPage:
             state=tk.DISABLED
         )
         
-        # Close loading page and launch main app
-        self.root.after(1000, self.execute_launch)
+        # Let the button repaint, then replace the loading page with the main app
+        self.root.after(10, self.execute_launch)
 
     def execute_launch(self):
         """Execute the main application launch"""
         try:
-            # Close the loading window
-            self.root.destroy()
-            
             # Import main app class here to avoid circular import issues
             from cpu_scheduler_visualizer import SchedulerVisualizerApp
             
-            # Create and launch the main application directly
-            main_root = tk.Tk()
-            main_app = SchedulerVisualizerApp(main_root)  # Your main app class
-            main_root.mainloop()
+            # Clear the loading page and reuse the same root window
+            self.animating = False
+            for child in self.root.winfo_children():
+                child.destroy()
+            self.root.unbind('<Escape>')
+            
+            self.main_app = SchedulerVisualizerApp(self.root, figure=self.figure)
             
         except Exception as e:
             # Show error and keep loading window open
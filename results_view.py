@@ -0,0 +1,272 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Treeview columns and the ProcessTable column behind each; PID comes from table.pid
+COLUMNS = ('PID', 'AT', 'BT', 'Priority', 'FT', 'TAT', 'WT')
+TABLE_COLUMNS = {
+    'AT': 'arrival',
+    'BT': 'burst',
+    'Priority': 'priority',
+    'FT': 'finish',
+    'TAT': 'tat',
+    'WT': 'wt',
+}
+
+# Pixels taken by the heading row when working out how many rows fit
+HEADING_PIXELS = 30
+
+# Filters: "WT > 5", "TAT 10..20", "AT 3", "PID P12" or just "P12"
+_COMPARISON = re.compile(r'^(\w+)\s*(<=|>=|==|=|<|>)\s*(\S+)$')
+_RANGE = re.compile(r'^(\w+)\s+(\S+)\s*\.\.\s*(\S+)$')
+_EQUALS = re.compile(r'^(\w+)\s+(\S+)$')
+
+class ResultsView:
+    """Virtual results table over the columns of a ProcessTable
+    
+    The Treeview only ever holds the rows of the visible page; scrolling
+    rewrites their values from the table instead of inserting items, so
+    showing a million processes costs the same as showing ten. Sorting by a
+    column uses an index of row positions sorted by that column, built on
+    first use and kept until another table is shown, and a descending sort
+    reads it backwards. Filters on a numeric column are a binary search in
+    the same index.
+    """
+    def __init__(self, tree, scrollbar, row_height):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_height = row_height
+        self.page_size = int(tree.cget('height'))
+        self.headings = {column: tree.heading(column, 'text') for column in COLUMNS}
+        self.table = None
+        self.show_priority = True
+        self.rows = range(0)
+        self.first = 0
+        self.sort_column = None
+        self.descending = False
+        self.filter = None
+        self._sorted = {}
+        self._ranks = {}
+        
+        scrollbar.config(command=self._on_scrollbar)
+        for column in COLUMNS:
+            tree.heading(column, command=lambda c=column: self.sort_by(c))
+        tree.bind('<Configure>', self._on_configure)
+        tree.bind('<MouseWheel>', lambda e: self._on_wheel(e.delta))
+        tree.bind('<Button-4>', lambda e: self._on_wheel(120))  # Linux
+        tree.bind('<Button-5>', lambda e: self._on_wheel(-120))
+        tree.bind('<Prior>', lambda e: self._scroll_by(-self.page_size))
+        tree.bind('<Next>', lambda e: self._scroll_by(self.page_size))
+        tree.bind('<Home>', lambda e: self.scroll_to(0))
+        tree.bind('<End>', lambda e: self.scroll_to(len(self.rows)))
+    
+    def set_table(self, table, show_priority=True):
+        """Show the processes of a ProcessTable that carries results, in input order"""
+        self.table = table
+        self.show_priority = show_priority
+        self.sort_column = None
+        self.descending = False
+        self.filter = None
+        self._sorted = {}
+        self._ranks = {}
+        self._update_headings()
+        self._refresh()
+    
+    def clear(self):
+        """Forget the table and empty the Treeview"""
+        self.table = None
+        self.filter = None
+        self._sorted = {}
+        self._ranks = {}
+        self.rows = range(0)
+        self.first = 0
+        self.tree.delete(*self.tree.get_children())
+        self.scrollbar.set(0, 1)
+    
+    def __len__(self):
+        return len(self.table) if self.table is not None else 0
+    
+    def key(self, column):
+        """Sort key of ``column`` as a function of the row"""
+        if column == 'PID':
+            # P2 before P10
+            return lambda row: (len(self.table.pid(row)), self.table.pid(row))
+        return getattr(self.table, TABLE_COLUMNS[column]).__getitem__
+    
+    def sort_index(self, column):
+        """(rows sorted by ``column``, their values in that order), built once per table"""
+        if column not in self._sorted:
+            rows = array('i', sorted(range(len(self.table)), key=self.key(column)))
+            values = None
+            if column != 'PID':
+                values = array('q', map(getattr(self.table, TABLE_COLUMNS[column]).__getitem__, rows))
+            self._sorted[column] = rows, values
+        return self._sorted[column]
+    
+    def rank(self, column):
+        """Position of every row in the sort index of ``column``"""
+        if column not in self._ranks:
+            rows = self.sort_index(column)[0]
+            ranks = array('i', bytes(4 * len(rows)))
+            for position, row in enumerate(rows):
+                ranks[row] = position
+            self._ranks[column] = ranks
+        return self._ranks[column]
+    
+    def sort_by(self, column):
+        """Sort by ``column``, or reverse the order if it is already sorted by it"""
+        if self.table is None:
+            return
+        if column == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+        self._update_headings()
+        self._refresh()
+    
+    def set_filter(self, text):
+        """Keep only the rows matching ``text``; an empty text shows all rows
+        
+        Accepts a column name with a comparison (``WT > 5``), a range
+        (``TAT 10..20``) or an equality (``AT 3``), and a process ID alone
+        or after ``PID``. Returns the number of matching rows; raises
+        ValueError for anything else.
+        """
+        text = text.strip()
+        if not text:
+            self.filter = None
+        else:
+            self.filter = self._parse_filter(text)
+        self._refresh()
+        return len(self.rows)
+    
+    def _parse_filter(self, text):
+        op = upper = None
+        if _COMPARISON.match(text):
+            column, op, value = _COMPARISON.match(text).groups()
+        elif _RANGE.match(text):
+            column, value, upper = _RANGE.match(text).groups()
+        elif _EQUALS.match(text):
+            column, value = _EQUALS.match(text).groups()
+        elif text.split() == [text]:
+            column, value = 'PID', text
+        else:
+            raise ValueError(f"cannot understand filter '{text}'")
+        column = {name.lower(): name for name in COLUMNS}.get(column.lower())
+        if column is None:
+            raise ValueError(f"unknown column in filter '{text}'")
+        if column == 'PID':
+            if op not in (None, '=', '==') or upper is not None:
+                raise ValueError("process IDs can only be matched exactly")
+            return column, value, value
+        
+        try:
+            value = int(value)
+            upper = int(upper) if upper is not None else None
+        except ValueError:
+            raise ValueError(f"'{text}' does not compare {column} with a whole number")
+        if upper is not None:
+            return column, value, upper
+        bounds = {
+            None: (value, value), '=': (value, value), '==': (value, value),
+            '<': (None, value - 1), '<=': (None, value),
+            '>': (value + 1, None), '>=': (value, None),
+        }
+        return (column,) + bounds[op]
+    
+    def _matching_rows(self):
+        """Rows passing the filter, in input order, found in a sort index"""
+        column, low, high = self.filter
+        if column == 'PID':
+            try:
+                return [self.table.index_of(low)]
+            except ValueError:
+                return []
+        rows, values = self.sort_index(column)
+        first = bisect_left(values, low) if low is not None else 0
+        last = bisect_right(values, high) if high is not None else len(values)
+        return sorted(rows[first:last])
+    
+    def _refresh(self):
+        """Work out the rows to show from the sort and filter, then show the first page"""
+        if self.table is None:
+            return
+        if self.filter is None:
+            rows = self.sort_index(self.sort_column)[0] if self.sort_column else range(len(self.table))
+        else:
+            rows = self._matching_rows()
+            if self.sort_column:
+                rows.sort(key=self.rank(self.sort_column).__getitem__)
+        self.rows = rows[::-1] if self.descending else rows
+        self.first = 0
+        self._show()
+    
+    def _update_headings(self):
+        for column in COLUMNS:
+            text = self.headings[column]
+            if column == self.sort_column:
+                text += " ▼" if self.descending else " ▲"
+            self.tree.heading(column, text=text)
+    
+    def _values(self, row):
+        table = self.table
+        return (
+            table.pid(row),
+            table.arrival[row],
+            table.burst[row],
+            table.priority[row] if self.show_priority else "--",
+            table.finish[row],
+            table.tat[row],
+            table.wt[row]
+        )
+    
+    def _show(self):
+        """Put the page starting at ``first`` into the Treeview items"""
+        total = len(self.rows)
+        count = max(0, min(self.page_size, total - self.first))
+        items = self.tree.get_children()
+        if len(items) > count:
+            self.tree.delete(*items[count:])
+            items = items[:count]
+        
+        for position in range(count):
+            values = self._values(self.rows[self.first + position])
+            if position < len(items):
+                self.tree.item(items[position], values=values)
+            else:
+                self.tree.insert('', 'end', values=values)
+        
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.page_size) / total))
+        else:
+            self.scrollbar.set(0, 1)
+    
+    def scroll_to(self, first):
+        """Show the page starting at row ``first`` of the current order"""
+        first = max(0, min(int(first), len(self.rows) - self.page_size))
+        if first != self.first:
+            self.first = first
+            self._show()
+    
+    def _scroll_by(self, rows):
+        self.scroll_to(self.first + rows)
+        return "break"
+    
+    def _on_wheel(self, delta):
+        return self._scroll_by(-3 * delta // 120)
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.rows))
+        elif action == 'scroll':
+            step = self.page_size if unit == 'pages' else 1
+            self.scroll_to(self.first + int(amount) * step)
+    
+    def _on_configure(self, event):
+        page_size = max(1, (event.height - HEADING_PIXELS) // self.row_height)
+        if page_size != self.page_size:
+            self.page_size = page_size
+            if self.table is not None:
+                self.first = max(0, min(self.first, len(self.rows) - page_size))
+                self._show()
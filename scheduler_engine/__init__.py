@@ -0,0 +1,40 @@
+"""Scheduling engine of the CPU Scheduling Visualizer, free of any GUI imports"""
+from .algorithms import ScheduleResult, SchedulingAlgorithm, metric_names
+from .batch import MetricsTable, simulate_batch
+from .cache import ResultCache, workload_key
+from .incremental import Checkpoint, CheckpointedRun, SchedulerState
+from .process import PROCESS_COLORS, Process, ProcessTable
+from .stream import Completion, RunningMetrics, Segment, iter_schedule
+from .timeline import Timeline
+from .trace import TraceError, TraceFile, TraceTable, write_trace
+from .worker import SimulationWorker
+from .workload import WorkloadError, WorkloadReader, load_workload
+
+__all__ = [
+    'PROCESS_COLORS',
+    'Checkpoint',
+    'CheckpointedRun',
+    'Completion',
+    'MetricsTable',
+    'Process',
+    'ProcessTable',
+    'ResultCache',
+    'RunningMetrics',
+    'ScheduleResult',
+    'SchedulerState',
+    'SchedulingAlgorithm',
+    'Segment',
+    'SimulationWorker',
+    'Timeline',
+    'TraceError',
+    'TraceFile',
+    'TraceTable',
+    'WorkloadError',
+    'WorkloadReader',
+    'iter_schedule',
+    'load_workload',
+    'metric_names',
+    'simulate_batch',
+    'workload_key',
+    'write_trace',
+]
@@ -0,0 +1,728 @@
+import heapq
+from array import array
+from collections import deque, namedtuple
+from itertools import islice
+
+from .process import ProcessTable
+from .timeline import Timeline
+
+# NumPy is optional and only needed by the vectorised kernels. It is imported
+# on first use so that importing the engine stays fast.
+_numpy = None
+_numpy_checked = False
+
+# Below this many processes the plain loop beats converting to NumPy arrays
+VECTORIZE_MIN_PROCESSES = 1000
+
+def load_numpy():
+    """Return the numpy module, or None when it is not installed"""
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+        _numpy_checked = True
+    return _numpy
+
+Checkpoint = namedtuple('Checkpoint', 'time admitted ready dispatch countdown segments last_end completed')
+Checkpoint.__doc__ = """Scheduler state at the top of one scheduling step
+
+``time`` is the current time, ``admitted`` the number of processes (in
+arrival order) that have joined the ready queue and ``ready`` a copy of the
+queue: (key, dispatch, index) heap entries for the non-preemptive
+algorithms, (key, index, remaining) heap entries for the preemptive ones and
+(index, remaining) pairs in queue order for Round Robin. ``dispatch`` is the
+non-preemptive tie-breaking counter and ``countdown`` the Round Robin slices
+left before the next fast-forward attempt. ``segments`` and ``completed`` are
+the timeline length and the number of finished processes, and ``last_end``
+the end of the last block then, which coalescing may extend afterwards.
+"""
+
+SchedulerState = namedtuple('SchedulerState', 'time running remaining ready waiting finished')
+SchedulerState.__doc__ = """What the scheduler holds at one instant, as returned by CheckpointedRun.state_at
+
+``running`` is the index of the process on the CPU (None when it is idle)
+and ``remaining`` its remaining time. ``ready`` lists (index, remaining)
+pairs of the waiting processes in the order the algorithm would pick them
+(queue order for FCFS and Round Robin), ``waiting`` is how many there are
+and ``finished`` how many processes have completed.
+"""
+
+class _Run:
+    """Where an engine starts, what it extends and when it stops
+    
+    An engine schedules the positions of ``arrivals`` (process positions in
+    arrival order) from the ``resume`` Checkpoint on, appending blocks to
+    ``timeline`` and finished positions to ``completed``. This one starts
+    from scratch and runs to the end. CheckpointedRun is the other kind:
+    its ``at_checkpoint`` is called with the scheduler state every
+    ``checkpoint_every`` steps, and with ``until`` set the engine stops at
+    that time and returns the SchedulerState, listing at most ``limit``
+    ready processes. When ``at_checkpoint`` returns a true value the engine
+    pauses there, returning None, and can be resumed from that state, as
+    the driver of iter_schedule does. Without ``vectorize`` FCFS always
+    runs the loop, which visits every step.
+    """
+    checkpoint_every = 0  # Never
+    until = None
+    limit = None
+    fast_forward = True
+    vectorize = True
+    
+    def __init__(self, table, start_time=0):
+        self.arrivals = array('i', sorted(range(len(table)), key=table.arrival.__getitem__))
+        self.timeline = Timeline(table)
+        self.completed = array('i')
+        self.resume = Checkpoint(start_time, 0, (), 0, 0, 0, 0, 0)
+    
+    def at_checkpoint(self, current_time, admitted, ready, dispatch, countdown):
+        """Scheduler state every ``checkpoint_every`` steps; a plain run keeps none and never pauses"""
+
+def _arrived(arrival, arrivals, first, until):
+    """Position in ``arrivals`` of the first process from ``first`` on arriving after ``until``"""
+    low, high = first, len(arrivals)
+    while low < high:
+        middle = (low + high) // 2
+        if arrival[arrivals[middle]] <= until:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+class ScheduleResult:
+    """Outcome of one scheduling run, indexed by process position
+    
+    ``start``, ``finish``, ``tat`` and ``wt`` are result columns in the same
+    order as the input, ``order`` lists positions in completion order and
+    ``timeline`` holds the Gantt blocks. ``apply_to`` copies the results
+    onto a list of Process objects in a single pass.
+    """
+    def __init__(self, table, order, timeline):
+        self.table = table
+        self.order = order
+        self.timeline = timeline
+        self.start = table.start
+        self.finish = table.finish
+        self.tat = table.tat
+        self.wt = table.wt
+    
+    def __len__(self):
+        return len(self.start)
+    
+    def apply_to(self, processes):
+        """Write the results onto the Process objects at the same positions"""
+        for index, process in enumerate(processes):
+            process.start_time = self.start[index]
+            process.finish_time = self.finish[index]
+            process.turnaround_time = self.tat[index]
+            process.waiting_time = self.wt[index]
+    
+    def processes(self):
+        """New Process objects carrying the results, in ``order``"""
+        return [self.table.process(index) for index in self.order]
+    
+    def metrics(self, percentiles=(50, 95, 99)):
+        """Summary metrics of the run as a flat dict
+        
+        Average and percentiles of turnaround, waiting and response time
+        (first run minus arrival), plus throughput and makespan. Keys follow
+        metric_names(percentiles).
+        """
+        n = len(self)
+        makespan = self.timeline.makespan()
+        response = [start - arrival for start, arrival in zip(self.start, self.table.arrival)]
+        
+        metrics = {}
+        for name, values in (('tat', self.tat), ('wt', self.wt), ('response', response)):
+            values = sorted(values)
+            metrics[f'avg_{name}'] = sum(values) / n if n else 0.0
+            for q in percentiles:
+                metrics[f'p{q}_{name}'] = _percentile(values, q)
+        metrics['throughput'] = n / makespan if makespan > 0 else 0.0
+        metrics['makespan'] = makespan
+        return metrics
+
+def metric_names(percentiles=(50, 95, 99)):
+    """Names of the metrics ScheduleResult.metrics reports, in order"""
+    names = []
+    for name in ('tat', 'wt', 'response'):
+        names.append(f'avg_{name}')
+        names.extend(f'p{q}_{name}' for q in percentiles)
+    return names + ['throughput', 'makespan']
+
+def _percentile(values, q):
+    """Linearly interpolated percentile of already sorted values"""
+    if not values:
+        return 0.0
+    rank = (len(values) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+class SchedulingAlgorithm:
+    """Base class for scheduling algorithms
+    
+    Every method accepts either a list of Process objects or a ProcessTable
+    and returns a ScheduleResult. Inputs are treated as immutable: Process
+    lists are never modified, and a ProcessTable only has its result columns
+    filled in place.
+    """
+    
+    ALGORITHMS = (
+        "FCFS",
+        "SJF (Non-preemptive)",
+        "SJF (Preemptive)",
+        "Round Robin",
+        "Priority (Non-preemptive)",
+        "Priority (Preemptive)"
+    )
+    
+    @staticmethod
+    def run(algorithm, processes, time_quantum=2, coalesce=True):
+        """Run an algorithm by its display name"""
+        if algorithm == "FCFS":
+            return SchedulingAlgorithm.fcfs(processes)
+        if algorithm not in SchedulingAlgorithm.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        table = SchedulingAlgorithm._as_table(processes)
+        driver = _Run(table)
+        SchedulingAlgorithm._drive(algorithm, table, driver, time_quantum, coalesce)
+        return ScheduleResult(table, driver.completed, driver.timeline)
+    
+    @staticmethod
+    def _drive(algorithm, table, driver, time_quantum=2, coalesce=True):
+        """Run the engine of ``algorithm`` over ``table`` as ``driver`` (a _Run or CheckpointedRun) directs
+        
+        Result columns are filled in place without being reset, so a resumed
+        run keeps the results decided before its checkpoint. Returns the
+        SchedulerState when the driver stops the run at ``until``.
+        """
+        if algorithm == "FCFS":
+            return SchedulingAlgorithm._run_fcfs(table, driver)
+        elif algorithm == "SJF (Non-preemptive)":
+            return SchedulingAlgorithm._run_non_preemptive(table, table.burst.__getitem__, driver)
+        elif algorithm == "SJF (Preemptive)":
+            return SchedulingAlgorithm._run_preemptive(table, lambda index, remaining: remaining, driver, coalesce)
+        elif algorithm == "Round Robin":
+            return SchedulingAlgorithm._run_round_robin(table, time_quantum, driver, coalesce)
+        elif algorithm == "Priority (Non-preemptive)":
+            # Lower number = higher priority
+            return SchedulingAlgorithm._run_non_preemptive(
+                table, lambda index: (table.priority[index], table.arrival[index]), driver
+            )
+        elif algorithm == "Priority (Preemptive)":
+            return SchedulingAlgorithm._run_preemptive(
+                table, lambda index, remaining: (table.priority[index], table.arrival[index]), driver, coalesce
+            )
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    
+    @staticmethod
+    def fcfs(processes, start_time=0):
+        """First Come First Serve, with the CPU free from ``start_time``"""
+        table = SchedulingAlgorithm._as_table(processes)
+        if len(table) >= VECTORIZE_MIN_PROCESSES and load_numpy() is not None:
+            return SchedulingAlgorithm._fcfs_numpy(table, start_time)
+        
+        driver = _Run(table, start_time)
+        SchedulingAlgorithm._run_fcfs(table, driver)
+        return ScheduleResult(table, driver.completed, driver.timeline)
+    
+    @staticmethod
+    def _run_fcfs(table, driver):
+        """FCFS engine; the processes that have arrived wait in arrival order"""
+        arrival, burst = table.arrival, table.burst
+        timeline, completed, arrivals = driver.timeline, driver.completed, driver.arrivals
+        resume, until, limit, every = driver.resume, driver.until, driver.limit, driver.checkpoint_every
+        if (until is None and driver.vectorize and len(arrivals) - resume.admitted >= VECTORIZE_MIN_PROCESSES
+                and load_numpy() is not None):
+            return SchedulingAlgorithm._fcfs_numpy(table, resume.time, driver)
+        
+        current_time = resume.time
+        finished = resume.completed
+        steps = 0
+        
+        for position in range(resume.admitted, len(arrivals)):
+            steps += 1
+            if steps == every:
+                steps = 0
+                if driver.at_checkpoint(current_time, position, (), 0, 0):
+                    return
+            
+            index = arrivals[position]
+            if current_time < arrival[index]:
+                if until is not None and arrival[index] > until:
+                    return SchedulerState(until, None, 0, [], 0, finished)
+                current_time = arrival[index]
+            
+            if until is not None and until < current_time + burst[index]:
+                end = _arrived(arrival, arrivals, position + 1, until)
+                shown = end if limit is None else min(end, position + 1 + limit)
+                return SchedulerState(until, index, current_time + burst[index] - until,
+                                      [(i, burst[i]) for i in arrivals[position + 1:shown]], end - position - 1, finished)
+            
+            table.start[index] = current_time
+            table.complete(index, current_time + burst[index])
+            timeline.append(index, current_time, current_time + burst[index])
+            
+            current_time += burst[index]
+            completed.append(index)
+            finished += 1
+        
+        if until is not None:
+            return SchedulerState(until, None, 0, [], 0, finished)
+    
+    @staticmethod
+    def fcfs_stream(batches):
+        """First Come First Serve over a stream of arrival-sorted ProcessTable batches
+        
+        Yields one ScheduleResult per batch, as produced by WorkloadReader.
+        FCFS never lets a later arrival overtake an earlier one, so each batch
+        only needs the time the CPU frees up after the previous batch and
+        memory stays bounded by the batch size.
+        """
+        current_time = 0
+        for table in batches:
+            result = SchedulingAlgorithm.fcfs(table, current_time)
+            if len(result.timeline):
+                current_time = result.timeline.ends[-1]
+            yield result
+    
+    @staticmethod
+    def fcfs_vectorized(arrival, burst):
+        """First Come First Serve as a closed form over NumPy arrays
+        
+        ``arrival`` and ``burst`` are either 1-D arrays describing one
+        workload or 2-D arrays of shape (workloads, n) describing a batch of
+        workloads of the same size. Returns start, finish, turnaround and
+        waiting time arrays of the same shape, in input order.
+        """
+        np = load_numpy()
+        if np is None:
+            raise ImportError("fcfs_vectorized requires NumPy")
+        
+        arrival = np.asarray(arrival, dtype=np.int64)
+        burst = np.asarray(burst, dtype=np.int64)
+        if arrival.shape != burst.shape or arrival.ndim not in (1, 2):
+            raise ValueError("arrival and burst must be 1-D or 2-D arrays of the same shape")
+        
+        order, start_sorted = SchedulingAlgorithm._fcfs_closed_form(arrival, burst)
+        
+        # Scatter back from arrival order to input order
+        start = np.empty_like(start_sorted)
+        np.put_along_axis(start, order, start_sorted, axis=-1)
+        finish = start + burst
+        turnaround = finish - arrival
+        waiting = start - arrival
+        return start, finish, turnaround, waiting
+    
+    @staticmethod
+    def _fcfs_closed_form(arrival, burst, start_time=0):
+        """Arrival order and start times (in that order) for FCFS"""
+        np = load_numpy()
+        order = np.argsort(arrival, axis=-1, kind='stable')
+        arrival_sorted = np.take_along_axis(arrival, order, axis=-1)
+        burst_sorted = np.take_along_axis(burst, order, axis=-1)
+        return order, SchedulingAlgorithm._fcfs_starts(arrival_sorted, burst_sorted, start_time)
+    
+    @staticmethod
+    def _fcfs_starts(arrival_sorted, burst_sorted, start_time=0):
+        """FCFS start times of processes already in arrival order
+        
+        With D[k] the total burst of the processes before k, process k starts
+        at D[k] + max(start_time, max over j <= k of (arrival[j] - D[j])),
+        which is a cumulative sum followed by a running maximum.
+        """
+        np = load_numpy()
+        done_before = np.cumsum(burst_sorted, axis=-1) - burst_sorted
+        idle = np.maximum(np.maximum.accumulate(arrival_sorted - done_before, axis=-1), start_time)
+        return done_before + idle
+    
+    @staticmethod
+    def _fcfs_numpy(table, start_time=0, driver=None):
+        """FCFS for one ProcessTable using the vectorised kernel
+        
+        Under a driver only the processes from its resume checkpoint on are
+        scheduled, in the driver's arrival order, and the blocks are handed
+        over ``checkpoint_every`` at a time so that its checkpoints fall
+        where the loop in _run_fcfs would take them.
+        """
+        np = load_numpy()
+        arrival = np.frombuffer(table.arrival, dtype=np.int64)
+        burst = np.frombuffer(table.burst, dtype=np.int64)
+        if driver is None:
+            order, start_sorted = SchedulingAlgorithm._fcfs_closed_form(arrival, burst, start_time)
+        else:
+            order = np.frombuffer(driver.arrivals, dtype=np.intc)[driver.resume.admitted:]
+            start_sorted = SchedulingAlgorithm._fcfs_starts(arrival[order], burst[order], start_time)
+        end_sorted = start_sorted + burst[order]
+        
+        # Write straight into the table's result columns
+        np.frombuffer(table.start, dtype=np.int64)[order] = start_sorted
+        np.frombuffer(table.finish, dtype=np.int64)[order] = end_sorted
+        np.frombuffer(table.tat, dtype=np.int64)[order] = end_sorted - arrival[order]
+        np.frombuffer(table.wt, dtype=np.int64)[order] = start_sorted - arrival[order]
+        
+        # One block per process, in arrival order
+        order = order.astype(np.intc)
+        if driver is None:
+            timeline = Timeline(table)
+            timeline.process_index.frombytes(order.tobytes())
+            timeline.starts.frombytes(start_sorted.tobytes())
+            timeline.ends.frombytes(end_sorted.tobytes())
+            return ScheduleResult(table, array('i', timeline.process_index), timeline)
+        
+        timeline, completed, every = driver.timeline, driver.completed, driver.checkpoint_every
+        first = driver.resume.admitted
+        done = 0
+        for step in range(every - 1, len(order), every) if every else ():
+            SchedulingAlgorithm._fcfs_hand_over(timeline, completed, order, start_sorted, end_sorted, done, step)
+            done = step
+            driver.at_checkpoint(end_sorted[step - 1] if step else start_time, first + step, (), 0, 0)
+        SchedulingAlgorithm._fcfs_hand_over(timeline, completed, order, start_sorted, end_sorted, done, len(order))
+    
+    @staticmethod
+    def _fcfs_hand_over(timeline, completed, order, start_sorted, end_sorted, first, last):
+        """Append the blocks and completions of rows ``first`` to ``last`` of a vectorised FCFS run"""
+        timeline.process_index.frombytes(order[first:last].tobytes())
+        timeline.starts.frombytes(start_sorted[first:last].tobytes())
+        timeline.ends.frombytes(end_sorted[first:last].tobytes())
+        completed.frombytes(order[first:last].tobytes())
+    
+    @staticmethod
+    def sjf_non_preemptive(processes):
+        """Shortest Job First - Non-preemptive"""
+        return SchedulingAlgorithm.run("SJF (Non-preemptive)", processes)
+    
+    @staticmethod
+    def sjf_preemptive(processes, coalesce=True):
+        """Shortest Job First - Preemptive (SRTF)"""
+        return SchedulingAlgorithm.run("SJF (Preemptive)", processes, coalesce=coalesce)
+    
+    @staticmethod
+    def round_robin(processes, time_quantum, fast_forward=True, coalesce=True):
+        """Round Robin with time quantum
+        
+        With ``fast_forward`` enabled, whole rounds of the ready queue that no
+        arrival or completion can interrupt are processed in bulk; the
+        resulting timeline is identical to the slice-by-slice run.
+        Back-to-back slices of the same process are merged into one block
+        unless ``coalesce`` is False.
+        """
+        table = SchedulingAlgorithm._as_table(processes)
+        driver = _Run(table)
+        driver.fast_forward = fast_forward
+        SchedulingAlgorithm._run_round_robin(table, time_quantum, driver, coalesce)
+        return ScheduleResult(table, driver.completed, driver.timeline)
+    
+    @staticmethod
+    def _run_round_robin(table, time_quantum, driver, coalesce=True):
+        """Round Robin engine; the ready queue holds (index, remaining) pairs"""
+        arrival, burst = table.arrival, table.burst
+        timeline, completed, arrivals = driver.timeline, driver.completed, driver.arrivals
+        resume, until, limit, every = driver.resume, driver.until, driver.limit, driver.checkpoint_every
+        fast_forward = driver.fast_forward
+        current_time = resume.time
+        next_arrival = resume.admitted
+        ready_queue = deque(resume.ready)
+        finished = resume.completed
+        # Slices left before the next fast-forward attempt, so the O(len(ready_queue))
+        # check below runs at most once per round
+        slices_until_check = resume.countdown
+        steps = 0
+        
+        while next_arrival < len(arrivals) or ready_queue:
+            steps += 1
+            if steps == every:
+                steps = 0
+                if driver.at_checkpoint(current_time, next_arrival, ready_queue, 0, slices_until_check):
+                    return
+            
+            # Add arrived processes to ready queue
+            while next_arrival < len(arrivals) and arrival[arrivals[next_arrival]] <= current_time:
+                index = arrivals[next_arrival]
+                ready_queue.append((index, burst[index]))
+                next_arrival += 1
+            
+            if not ready_queue:
+                if until is not None and arrival[arrivals[next_arrival]] > until:
+                    return SchedulerState(until, None, 0, [], 0, finished)
+                current_time = arrival[arrivals[next_arrival]]
+                continue
+            
+            if fast_forward:
+                if slices_until_check == 0:
+                    rounds = SchedulingAlgorithm._fast_forward_rounds(
+                        ready_queue, time_quantum, current_time,
+                        arrival[arrivals[next_arrival]] if next_arrival < len(arrivals) else None
+                    )
+                    if rounds > 0:
+                        if until is not None and until < current_time + rounds * len(ready_queue) * time_quantum:
+                            return SchedulingAlgorithm._fast_forward_state(
+                                ready_queue, time_quantum, current_time, until, finished, limit
+                            )
+                        current_time, ready_queue = SchedulingAlgorithm._round_robin_fast_forward(
+                            table, timeline, ready_queue, time_quantum, current_time, rounds, coalesce
+                        )
+                    slices_until_check = len(ready_queue)
+                slices_until_check -= 1
+            
+            index, remaining = ready_queue.popleft()
+            
+            # Execute for time quantum or remaining time
+            exec_time = min(time_quantum, remaining)
+            
+            if until is not None and until < current_time + exec_time:
+                # Processes arriving during the slice join the queue when it ends
+                end = _arrived(arrival, arrivals, next_arrival, until)
+                ready = list(islice(ready_queue, limit))
+                ready += [(i, burst[i]) for i in arrivals[next_arrival:end]]
+                return SchedulerState(until, index, remaining - (until - current_time),
+                                      ready[:limit], len(ready_queue) + end - next_arrival, finished)
+            
+            if table.start[index] == -1:
+                table.start[index] = current_time
+            
+            timeline.append(index, current_time, current_time + exec_time, coalesce)
+            
+            remaining -= exec_time
+            current_time += exec_time
+            
+            # Add newly arrived processes
+            while next_arrival < len(arrivals) and arrival[arrivals[next_arrival]] <= current_time:
+                arrived = arrivals[next_arrival]
+                ready_queue.append((arrived, burst[arrived]))
+                next_arrival += 1
+            
+            if remaining > 0:
+                ready_queue.append((index, remaining))
+            else:
+                table.complete(index, current_time)
+                completed.append(index)
+                finished += 1
+        
+        if until is not None:
+            return SchedulerState(until, None, 0, [], 0, finished)
+    
+    @staticmethod
+    def _fast_forward_rounds(ready_queue, time_quantum, current_time, next_arrival_time):
+        """Full Round Robin rounds that can be run in one go
+        
+        A round can be batched when every queued process still has work left
+        after it and the next arrival comes strictly after the round ends (an
+        arrival exactly at a slice boundary joins the queue ahead of the
+        preempted process).
+        """
+        rounds = min((remaining - 1) // time_quantum for _, remaining in ready_queue)
+        if next_arrival_time is not None:
+            rounds = min(rounds, (next_arrival_time - current_time - 1) // (len(ready_queue) * time_quantum))
+        return rounds
+    
+    @staticmethod
+    def _round_robin_fast_forward(table, timeline, ready_queue, time_quantum, current_time, rounds, coalesce=True):
+        """Run ``rounds`` full Round Robin rounds in one go
+        
+        Queue order is unchanged by full rounds. Returns the new current
+        time and ready queue.
+        """
+        start = current_time
+        for index, _ in ready_queue:
+            if table.start[index] == -1:
+                table.start[index] = current_time
+            current_time += time_quantum
+        ready_queue = deque((index, remaining - rounds * time_quantum) for index, remaining in ready_queue)
+        
+        # Emit the same blocks the slice-by-slice loop would have
+        if coalesce and len(ready_queue) == 1:
+            timeline.append(ready_queue[0][0], start, start + rounds * time_quantum, coalesce)
+            return start + rounds * time_quantum, ready_queue
+        
+        for _ in range(rounds):
+            for index, _ in ready_queue:
+                timeline.append(index, start, start + time_quantum, coalesce)
+                start += time_quantum
+        
+        return start, ready_queue
+    
+    @staticmethod
+    def _fast_forward_state(ready_queue, time_quantum, current_time, until, finished, limit):
+        """SchedulerState at ``until``, part way through full rounds starting at ``current_time``
+        
+        Nothing arrives or finishes during the rounds, so the queue just
+        rotates: the process in slot ``slot`` runs and the ones before it
+        have had one more slice and gone to the back.
+        """
+        rounds, offset = divmod(until - current_time, len(ready_queue) * time_quantum)
+        slot, into = divmod(offset, time_quantum)
+        entries = list(ready_queue)
+        index, remaining = entries[slot]
+        ready = [(i, left - rounds * time_quantum) for i, left in entries[slot + 1:]]
+        ready += [(i, left - (rounds + 1) * time_quantum) for i, left in entries[:slot]]
+        return SchedulerState(until, index, remaining - rounds * time_quantum - into,
+                              ready[:limit], len(entries) - 1, finished)
+    
+    @staticmethod
+    def priority_non_preemptive(processes):
+        """Priority Scheduling - Non-preemptive"""
+        return SchedulingAlgorithm.run("Priority (Non-preemptive)", processes)
+    
+    @staticmethod
+    def _run_non_preemptive(table, key, driver):
+        """Heap-based engine shared by the non-preemptive algorithms.
+        
+        Arrivals are consumed through a cursor over the arrival-sorted
+        processes and pushed onto a min-heap ordered by ``key(index)``. Ties
+        are broken by the dispatch at which a process joined the ready queue
+        and then by input position, matching the order the old list-based
+        ready queue gave to ``min()``.
+        """
+        arrival, burst = table.arrival, table.burst
+        timeline, completed, arrivals = driver.timeline, driver.completed, driver.arrivals
+        resume, until, limit, every = driver.resume, driver.until, driver.limit, driver.checkpoint_every
+        n = len(table)
+        current_time = resume.time
+        next_arrival = resume.admitted
+        ready_queue = list(resume.ready)
+        dispatch = resume.dispatch
+        finished = resume.completed
+        steps = 0
+        
+        while finished < n:
+            steps += 1
+            if steps == every:
+                steps = 0
+                if driver.at_checkpoint(current_time, next_arrival, ready_queue, dispatch, 0):
+                    return
+            
+            # Add arrived processes to ready queue
+            while next_arrival < len(arrivals) and arrival[arrivals[next_arrival]] <= current_time:
+                index = arrivals[next_arrival]
+                heapq.heappush(ready_queue, (key(index), dispatch, index))
+                next_arrival += 1
+            dispatch += 1
+            
+            if not ready_queue:
+                if until is not None and arrival[arrivals[next_arrival]] > until:
+                    return SchedulerState(until, None, 0, [], 0, finished)
+                current_time = arrival[arrivals[next_arrival]]
+                continue
+            
+            _, _, index = heapq.heappop(ready_queue)
+            
+            if until is not None and until < current_time + burst[index]:
+                # Processes arriving during the burst join the queue when it ends
+                end = _arrived(arrival, arrivals, next_arrival, until)
+                entries = heapq.nsmallest(limit, ready_queue) if limit is not None else sorted(ready_queue)
+                entries += [(key(i), dispatch, i) for i in arrivals[next_arrival:end]]
+                entries.sort()
+                ready = [(i, burst[i]) for _, _, i in entries[:limit]]
+                return SchedulerState(until, index, current_time + burst[index] - until,
+                                      ready, len(ready_queue) + end - next_arrival, finished)
+            
+            table.start[index] = current_time
+            table.complete(index, current_time + burst[index])
+            timeline.append(index, current_time, current_time + burst[index])
+            
+            current_time += burst[index]
+            completed.append(index)
+            finished += 1
+        
+        if until is not None:
+            return SchedulerState(until, None, 0, [], 0, finished)
+    
+    @staticmethod
+    def priority_preemptive(processes, coalesce=True):
+        """Priority Scheduling - Preemptive"""
+        return SchedulingAlgorithm.run("Priority (Preemptive)", processes, coalesce=coalesce)
+    
+    @staticmethod
+    def _run_preemptive(table, key, driver, coalesce=True):
+        """Event-driven engine shared by the preemptive algorithms.
+        
+        Instead of stepping the clock one unit at a time, it jumps straight to
+        the next arrival or completion, since the running process can only be
+        displaced when something new arrives. Ready processes sit in a heap
+        of (key(index, remaining time), index, remaining time) entries, so
+        they are ordered by key and then by input position, which is the
+        same tie-breaking the old ``min()`` over the process list gave.
+        
+        With ``coalesce`` (the default) an uninterrupted run of one process is
+        a single timeline block; otherwise one block per time unit is emitted,
+        which is the raw view useful for teaching.
+        """
+        arrival, burst = table.arrival, table.burst
+        timeline, completed, arrivals = driver.timeline, driver.completed, driver.arrivals
+        resume, until, limit, every = driver.resume, driver.until, driver.limit, driver.checkpoint_every
+        n = len(table)
+        current_time = resume.time
+        next_arrival = resume.admitted
+        ready_queue = list(resume.ready)
+        finished = resume.completed
+        steps = 0
+        
+        while finished < n:
+            steps += 1
+            if steps == every:
+                steps = 0
+                if driver.at_checkpoint(current_time, next_arrival, ready_queue, 0, 0):
+                    return
+            
+            # Add arrived processes to ready queue
+            while next_arrival < len(arrivals) and arrival[arrivals[next_arrival]] <= current_time:
+                index = arrivals[next_arrival]
+                heapq.heappush(ready_queue, (key(index, burst[index]), index, burst[index]))
+                next_arrival += 1
+            
+            if not ready_queue:
+                if until is not None and arrival[arrivals[next_arrival]] > until:
+                    return SchedulerState(until, None, 0, [], 0, finished)
+                # CPU is idle until the next arrival
+                current_time = arrival[arrivals[next_arrival]]
+                continue
+            
+            _, index, remaining = heapq.heappop(ready_queue)
+            
+            # Run until the process finishes or the next arrival may preempt it
+            run_until = current_time + remaining
+            if next_arrival < len(arrivals):
+                run_until = min(run_until, arrival[arrivals[next_arrival]])
+            
+            if until is not None and until < run_until:
+                entries = heapq.nsmallest(limit, ready_queue) if limit is not None else sorted(ready_queue)
+                return SchedulerState(until, index, remaining - (until - current_time),
+                                      [(i, left) for _, i, left in entries], len(ready_queue), finished)
+            
+            if table.start[index] == -1:
+                table.start[index] = current_time
+            
+            if coalesce:
+                timeline.append(index, current_time, run_until, coalesce=True)
+            else:
+                for t in range(current_time, run_until):
+                    timeline.append(index, t, t + 1)
+            
+            remaining -= run_until - current_time
+            current_time = run_until
+            
+            if remaining == 0:
+                table.complete(index, current_time)
+                completed.append(index)
+                finished += 1
+            else:
+                heapq.heappush(ready_queue, (key(index, remaining), index, remaining))
+        
+        if until is not None:
+            return SchedulerState(until, None, 0, [], 0, finished)
+    
+    @staticmethod
+    def _as_table(processes):
+        """Return a ProcessTable with fresh result columns for the given input
+        
+        A list of Process objects is read into a new table, so the objects
+        themselves are never touched.
+        """
+        if isinstance(processes, ProcessTable):
+            processes.reset_results()
+            return processes
+        return ProcessTable.from_processes(processes)
@@ -0,0 +1,143 @@
+import os
+from array import array
+from itertools import repeat
+
+from .algorithms import SchedulingAlgorithm, metric_names
+from .cache import workload_key
+from .process import ProcessTable
+
+class MetricsTable:
+    """Columnar metrics from simulate_batch, one row per (workload, algorithm) pair
+    
+    ``workload`` and ``config`` index into the input workloads and
+    ``configs`` (a list of (algorithm, time_quantum) pairs); every metric is
+    an array('d') column in ``columns``. Iterating yields one dict per row.
+    """
+    def __init__(self, configs, names):
+        self.configs = configs
+        self.workload = array('q')
+        self.config = array('i')
+        self.columns = {name: array('d') for name in names}
+    
+    def append(self, workload, config, metrics):
+        """Add the metrics of one (workload, config) pair"""
+        self.workload.append(workload)
+        self.config.append(config)
+        for name, column in self.columns.items():
+            column.append(metrics[name])
+    
+    def __len__(self):
+        return len(self.workload)
+    
+    def row(self, index):
+        """One row as a dict"""
+        algorithm, time_quantum = self.configs[self.config[index]]
+        row = {'workload': self.workload[index], 'algorithm': algorithm, 'time_quantum': time_quantum}
+        for name, column in self.columns.items():
+            row[name] = column[index]
+        return row
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.row(index)
+
+def _algorithm_config(config):
+    """Normalize an algorithm name or (name, time_quantum) pair"""
+    if isinstance(config, str):
+        config = (config, 2 if config == "Round Robin" else None)
+    algorithm, time_quantum = config
+    if algorithm not in SchedulingAlgorithm.ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if algorithm == "Round Robin" and (time_quantum is None or time_quantum <= 0):
+        raise ValueError("Round Robin needs a positive time quantum")
+    return algorithm, time_quantum
+
+def _simulate_chunk(chunk, configs, percentiles, keep_results=False):
+    """Worker body of simulate_batch: the given configs over a chunk of workloads
+    
+    ``chunk`` holds (workload index, workload, config indices) triples.
+    With ``keep_results`` each row also carries the ScheduleResult, for
+    simulate_batch to cache.
+    """
+    rows = []
+    for workload_index, workload, config_indices in chunk:
+        table = workload if isinstance(workload, ProcessTable) else ProcessTable.from_processes(workload)
+        for config_index in config_indices:
+            algorithm, time_quantum = configs[config_index]
+            result = SchedulingAlgorithm.run(algorithm, table, time_quantum)
+            rows.append((workload_index, config_index, result.metrics(percentiles), result if keep_results else None))
+    return rows
+
+def simulate_batch(workloads, algorithms, workers=None, chunksize=None, percentiles=(50, 95, 99), cache=None):
+    """Run every workload under every algorithm configuration
+    
+    ``workloads`` is a sequence of process lists or ProcessTables and
+    ``algorithms`` a list of algorithm names or (name, time_quantum) pairs,
+    e.g. ["FCFS", ("Round Robin", 2), ("Round Robin", 8)]. Workloads are
+    split into chunks that are scheduled across ``workers`` processes (one per
+    CPU by default; 1 runs everything in this process). Returns a
+    MetricsTable with one row per (workload, algorithm) pair, ordered by
+    workload and then by algorithm.
+    
+    Runs are identified by workload_key, so a workload repeated in the batch
+    is only scheduled once per configuration. With a ResultCache as
+    ``cache``, runs it already holds are not scheduled at all and new ones
+    are added to it.
+    """
+    configs = [_algorithm_config(config) for config in algorithms]
+    metrics = MetricsTable(configs, metric_names(percentiles))
+    
+    # One key per (workload, config); only the first occurrence of a key is scheduled
+    keys = []
+    known = {}
+    pending = []
+    for workload_index, workload in enumerate(workloads):
+        table = workload if isinstance(workload, ProcessTable) else ProcessTable.from_processes(workload)
+        row_keys = [workload_key(algorithm, table, time_quantum) for algorithm, time_quantum in configs]
+        keys.append(row_keys)
+        
+        config_indices = []
+        for config_index, key in enumerate(row_keys):
+            if key in known:
+                continue
+            if cache is not None:
+                result = cache.get(key, table)
+                if result is not None:
+                    known[key] = result.metrics(percentiles)
+                    continue
+            known[key] = None
+            config_indices.append(config_index)
+        if config_indices:
+            pending.append((workload_index, table, config_indices))
+    
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(pending) // (workers * 4))
+    chunks = [pending[i:i + chunksize] for i in range(0, len(pending), chunksize)]
+    keep_results = cache is not None
+    
+    if workers == 1 or len(chunks) <= 1:
+        results = map(_simulate_chunk, chunks, repeat(configs), repeat(percentiles), repeat(keep_results))
+        _collect(results, configs, keys, known, cache)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_simulate_chunk, chunks, repeat(configs), repeat(percentiles), repeat(keep_results))
+            _collect(results, configs, keys, known, cache)
+    
+    for workload_index, row_keys in enumerate(keys):
+        for config_index, key in enumerate(row_keys):
+            metrics.append(workload_index, config_index, known[key])
+    
+    return metrics
+
+def _collect(results, configs, keys, known, cache):
+    """Record the metrics of scheduled runs by key, caching the results if asked"""
+    for rows in results:
+        for workload_index, config_index, run_metrics, result in rows:
+            key = keys[workload_index][config_index]
+            known[key] = run_metrics
+            if cache is not None:
+                algorithm, time_quantum = configs[config_index]
+                cache.put(key, result, algorithm, time_quantum or 0)
@@ -0,0 +1,182 @@
+import hashlib
+import os
+from array import array
+from collections import OrderedDict
+
+from .algorithms import ScheduleResult, SchedulingAlgorithm
+from .process import ProcessTable
+from .timeline import Timeline
+from .trace import TRACE_SUFFIX, TraceError, TraceFile, _little_endian, write_trace
+
+# Memory budget of a ResultCache unless one is given
+DEFAULT_MAX_BYTES = 256 << 20
+
+# Algorithms whose timeline depends on coalescing; the others emit whole bursts anyway
+_COALESCING = {"SJF (Preemptive)", "Round Robin", "Priority (Preemptive)"}
+
+def workload_key(algorithm, processes, time_quantum=2, coalesce=True):
+    """Hex digest identifying a scheduling run by everything its outcome depends on
+    
+    That is the algorithm, the arrival and burst columns, the priorities for
+    priority algorithms, the quantum for Round Robin and coalescing for
+    preemptive algorithms. Pids are left out since schedules never depend on
+    them, so renamed copies of a workload share a key.
+    """
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(algorithm.encode('utf-8'))
+    digest.update(b'\0')
+    if algorithm == "Round Robin":
+        digest.update(b'quantum=%d\0' % time_quantum)
+    if algorithm in _COALESCING:
+        digest.update(b'coalesce=%d\0' % bool(coalesce))
+    digest.update(b'n=%d\0' % len(table))
+    digest.update(_little_endian(table.arrival))
+    digest.update(_little_endian(table.burst))
+    if "Priority" in algorithm:
+        digest.update(_little_endian(table.priority))
+    return digest.hexdigest()
+
+class _CachedRun:
+    """Result columns of one run, shared by every ScheduleResult rebuilt from it"""
+    __slots__ = ('start', 'finish', 'tat', 'wt', 'order', 'process_index', 'starts', 'ends', 'nbytes')
+    
+    def __init__(self, result):
+        self.start = result.start
+        self.finish = result.finish
+        self.tat = result.tat
+        self.wt = result.wt
+        self.order = array('i', result.order)
+        timeline = result.timeline
+        self.process_index = timeline.process_index
+        self.starts = timeline.starts
+        self.ends = timeline.ends
+        self.nbytes = sum(
+            column.itemsize * len(column)
+            for column in (self.start, self.finish, self.tat, self.wt, self.order,
+                           self.process_index, self.starts, self.ends)
+        )
+    
+    def result(self, table):
+        """A ScheduleResult for ``table`` that shares the cached columns"""
+        table.start, table.finish, table.tat, table.wt = self.start, self.finish, self.tat, self.wt
+        timeline = Timeline(table)
+        timeline.process_index, timeline.starts, timeline.ends = self.process_index, self.starts, self.ends
+        return ScheduleResult(table, self.order, timeline)
+
+class ResultCache:
+    """Content-addressed LRU cache of scheduling results
+    
+    Runs are keyed by workload_key. Up to ``max_bytes`` of result columns
+    are kept in memory, evicting the least recently used runs first; with a
+    ``directory`` every run is also written there as a binary trace, which
+    outlives the process and is read back (and promoted to memory) on a
+    memory miss. ``max_disk_bytes`` bounds that directory, removing the
+    least recently used traces. Cached columns are shared by every result
+    handed out, so results from a cache must be treated as read-only (every
+    engine allocates fresh columns before a run, so rerunning is safe).
+    """
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None, max_disk_bytes=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, key):
+        return key in self._entries or (self.directory is not None and os.path.exists(self._path(key)))
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key + TRACE_SUFFIX)
+    
+    def get(self, key, processes):
+        """The cached run ``key`` as a ScheduleResult for ``processes``, or None
+        
+        ``processes`` is the workload the key was computed from, as a
+        ProcessTable (which gets the cached result columns) or a list of
+        Process objects.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            entry = self._load(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return entry.result(SchedulingAlgorithm._as_table(processes))
+    
+    def put(self, key, result, algorithm, time_quantum=0, coalesce=True):
+        """Remember the result of run ``key``, and save it to the disk tier if there is one"""
+        entry = _CachedRun(result)
+        self._remember(key, entry)
+        if self.directory is not None and not os.path.exists(self._path(key)):
+            partial = self._path(key) + '.part'
+            write_trace(partial, result, algorithm, time_quantum, coalesced=coalesce)
+            os.replace(partial, self._path(key))
+            self._trim_disk()
+    
+    def run(self, algorithm, processes, time_quantum=2, coalesce=True):
+        """SchedulingAlgorithm.run, answered from the cache when the same run was seen before"""
+        key = workload_key(algorithm, processes, time_quantum, coalesce)
+        result = self.get(key, processes)
+        if result is None:
+            result = SchedulingAlgorithm.run(algorithm, processes, time_quantum, coalesce=coalesce)
+            self.put(key, result, algorithm, time_quantum, coalesce)
+        return result
+    
+    def clear(self):
+        """Forget every run held in memory; the disk tier is kept"""
+        self._entries.clear()
+        self.bytes = 0
+    
+    def _remember(self, key, entry):
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key).nbytes
+        if entry.nbytes > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.bytes += entry.nbytes
+        while self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.nbytes
+    
+    def _load(self, key):
+        """Read a run back from the disk tier, or None"""
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with TraceFile(path) as trace:
+                result = trace.result()
+        except (OSError, TraceError):
+            return None
+        os.utime(path)  # Most recently used, for _trim_disk
+        return _CachedRun(result)
+    
+    def _trim_disk(self):
+        """Remove the least recently used traces while the directory is over budget"""
+        if self.max_disk_bytes is None:
+            return
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(TRACE_SUFFIX):
+                stat = os.stat(os.path.join(self.directory, name))
+                files.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
@@ -0,0 +1,242 @@
+import argparse
+import csv
+import sys
+from contextlib import ExitStack
+
+from .algorithms import SchedulingAlgorithm
+from .stream import RunningMetrics, Segment, iter_schedule
+from .trace import TraceError, TraceFile, write_trace
+from .workload import WorkloadError, WorkloadReader, load_workload
+
+# Short names accepted by --algorithm, next to the GUI display names
+ALGORITHM_ALIASES = {
+    'fcfs': "FCFS",
+    'sjf': "SJF (Non-preemptive)",
+    'srtf': "SJF (Preemptive)",
+    'sjf-p': "SJF (Preemptive)",
+    'rr': "Round Robin",
+    'priority': "Priority (Non-preemptive)",
+    'priority-p': "Priority (Preemptive)",
+}
+
+RESULT_HEADER = [
+    'Process ID', 'Arrival Time', 'Burst Time', 'Priority',
+    'Start Time', 'Finish Time', 'Turnaround Time', 'Waiting Time'
+]
+TIMELINE_HEADER = ['Process ID', 'Start', 'End']
+
+# Skipped rows beyond this many are only counted, not printed
+MAX_REPORTED_ERRORS = 20
+
+def build_parser():
+    """Command line parser for ``python -m scheduler_engine``"""
+    parser = argparse.ArgumentParser(
+        prog='python -m scheduler_engine',
+        description="Headless CPU scheduling simulator"
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    simulate = commands.add_parser('simulate', help="schedule one workload file and write the results")
+    simulate.add_argument('--workload', required=True,
+                          help="CSV or JSONL file, optionally gzipped, with arrival and burst columns "
+                               "(pid and priority are optional)")
+    simulate.add_argument('--algorithm', default='fcfs',
+                          help=f"one of {', '.join(ALGORITHM_ALIASES)} or a GUI algorithm name (default: fcfs)")
+    simulate.add_argument('--quantum', type=int, default=2, help="time quantum for Round Robin (default: 2)")
+    simulate.add_argument('--per-tick', action='store_true',
+                          help="emit one timeline block per time unit instead of coalescing runs")
+    simulate.add_argument('--stream', action='store_true',
+                          help="read the workload in batches and write results as they are produced; "
+                               "rows must be sorted by arrival and results are written in completion order")
+    simulate.add_argument('--skip-bad-rows', action='store_true',
+                          help="skip malformed rows and report their line numbers instead of stopping")
+    simulate.add_argument('--out', help="write per-process results to this CSV file")
+    simulate.add_argument('--timeline', help="write the timeline blocks to this CSV file")
+    simulate.add_argument('--metrics', help="write the summary metrics to this CSV file")
+    simulate.add_argument('--trace', help="write the whole run to this binary trace file (not with --stream)")
+    
+    trace = commands.add_parser('trace', help="summarise a binary trace file written by simulate --trace")
+    trace.add_argument('path', help="trace file")
+    trace.add_argument('--from', dest='start', type=int, help="start of the time window to export")
+    trace.add_argument('--to', dest='end', type=int, help="end of the time window to export")
+    trace.add_argument('--timeline', help="write the segments of the time window to this CSV file")
+    return parser
+
+def result_rows(result):
+    """Per-process result rows in input order"""
+    table = result.table
+    for index in range(len(table)):
+        yield [
+            table.pid(index), table.arrival[index], table.burst[index], table.priority[index],
+            result.start[index], result.finish[index], result.tat[index], result.wt[index]
+        ]
+
+def timeline_rows(timeline):
+    """Timeline rows in time order"""
+    processes = timeline.processes
+    for index, start, end in zip(timeline.process_index, timeline.starts, timeline.ends):
+        yield [processes.pid(index), start, end]
+
+def write_results(path, result):
+    """Per-process results, one row per process in input order"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_HEADER)
+        writer.writerows(result_rows(result))
+
+def write_timeline(path, timeline):
+    """Timeline blocks in time order"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(TIMELINE_HEADER)
+        writer.writerows(timeline_rows(timeline))
+
+def _open_writer(files, path, header):
+    """CSV writer for ``path`` registered on an ExitStack, or None without a path"""
+    if not path:
+        return None
+    writer = csv.writer(files.enter_context(open(path, 'w', newline='')))
+    writer.writerow(header)
+    return writer
+
+def write_metrics(path, algorithm, metrics):
+    """Summary metrics as name/value rows"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Metric', 'Value'])
+        writer.writerow(['algorithm', algorithm])
+        for name, value in metrics.items():
+            writer.writerow([name, value])
+
+def report_skipped(path, errors):
+    """Print the rows skipped with --skip-bad-rows to stderr"""
+    for error in errors[:MAX_REPORTED_ERRORS]:
+        print(f"warning: {path}: {error}", file=sys.stderr)
+    if len(errors) > MAX_REPORTED_ERRORS:
+        print(f"warning: {path}: {len(errors) - MAX_REPORTED_ERRORS} more malformed rows", file=sys.stderr)
+    if errors:
+        print(f"warning: skipped {len(errors)} malformed rows", file=sys.stderr)
+
+def print_summary(algorithm, count, metrics):
+    """Summary printed at the end of ``simulate``"""
+    print(f"Algorithm: {algorithm}")
+    print(f"Processes: {count}")
+    print(f"Average Turnaround Time: {metrics['avg_tat']:.2f}")
+    print(f"Average Waiting Time: {metrics['avg_wt']:.2f}")
+    print(f"Throughput: {metrics['throughput']:.3f} processes/unit")
+    print(f"Makespan: {metrics['makespan']}")
+
+def simulate(args):
+    """The ``simulate`` command"""
+    algorithm = ALGORITHM_ALIASES.get(args.algorithm.lower(), args.algorithm)
+    if algorithm not in SchedulingAlgorithm.ALGORITHMS:
+        print(f"error: unknown algorithm '{args.algorithm}'", file=sys.stderr)
+        return 2
+    if args.quantum <= 0:
+        print("error: --quantum must be positive", file=sys.stderr)
+        return 2
+    if args.stream:
+        if args.trace:
+            print("error: --trace needs the whole run and cannot be combined with --stream", file=sys.stderr)
+            return 2
+        return simulate_stream(args, algorithm)
+    
+    errors = [] if args.skip_bad_rows else None
+    try:
+        table = load_workload(args.workload, errors)
+    except (OSError, WorkloadError) as e:
+        print(f"error: {args.workload}: {e}", file=sys.stderr)
+        return 1
+    
+    result = SchedulingAlgorithm.run(algorithm, table, args.quantum, coalesce=not args.per_tick)
+    metrics = result.metrics()
+    
+    if args.out:
+        write_results(args.out, result)
+    if args.timeline:
+        write_timeline(args.timeline, result.timeline)
+    if args.metrics:
+        write_metrics(args.metrics, algorithm, metrics)
+    if args.trace:
+        write_trace(args.trace, result, algorithm, args.quantum, coalesced=not args.per_tick)
+    
+    report_skipped(args.workload, errors or [])
+    print_summary(algorithm, len(table), metrics)
+    return 0
+
+def simulate_stream(args, algorithm):
+    """``simulate --stream``: schedule the workload as it is read, in bounded memory
+    
+    Only averages, throughput and makespan are reported, since percentiles
+    would need every result kept in memory.
+    """
+    errors = [] if args.skip_bad_rows else None
+    running = RunningMetrics()
+    try:
+        with ExitStack() as files:
+            results = _open_writer(files, args.out, RESULT_HEADER)
+            timeline = _open_writer(files, args.timeline, TIMELINE_HEADER)
+            
+            reader = WorkloadReader(args.workload, errors=errors)
+            for event in iter_schedule(algorithm, reader, args.quantum, coalesce=not args.per_tick):
+                if type(event) is Segment:
+                    if timeline is not None:
+                        timeline.writerow([event.pid, event.start, event.end])
+                    continue
+                
+                running.add(event)
+                if results is not None:
+                    tat = event.finish - event.arrival
+                    results.writerow([
+                        event.pid, event.arrival, event.burst, event.priority,
+                        event.start, event.finish, tat, tat - event.burst
+                    ])
+    except (OSError, WorkloadError) as e:
+        print(f"error: {args.workload}: {e}", file=sys.stderr)
+        return 1
+    
+    metrics = running.metrics()
+    if args.metrics:
+        write_metrics(args.metrics, algorithm, metrics)
+    
+    report_skipped(args.workload, errors or [])
+    print_summary(algorithm, running.count, metrics)
+    return 0
+
+def show_trace(args):
+    """The ``trace`` command: print a trace header and export a time window"""
+    try:
+        trace = TraceFile(args.path)
+    except (OSError, TraceError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    
+    with trace:
+        print(f"Algorithm: {trace.algorithm}")
+        if trace.algorithm == "Round Robin":
+            print(f"Time Quantum: {trace.time_quantum}")
+        print(f"Processes: {trace.process_count}")
+        print(f"Segments: {trace.segment_count}{'' if trace.coalesced else ' (per tick)'}")
+        print(f"Makespan: {trace.makespan()}")
+        
+        if args.timeline:
+            start = args.start if args.start is not None else 0
+            end = args.end if args.end is not None else trace.makespan() + 1
+            rows = trace.window(start, end)
+            with open(args.timeline, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(TIMELINE_HEADER)
+                for row in rows:
+                    index, block_start, block_end = trace.segment(row)
+                    writer.writerow([trace.pid(index), block_start, block_end])
+            print(f"Wrote {len(rows)} segments between {start} and {end}")
+    return 0
+
+def main(argv=None):
+    """Entry point of ``python -m scheduler_engine``; returns the exit status"""
+    args = build_parser().parse_args(argv)
+    if args.command == 'simulate':
+        return simulate(args)
+    if args.command == 'trace':
+        return show_trace(args)
+    return 2
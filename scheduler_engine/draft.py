@@ -0,0 +1,192 @@
+import random
+import re
+from array import array
+
+from .algorithms import load_numpy
+from .process import ProcessTable
+from .workload import WorkloadError, _column_positions
+
+# Columns of a draft, in the order they are shown and pasted
+DRAFT_COLUMNS = ('arrival', 'burst', 'priority')
+
+# Stored in a column for an empty cell
+BLANK = -1 << 63
+
+# Cells of one pasted line: tabs (spreadsheets), commas, semicolons or spaces
+_CELL_SEPARATOR = re.compile(r'\t|\s*[,;]\s*|\s+')
+
+class DraftError(ValueError):
+    """A draft cannot become a ProcessTable; ``row`` is the first bad row, ``count`` the number of bad rows"""
+    def __init__(self, message, row, count):
+        super().__init__(message)
+        self.row = row
+        self.count = count
+
+class WorkloadDraft:
+    """Workload being edited, with room for empty and mistyped cells
+    
+    Arrival, burst and priority are int64 columns like a ProcessTable's;
+    an empty cell holds BLANK and text that is not a whole number is kept
+    in ``invalid`` by (row, column) so the editor can show it back. Cells
+    are written one at a time, by pasting a block of text or by importing
+    a table, and ``to_table`` checks every row at once (with NumPy when it
+    is installed) before handing out a ProcessTable.
+    """
+    def __init__(self, size=0):
+        self.arrival = array('q', [BLANK]) * size
+        self.burst = array('q', [BLANK]) * size
+        self.priority = array('q', [BLANK]) * size
+        self.pids = None
+        self.invalid = {}
+    
+    def __len__(self):
+        return len(self.arrival)
+    
+    def pid(self, row):
+        """Process ID of the process in ``row``"""
+        return self.pids[row] if self.pids is not None else f"P{row + 1}"
+    
+    def resize(self, size):
+        """Add empty rows or drop rows from the end so that there are ``size``"""
+        n = len(self)
+        for column in DRAFT_COLUMNS:
+            values = getattr(self, column)
+            if size < n:
+                del values[size:]
+            else:
+                values.extend(array('q', [BLANK]) * (size - n))
+        if self.pids is not None:
+            del self.pids[size:]
+            self.pids.extend(f"P{row + 1}" for row in range(len(self.pids), size))
+        if size < n:
+            self.invalid = {cell: text for cell, text in self.invalid.items() if cell[0] < size}
+    
+    def text(self, row, column):
+        """Text of a cell as the user should see it"""
+        text = self.invalid.get((row, column))
+        if text is not None:
+            return text
+        value = getattr(self, column)[row]
+        return '' if value == BLANK else str(value)
+    
+    def is_invalid(self, row, column):
+        """True if the cell holds text that is not a whole number"""
+        return (row, column) in self.invalid
+    
+    def set_text(self, row, column, text):
+        """Write one cell; text that is not a whole number is kept as typed"""
+        text = text.strip()
+        self.invalid.pop((row, column), None)
+        try:
+            value = int(text) if text else BLANK
+        except ValueError:
+            self.invalid[row, column] = text
+            value = BLANK
+        getattr(self, column)[row] = value
+    
+    def paste(self, row, column, text):
+        """Write a block of pasted text starting at a cell; returns the number of rows written
+        
+        Lines become rows and tab, comma, semicolon or space separated cells
+        fill the columns from ``column`` onwards. A first line naming the
+        columns (as a workload file header does) places the cells by name
+        instead. The draft grows to take every line.
+        """
+        lines = [line for line in text.splitlines() if line.strip()]
+        if not lines:
+            return 0
+        
+        first = DRAFT_COLUMNS.index(column)
+        positions = {name: i for i, name in enumerate(DRAFT_COLUMNS[first:])}
+        header = _CELL_SEPARATOR.split(lines[0].strip())
+        if not any(cell.lstrip('-').isdigit() for cell in header):
+            try:
+                positions = _column_positions(header)
+                lines = lines[1:]
+            except WorkloadError:
+                pass
+        
+        if row + len(lines) > len(self):
+            self.resize(row + len(lines))
+        for offset, line in enumerate(lines):
+            cells = _CELL_SEPARATOR.split(line.strip())
+            for name, position in positions.items():
+                if position < len(cells):
+                    if name == 'pid':
+                        self._set_pid(row + offset, cells[position])
+                    else:
+                        self.set_text(row + offset, name, cells[position])
+        return len(lines)
+    
+    def _set_pid(self, row, pid):
+        if self.pids is None:
+            self.pids = [f"P{i + 1}" for i in range(len(self))]
+        self.pids[row] = pid
+    
+    def clear(self):
+        """Empty every cell, keeping the number of rows"""
+        self.invalid = {}
+        self.pids = None
+        for column in DRAFT_COLUMNS:
+            values = getattr(self, column)
+            values[:] = array('q', [BLANK]) * len(values)
+    
+    def fill_random(self, with_priority=True):
+        """Fill every row with random arrival (0-10), burst (1-10) and priority (1-5) values"""
+        n = len(self)
+        self.invalid = {}
+        self.arrival = array('q', random.choices(range(0, 11), k=n))
+        self.burst = array('q', random.choices(range(1, 11), k=n))
+        if with_priority:
+            self.priority = array('q', random.choices(range(1, 6), k=n))
+    
+    def load_table(self, table):
+        """Replace the draft with the processes of a ProcessTable"""
+        self.arrival = array('q', table.arrival)
+        self.burst = array('q', table.burst)
+        self.priority = array('q', table.priority)
+        self.pids = list(table.pids) if table.pids is not None else None
+        self.invalid = {}
+    
+    def bad_rows(self, with_priority=True):
+        """Sorted rows that cannot be scheduled
+        
+        A row is bad when its arrival is empty or negative, its burst is
+        empty or not positive, or one of its cells is not a whole number.
+        Priority cells only count ``with_priority``; an empty priority is 0.
+        """
+        np = load_numpy()
+        if np is not None:
+            arrival = np.frombuffer(self.arrival, dtype=np.int64)
+            burst = np.frombuffer(self.burst, dtype=np.int64)
+            bad = set(np.flatnonzero((arrival < 0) | (burst <= 0)).tolist())
+        else:
+            bad = {row for row, (at, bt) in enumerate(zip(self.arrival, self.burst)) if at < 0 or bt <= 0}
+        
+        bad.update(row for row, column in self.invalid if with_priority or column != 'priority')
+        return sorted(bad)
+    
+    def to_table(self, with_priority=True):
+        """The draft as a ProcessTable, or DraftError naming the first bad row
+        
+        Without ``with_priority`` every priority is 0, as when the GUI hides
+        the priority column.
+        """
+        bad = self.bad_rows(with_priority)
+        if bad:
+            message = f"Process {self.pid(bad[0])}: Times must be non-negative whole numbers and burst time > 0"
+            if len(bad) > 1:
+                message += f" ({len(bad)} processes have errors)"
+            raise DraftError(message, bad[0], len(bad))
+        
+        if with_priority:
+            priority = array('q', self.priority)
+            np = load_numpy()
+            if np is not None:
+                values = np.frombuffer(priority, dtype=np.int64)
+                values[values == BLANK] = 0
+            else:
+                priority = array('q', [0 if value == BLANK else value for value in priority])
+        else:
+            priority = None
+        return ProcessTable(self.arrival, self.burst, priority, self.pids)
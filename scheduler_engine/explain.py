@@ -0,0 +1,209 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Kinds of explanation event; at equal times arrivals come first, then starts, then ends
+ARRIVAL, START, END = 0, 1, 2
+
+_VERBS = {
+    ARRIVAL: "arrived",
+    START: "started executing",
+    END: "finished executing",
+}
+
+class Explanation:
+    """Step-by-step account of a run, produced lazily from its timeline
+    
+    The events are every arrival plus the start and end of every timeline
+    block, in time order. Arrivals are sorted once; starts and ends are
+    already in time order in the timeline, so the three are merged on the
+    fly and nothing is stored per event. Items are numbered: first the
+    events, then one Final Results line per process. Any position, and the
+    first event at any time, is found with binary searches, so a page
+    anywhere in the run is as cheap as the first one.
+    
+    ``table`` is a ProcessTable with results (or anything with the same
+    columns and ``pid``) and ``timeline`` a Timeline or TraceFile of it.
+    """
+    def __init__(self, algorithm, table, timeline):
+        self.algorithm = algorithm
+        self.table = table
+        self.timeline = timeline
+        self.arrival_order = array('i', sorted(range(len(table)), key=table.arrival.__getitem__))
+        self.arrival_times = array('q', map(table.arrival.__getitem__, self.arrival_order))
+        self.event_count = len(table) + 2 * len(timeline)
+    
+    def __len__(self):
+        return self.event_count + len(self.table)
+    
+    def _before(self, time):
+        """Number of events earlier than ``time``"""
+        return (bisect_left(self.arrival_times, time)
+                + bisect_left(self.timeline.starts, time, 0, len(self.timeline))
+                + bisect_left(self.timeline.ends, time, 0, len(self.timeline)))
+    
+    def position_at(self, time):
+        """Position of the first event at or after ``time``"""
+        return self._before(time)
+    
+    def cursor(self, position):
+        """(arrivals, starts, ends) passed before event ``position``"""
+        position = max(0, min(position, self.event_count))
+        starts, ends = self.timeline.starts, self.timeline.ends
+        blocks = len(self.timeline)
+        
+        # Latest time with no more than ``position`` events before it
+        low = 0
+        high = max(self.arrival_times[-1] if self.arrival_times else 0, ends[blocks - 1] if blocks else 0) + 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._before(middle) <= position:
+                low = middle
+            else:
+                high = middle - 1
+        
+        # The rest are events at that time: arrivals, then starts, then ends
+        left = position - self._before(low)
+        arrived = bisect_left(self.arrival_times, low)
+        taken = min(left, bisect_right(self.arrival_times, low) - arrived)
+        arrived, left = arrived + taken, left - taken
+        started = bisect_left(starts, low, 0, blocks)
+        taken = min(left, bisect_right(starts, low, 0, blocks) - started)
+        started, left = started + taken, left - taken
+        ended = bisect_left(ends, low, 0, blocks) + left
+        return arrived, started, ended
+    
+    def events(self, position=0):
+        """(time, kind, process index) of every event from ``position`` on"""
+        arrived, started, ended = self.cursor(position)
+        arrival_times, arrival_order = self.arrival_times, self.arrival_order
+        timeline = self.timeline
+        starts, ends, process_index = timeline.starts, timeline.ends, timeline.process_index
+        processes, blocks = len(arrival_times), len(timeline)
+        
+        while arrived < processes or started < blocks or ended < blocks:
+            # Three-way merge; ties go to the earlier kind
+            time, kind = (arrival_times[arrived], ARRIVAL) if arrived < processes else (None, None)
+            if started < blocks and (time is None or starts[started] < time):
+                time, kind = starts[started], START
+            if ended < blocks and (time is None or ends[ended] < time):
+                time, kind = ends[ended], END
+            
+            if kind == ARRIVAL:
+                yield time, kind, arrival_order[arrived]
+                arrived += 1
+            elif kind == START:
+                yield time, kind, process_index[started]
+                started += 1
+            else:
+                yield time, kind, process_index[ended]
+                ended += 1
+    
+    def event_line(self, time, kind, index):
+        """Text of one event"""
+        return f"Time {time}: Process {self.table.pid(index)} {_VERBS[kind]}"
+    
+    def result_line(self, index):
+        """Final Results text of one process"""
+        table = self.table
+        return (f"Process {table.pid(index)}: Arrival={table.arrival[index]}, Burst={table.burst[index]}, "
+                f"Start={table.start[index]}, Finish={table.finish[index]}, "
+                f"Turnaround={table.tat[index]}, Waiting={table.wt[index]}")
+    
+    def lines(self, first, count):
+        """(position, text) of items ``first`` to ``first + count`` with their headings
+        
+        Headings and the blank lines between groups of events at the same
+        time have None as position.
+        """
+        lines = []
+        if first == 0:
+            lines += [(None, f"Scheduling Algorithm: {self.algorithm}"), (None, "")]
+        
+        position = first
+        last = min(first + count, len(self))
+        if position < self.event_count:
+            # A blank line before each new time, the first one included when the page starts the run
+            previous_time = 0 if first == 0 else None
+            for time, kind, index in self.events(position):
+                if position >= last:
+                    break
+                if previous_time is not None and time > previous_time:
+                    lines.append((None, ""))
+                lines.append((position, self.event_line(time, kind, index)))
+                previous_time = time
+                position += 1
+        
+        if position == self.event_count and position < last:
+            lines += [(None, ""), (None, "Final Results:")]
+        for position in range(max(position, self.event_count), last):
+            lines.append((position, self.result_line(position - self.event_count)))
+        return lines
+    
+    def find(self, text, start=0):
+        """Position of the first item from ``start`` on that mentions ``text``, or None
+        
+        A process ID finds the next event or result of that process through
+        the timeline columns; any other text is looked for in the item
+        lines, ignoring case.
+        """
+        try:
+            index = self.table.index_of(text.strip())
+        except ValueError:
+            index = None
+        if index is not None:
+            return self._find_process(index, start)
+        
+        text = text.strip().lower()
+        if start < self.event_count:
+            for position, event in enumerate(self.events(start), start):
+                if text in self.event_line(*event).lower():
+                    return position
+        for position in range(max(start, self.event_count), len(self)):
+            if text in self.result_line(position - self.event_count).lower():
+                return position
+        return None
+    
+    def _find_process(self, index, start):
+        table, timeline = self.table, self.timeline
+        candidates = []
+        if start < self.event_count:
+            arrived, started, ended = self.cursor(start)
+            # Arrival event: its rank among the arrivals at that time, plus the blocks before it
+            time = table.arrival[index]
+            rank = bisect_left(self.arrival_times, time)
+            while self.arrival_order[rank] != index:
+                rank += 1
+            if rank >= arrived:
+                candidates.append(rank + self._blocks_before(time, 'starts') + self._blocks_before(time, 'ends'))
+            
+            row = _next_row(timeline.process_index, index, started)
+            if row is not None:
+                time = timeline.starts[row]
+                candidates.append(bisect_right(self.arrival_times, time) + row + self._blocks_before(time, 'ends'))
+            row = _next_row(timeline.process_index, index, ended)
+            if row is not None:
+                time = timeline.ends[row]
+                candidates.append(
+                    bisect_right(self.arrival_times, time)
+                    + bisect_right(timeline.starts, time, 0, len(timeline)) + row
+                )
+        if candidates:
+            return min(candidates)
+        
+        position = self.event_count + index
+        return position if position >= start else None
+    
+    def _blocks_before(self, time, column):
+        return bisect_left(getattr(self.timeline, column), time, 0, len(self.timeline))
+
+def _next_row(process_index, index, start):
+    """First timeline row from ``start`` on that ran process ``index``, or None"""
+    if isinstance(process_index, array):
+        try:
+            return process_index.index(index, start)
+        except ValueError:
+            return None
+    for row in range(start, len(process_index)):
+        if process_index[row] == index:
+            return row
+    return None
@@ -0,0 +1,245 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .algorithms import Checkpoint, ScheduleResult, SchedulerState, SchedulingAlgorithm, load_numpy
+from .timeline import Timeline
+
+# Scheduling steps between two checkpoints, at the least; a checkpoint also
+# waits for as many steps as there are processes in the ready queue it copies,
+# so that copying queues never costs more than the steps themselves
+CHECKPOINT_EVERY = 256
+
+# Above this many edited processes the unscheduled arrivals are sorted again
+# instead of moving each edited process to its new place
+_MAX_MOVES = 64
+
+class CheckpointedRun:
+    """Scheduling run that records checkpoints, so that edits can be rescheduled quickly
+    
+    ``run`` schedules the whole table like SchedulingAlgorithm.run (with
+    the same timeline and results) and keeps a Checkpoint every few steps.
+    ``rerun`` takes an edited copy of the table: nothing before the earliest
+    arrival of an edited process depends on the edit, so the run resumes
+    from the last checkpoint before it, reusing the timeline and results up
+    to there, and only the rest of the workload is scheduled again. Editing
+    a late process of a large workload therefore costs a few steps instead
+    of a full run.
+    
+    The scheduling itself is done by the SchedulingAlgorithm engines, with
+    the run as their driver: it supplies the arrival order, timeline and
+    completion order they extend, the checkpoint they resume from, and
+    takes the checkpoints they offer in ``at_checkpoint``.
+    """
+    def __init__(self, algorithm, table, time_quantum=2, coalesce=True, checkpoint_every=CHECKPOINT_EVERY):
+        if algorithm not in SchedulingAlgorithm.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.table = table
+        self.time_quantum = time_quantum
+        self.coalesce = coalesce
+        self.checkpoint_every = checkpoint_every
+        self.checkpoints = []
+        self.timeline = None
+        self.completed = None
+        self.result = None
+        self.resumed_from = None
+        self.arrivals = None
+        self._times = array('q')
+        # Engine driver state: where to start, when to stop, and steps since the last checkpoint
+        self.resume = None
+        self.until = None
+        self.limit = None
+        self.fast_forward = True
+        self.vectorize = True
+        self._steps = 0
+        self._progress = None
+    
+    def run(self, progress=None):
+        """Schedule the whole table and return the ScheduleResult
+        
+        ``progress`` is called with the run every ``checkpoint_every`` steps,
+        from the thread doing the work; an exception it raises stops the run.
+        """
+        table = self.table
+        table.reset_results()
+        self.arrivals = array('i', sorted(range(len(table)), key=table.arrival.__getitem__))
+        self.checkpoints = []
+        self._times = array('q')
+        self.resumed_from = None
+        self.timeline = Timeline(table)
+        self.completed = array('i')
+        self._save(0, 0, (), 0, 0)
+        return self._schedule(self.checkpoints[0], progress)
+    
+    def rerun(self, table, progress=None):
+        """Schedule ``table``, an edited copy of the last table, and return the ScheduleResult
+        
+        ``table`` must have the same number of processes; a new table is
+        needed (rather than the last one changed in place) because the
+        changed rows are found by comparing the two. ``resumed_from`` tells
+        the Checkpoint the run was resumed from.
+        """
+        old = self.table
+        if self.result is None or len(table) != len(old):
+            self.table = table
+            return self.run(progress)
+        
+        changed = _changed_rows(old, table, "Priority" in self.algorithm)
+        table.reset_results()
+        if changed:
+            earliest = min(min(old.arrival[i], table.arrival[i]) for i in changed)
+            # The first checkpoint, at time 0 with nothing decided, suits any edit
+            position = max(0, bisect_left(self._times, earliest) - 1)
+        else:
+            position = len(self.checkpoints) - 1
+        checkpoint = self.checkpoints[position]
+        del self.checkpoints[position + 1:]
+        del self._times[position + 1:]
+        self.resumed_from = checkpoint
+        
+        # Results of processes that started or finished before the checkpoint stay valid
+        self._copy_results(old, table, checkpoint)
+        timeline = Timeline(table)
+        timeline.process_index = self.timeline.process_index[:checkpoint.segments]
+        timeline.starts = self.timeline.starts[:checkpoint.segments]
+        timeline.ends = self.timeline.ends[:checkpoint.segments]
+        if checkpoint.segments:
+            timeline.ends[-1] = checkpoint.last_end
+        self.timeline = timeline
+        self.completed = self.completed[:checkpoint.completed]
+        
+        self.table = table
+        self._move_arrivals(changed, checkpoint.admitted)
+        return self._schedule(checkpoint, progress)
+    
+    def _copy_results(self, old, table, checkpoint):
+        finished = self.completed[:checkpoint.completed]
+        np = load_numpy()
+        if np is not None:
+            old_start = np.frombuffer(old.start, dtype=np.int64)
+            started = (old_start != -1) & (old_start < checkpoint.time)
+            np.frombuffer(table.start, dtype=np.int64)[started] = old_start[started]
+            rows = np.frombuffer(finished, dtype=np.intc)
+            for column in ('finish', 'tat', 'wt'):
+                np.frombuffer(getattr(table, column), dtype=np.int64)[rows] = np.frombuffer(getattr(old, column), dtype=np.int64)[rows]
+            return
+        
+        for index, start in enumerate(old.start):
+            if start != -1 and start < checkpoint.time:
+                table.start[index] = start
+        for index in finished:
+            table.finish[index] = old.finish[index]
+            table.tat[index] = old.tat[index]
+            table.wt[index] = old.wt[index]
+    
+    def _move_arrivals(self, changed, admitted):
+        """Put the edited processes back in arrival order, past the ``admitted`` ones"""
+        arrivals = self.arrivals
+        arrival = self.table.arrival
+        if len(changed) > _MAX_MOVES:
+            # Stable sorts: by position, then by arrival
+            arrivals[admitted:] = array('i', sorted(sorted(arrivals[admitted:]), key=arrival.__getitem__))
+            return
+        
+        for index in changed:
+            arrivals.remove(index)
+        for index in changed:
+            key = (arrival[index], index)
+            low, high = admitted, len(arrivals)
+            while low < high:
+                middle = (low + high) // 2
+                if (arrival[arrivals[middle]], arrivals[middle]) < key:
+                    low = middle + 1
+                else:
+                    high = middle
+            arrivals.insert(low, index)
+    
+    def _save(self, current_time, admitted, ready, dispatch, countdown):
+        timeline = self.timeline
+        self.checkpoints.append(Checkpoint(
+            current_time, admitted, tuple(ready), dispatch, countdown,
+            len(timeline), timeline.ends[-1] if len(timeline) else 0, len(self.completed)
+        ))
+        self._times.append(current_time)
+    
+    def at_checkpoint(self, current_time, admitted, ready, dispatch, countdown):
+        """Engine hook, every ``checkpoint_every`` steps: save a Checkpoint and report progress
+        
+        The checkpoint is skipped until enough steps have passed to pay for
+        copying ``ready``.
+        """
+        self._steps += self.checkpoint_every
+        if self._steps >= len(ready):
+            self._save(current_time, admitted, ready, dispatch, countdown)
+            self._steps = 0
+        if self._progress is not None:
+            self._progress(self)
+    
+    def _schedule(self, checkpoint, progress):
+        self.resume = checkpoint
+        self._steps = 0
+        self._progress = progress
+        try:
+            SchedulingAlgorithm._drive(self.algorithm, self.table, self, self.time_quantum, self.coalesce)
+        finally:
+            self._progress = None
+        self.result = ScheduleResult(self.table, self.completed, self.timeline)
+        return self.result
+    
+    def state_at(self, time, limit=None):
+        """SchedulerState at ``time``, rebuilt from the last checkpoint before it
+        
+        Only the steps between that checkpoint and ``time`` are replayed
+        (without touching the run's results), so the cost does not grow with
+        the length of the run. ``limit`` caps the ready processes listed.
+        """
+        if self.result is None:
+            raise ValueError("state_at needs a finished run")
+        if time < 0:
+            return SchedulerState(time, None, 0, [], 0, 0)
+        
+        replay = CheckpointedRun(self.algorithm, _ReplayTable(self.table), self.time_quantum, self.coalesce, 0)
+        replay.arrivals = self.arrivals
+        replay.timeline = Timeline(replay.table)
+        replay.completed = array('i')
+        replay.resume = self.checkpoints[bisect_right(self._times, time) - 1]
+        replay.until = time
+        replay.limit = limit
+        return SchedulingAlgorithm._drive(self.algorithm, replay.table, replay, self.time_quantum, self.coalesce)
+
+class _ReplayTable:
+    """Stand-in for the table of a run being replayed by state_at: same input columns, results thrown away"""
+    def __init__(self, table):
+        self.arrival = table.arrival
+        self.burst = table.burst
+        self.priority = table.priority
+        self.start = _Unstarted()
+        self._length = len(table)
+    
+    def __len__(self):
+        return self._length
+    
+    def complete(self, index, finish_time):
+        pass
+
+class _Unstarted(dict):
+    """Start times of a replay; processes not seen yet read as -1, as in a ProcessTable"""
+    def __missing__(self, index):
+        return -1
+
+def _changed_rows(old, new, with_priority):
+    """Sorted positions whose arrival or burst (and priority ``with_priority``) differ"""
+    columns = ['arrival', 'burst'] + (['priority'] if with_priority else [])
+    columns = [(getattr(old, name), getattr(new, name)) for name in columns if getattr(old, name) != getattr(new, name)]
+    if not columns:
+        return []
+    np = load_numpy()
+    if np is not None:
+        differs = np.zeros(len(new), dtype=bool)
+        for before, after in columns:
+            differs |= np.frombuffer(before, dtype=np.int64) != np.frombuffer(after, dtype=np.int64)
+        return np.flatnonzero(differs).tolist()
+    changed = set()
+    for before, after in columns:
+        changed.update(index for index, (a, b) in enumerate(zip(before, after)) if a != b)
+    return sorted(changed)
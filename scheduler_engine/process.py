@@ -0,0 +1,121 @@
+from array import array
+
+PROCESS_COLORS = (
+    '#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8',
+    '#F7DC6F', '#BB8FCE', '#85C1E2', '#F8B739', '#52B788',
+    '#E63946', '#F4A261', '#2A9D8F', '#264653', '#E76F51'
+)
+
+class Process:
+    """Process class to store process information"""
+    __slots__ = (
+        'pid', 'arrival_time', 'burst_time', 'remaining_time', 'priority',
+        'start_time', 'finish_time', 'turnaround_time', 'waiting_time', 'response_time', 'color'
+    )
+    
+    def __init__(self, pid, arrival_time, burst_time, priority=0, color=None):
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.remaining_time = burst_time
+        self.priority = priority
+        self.start_time = -1
+        self.finish_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+        self.response_time = 0
+        self.color = color if color is not None else self.generate_color()
+    
+    def generate_color(self):
+        """Generate a unique color for the process"""
+        return process_color(self.pid, 0)
+
+def process_color(pid, number):
+    """Color of process ``pid``: by its number for P<number> pids, else by ``number``"""
+    if pid[1:].isdigit():
+        number = int(pid[1:])
+    return PROCESS_COLORS[number % len(PROCESS_COLORS)]
+
+class ProcessTable:
+    """Struct-of-arrays storage for large workloads
+    
+    Arrival, burst and priority plus the scheduling results (start, finish,
+    tat, wt) are typed columns indexed by process position, so a process
+    costs a few dozen bytes instead of a full object. Every
+    SchedulingAlgorithm method accepts a table in place of a process list and
+    fills its result columns in place; the input columns are never modified.
+    Pids default to P1..Pn and are only built when asked for.
+    """
+    def __init__(self, arrival, burst, priority=None, pids=None):
+        self.arrival = array('q', arrival)
+        self.burst = array('q', burst)
+        n = len(self.arrival)
+        self.priority = array('q', priority) if priority is not None else array('q', bytes(8 * n))
+        self.pids = list(pids) if pids is not None else None
+        
+        if len(self.burst) != n or len(self.priority) != n or (self.pids is not None and len(self.pids) != n):
+            raise ValueError("All process table columns must have the same length")
+        
+        self.reset_results()
+    
+    @classmethod
+    def from_processes(cls, processes):
+        """Build a table from a list of Process objects"""
+        return cls(
+            [p.arrival_time for p in processes],
+            [p.burst_time for p in processes],
+            [p.priority for p in processes],
+            [p.pid for p in processes]
+        )
+    
+    def reset_results(self):
+        """Give the table fresh result columns before a new run
+        
+        New arrays are allocated rather than cleared, so a ScheduleResult from
+        an earlier run keeps its own columns.
+        """
+        n = len(self.arrival)
+        self.start = array('q', [-1]) * n
+        self.finish = array('q', bytes(8 * n))
+        self.tat = array('q', bytes(8 * n))
+        self.wt = array('q', bytes(8 * n))
+    
+    def __len__(self):
+        return len(self.arrival)
+    
+    def pid(self, index):
+        """Process ID of the process at ``index``"""
+        return self.pids[index] if self.pids is not None else f"P{index + 1}"
+    
+    def color(self, index):
+        """Color of the process at ``index``; pids not of the form P<number> go by position"""
+        if self.pids is None:
+            return PROCESS_COLORS[(index + 1) % len(PROCESS_COLORS)]
+        return process_color(self.pids[index], index + 1)
+    
+    def index_of(self, pid):
+        """Position of the process with the given pid"""
+        if self.pids is not None:
+            return self.pids.index(pid)
+        
+        index = int(pid[1:]) - 1
+        if not 0 <= index < len(self):
+            raise ValueError(f"{pid} is not in the process table")
+        return index
+    
+    def complete(self, index, finish_time):
+        """Record that the process at ``index`` finished at ``finish_time``"""
+        self.finish[index] = finish_time
+        self.tat[index] = finish_time - self.arrival[index]
+        self.wt[index] = self.tat[index] - self.burst[index]
+    
+    def process(self, index):
+        """Build a Process object for one row, results included"""
+        process = Process(
+            self.pid(index), self.arrival[index], self.burst[index], self.priority[index], self.color(index)
+        )
+        process.start_time = self.start[index]
+        process.finish_time = self.finish[index]
+        process.turnaround_time = self.tat[index]
+        process.waiting_time = self.wt[index]
+        return process
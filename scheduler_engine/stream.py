@@ -0,0 +1,265 @@
+from collections import namedtuple
+from itertools import islice
+
+from .algorithms import Checkpoint, SchedulingAlgorithm, _Run
+from .incremental import _Unstarted
+from .process import Process, ProcessTable
+
+# Processes read from the source at a time, at the least; a read also takes
+# as many as the window still holds, so carrying the waiting ones over to
+# the next window never costs more than the processes it brings in
+STREAM_CHUNK = 4096
+
+# Events collected before the engine pauses to hand them over, at the least;
+# a pause copies the ready queue, so it also waits for as many events as the
+# queue holds
+FLUSH_EVENTS = 1024
+
+# Input position of the stand-in that ends the window of a streamed run
+_STAND_IN = -1
+
+Segment = namedtuple('Segment', 'index pid start end')
+Segment.__doc__ = "Process ``index`` ran on the CPU from ``start`` to ``end``"
+
+Completion = namedtuple('Completion', 'index pid arrival burst priority start finish')
+Completion.__doc__ = "Process ``index`` finished; ``start`` is when it first ran"
+
+def arrivals(source):
+    """(index, pid, arrival, burst, priority) of every process, in arrival order
+    
+    ``source`` is a ProcessTable, a list of Process objects, or an iterable of
+    ProcessTable batches already in arrival order (such as a WorkloadReader),
+    in which case indices count rows across all batches. Equal arrivals keep
+    input order.
+    """
+    if isinstance(source, ProcessTable):
+        for index in sorted(range(len(source)), key=source.arrival.__getitem__):
+            yield index, source.pid(index), source.arrival[index], source.burst[index], source.priority[index]
+    elif isinstance(source, list) and all(isinstance(p, Process) for p in source[:1]):
+        for index in sorted(range(len(source)), key=lambda i: source[i].arrival_time):
+            p = source[index]
+            yield index, p.pid, p.arrival_time, p.burst_time, p.priority
+    else:
+        offset = 0
+        last_arrival = 0
+        for table in source:
+            for i in range(len(table)):
+                if table.arrival[i] < last_arrival:
+                    raise ValueError("batches must be in arrival order")
+                last_arrival = table.arrival[i]
+                yield offset + i, table.pid(i), last_arrival, table.burst[i], table.priority[i]
+            offset += len(table)
+
+def iter_schedule(algorithm, source, time_quantum=2, coalesce=True, fast_forward=True):
+    """Yield Segment and Completion events of a run as they are decided
+    
+    Produces the same blocks and results as SchedulingAlgorithm.run, using
+    the same engines, but only the processes that have arrived and not
+    finished (plus the next few read from ``source``) are held in memory,
+    so a stream of batches can be scheduled in bounded memory and the
+    first events are available early. Segments come in time order; each
+    Completion follows the last segment of its process.
+    """
+    if algorithm not in SchedulingAlgorithm.ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    return _StreamRun(algorithm, source, fast_forward).events(time_quantum, coalesce)
+
+class _Sink:
+    """Stand-in for a Timeline or completion list that forwards ``append``"""
+    __slots__ = ('append',)
+    
+    def __init__(self, append):
+        self.append = append
+
+class _Window:
+    """Process table of a streamed run: the processes read and not yet finished, by input position
+    
+    Columns are dicts rather than arrays, so rows come and go without
+    renumbering the ready queue and ties still break by input position.
+    """
+    def __init__(self):
+        self.pids = {}
+        self.arrival = {}
+        self.burst = {}
+        self.priority = {}
+        self.start = _Unstarted()
+        self.finish = {}
+    
+    def __len__(self):
+        return len(self.arrival)
+    
+    def add(self, index, pid, arrival, burst, priority):
+        self.pids[index] = pid
+        self.arrival[index] = arrival
+        self.burst[index] = burst
+        self.priority[index] = priority
+    
+    def complete(self, index, finish_time):
+        self.finish[index] = finish_time
+    
+    def remove(self, index):
+        """Drop a row, returning its (pid, arrival, burst, priority, start, finish)"""
+        return (self.pids.pop(index), self.arrival.pop(index), self.burst.pop(index), self.priority.pop(index),
+                self.start.pop(index, -1), self.finish.pop(index, 0))
+
+class _StreamRun(_Run):
+    """Engine driver for iter_schedule: a window of the workload, refilled as the run reaches its end
+    
+    The engine schedules a _Window holding the processes read from the
+    source and not finished. Its ``at_checkpoint`` runs every step and
+    pauses the engine when events are due to be handed over, or when the
+    run reaches the last process read; the next processes are then read
+    and the engine resumes from the Checkpoint it paused at.
+    
+    Unless the source is exhausted, a stand-in process arriving with the
+    last one read ends the window, so the engine never takes the end of
+    the window for the end of the workload. Round Robin can admit it at the
+    end of a slice; it is then replaced in the queue by the processes that
+    arrived during that slice.
+    """
+    checkpoint_every = 1
+    vectorize = False
+    
+    def __init__(self, algorithm, source, fast_forward=True):
+        self.algorithm = algorithm
+        self.fast_forward = fast_forward
+        self.source = arrivals(source)
+        self.exhausted = False
+        # FCFS keeps no ready queue, so it never needs processes read ahead of its position
+        self.by_time = algorithm != "FCFS"
+        self.table = _Window()
+        self.arrivals = []
+        # The engine pauses for a refill once it admits ``refill_at`` processes or reaches ``horizon``
+        self.refill_at = 0
+        self.horizon = 0
+        self.timeline = _Sink(self.segment)
+        self.completed = _Sink(self.complete)
+        # Last segment as a [index, pid, start, end] list, extended in place while it grows
+        self.held = None
+        self.pending = []
+        self.paused = None
+    
+    def segment(self, index, start, end, coalesce=False):
+        """Timeline.append for the engine; the last segment is held back until it cannot grow"""
+        held = self.held
+        if held is not None:
+            if coalesce and held[3] == start and held[0] == index:
+                held[3] = end
+                return
+            self.pending.append(Segment._make(held))
+        self.held = [index, self.table.pids[index], start, end]
+    
+    def complete(self, index):
+        """Completion list append for the engine; a finished process ends the held segment and leaves the window"""
+        self.pending.append(Segment._make(self.held))
+        self.held = None
+        self.pending.append(Completion(index, *self.table.remove(index)))
+    
+    def at_checkpoint(self, current_time, admitted, ready, dispatch, countdown):
+        """Engine hook, every step: pause to refill the window or to hand over events"""
+        if admitted < self.refill_at and current_time < self.horizon:
+            if len(self.pending) < FLUSH_EVENTS or len(self.pending) < len(ready):
+                return False
+            refill = False
+        else:
+            refill = True
+        # Finished processes have left the window, so none count as completed in it
+        self.paused = Checkpoint(current_time, admitted, tuple(ready), dispatch, countdown, 0, 0, 0), refill
+        return True
+    
+    def events(self, time_quantum, coalesce):
+        """Run the engine window by window, yielding the events of each pause"""
+        self.refill(Checkpoint(0, 0, (), 0, 0, 0, 0, 0))
+        while True:
+            self.paused = None
+            SchedulingAlgorithm._drive(self.algorithm, self.table, self, time_quantum, coalesce)
+            pending, self.pending = self.pending, []
+            yield from pending
+            if self.paused is None:
+                break
+            checkpoint, refill = self.paused
+            if refill:
+                self.refill(checkpoint)
+            else:
+                self.resume = checkpoint
+        if self.held is not None:
+            yield Segment._make(self.held)
+    
+    def refill(self, checkpoint):
+        """Read the next processes into the window and resume at ``checkpoint``"""
+        table = self.table
+        if _STAND_IN in table.arrival:
+            table.remove(_STAND_IN)
+        waiting = [index for index in self.arrivals[checkpoint.admitted:] if index != _STAND_IN]
+        
+        # Read until the window holds every process arriving by the current time
+        read = []
+        size = max(STREAM_CHUNK, len(table))
+        while not self.exhausted:
+            chunk = list(islice(self.source, size))
+            read += chunk
+            if len(chunk) < size:
+                self.exhausted = True
+            elif not (self.by_time and chunk[-1][2] <= checkpoint.time):
+                break
+        for process in read:
+            table.add(*process)
+        
+        # Processes admitted with the stand-in at the end of a slice join the queue in its place
+        ready = checkpoint.ready
+        joined = 0
+        if self.algorithm == "Round Robin":
+            ready = []
+            for entry in checkpoint.ready:
+                if entry[0] != _STAND_IN:
+                    ready.append(entry)
+                    continue
+                while joined < len(read) and read[joined][2] <= checkpoint.time:
+                    ready.append((read[joined][0], read[joined][3]))
+                    joined += 1
+            ready = tuple(ready)
+        
+        self.arrivals = waiting + [process[0] for process in read[joined:]]
+        if self.exhausted:
+            self.refill_at = self.horizon = float('inf')
+        else:
+            table.add(_STAND_IN, '', read[-1][2], 1, 0)
+            self.arrivals.append(_STAND_IN)
+            self.refill_at = len(self.arrivals) - 1
+            self.horizon = read[-1][2] if self.by_time else float('inf')
+        self.resume = checkpoint._replace(admitted=0, ready=ready)
+
+class RunningMetrics:
+    """Averages, throughput and makespan accumulated from Completion events
+    
+    Keeps a handful of running totals, so it can follow a run of any length
+    in constant memory; percentiles need every value and are left to
+    ScheduleResult.metrics.
+    """
+    def __init__(self):
+        self.count = 0
+        self.total_tat = 0
+        self.total_wt = 0
+        self.total_response = 0
+        self.makespan = 0
+    
+    def add(self, completion):
+        """Account for one finished process"""
+        tat = completion.finish - completion.arrival
+        self.count += 1
+        self.total_tat += tat
+        self.total_wt += tat - completion.burst
+        self.total_response += completion.start - completion.arrival
+        if completion.finish > self.makespan:
+            self.makespan = completion.finish
+    
+    def metrics(self):
+        """The averages as a dict keyed like ScheduleResult.metrics"""
+        n = self.count
+        return {
+            'avg_tat': self.total_tat / n if n else 0.0,
+            'avg_wt': self.total_wt / n if n else 0.0,
+            'avg_response': self.total_response / n if n else 0.0,
+            'throughput': n / self.makespan if self.makespan > 0 else 0.0,
+            'makespan': self.makespan,
+        }
@@ -0,0 +1,67 @@
+from array import array
+from types import MappingProxyType
+
+class Timeline:
+    """Execution blocks for the Gantt chart, stored as compact columns
+    
+    Each block is a (process index, start, end) row held in typed arrays;
+    pids and colors are looked up per process from the ProcessTable instead
+    of being stored with every block. Blocks are appended in time order.
+    Indexing and iteration return read-only dict-like views with 'pid',
+    'start', 'end' and 'color' keys, so code written against the old list of
+    dicts keeps working.
+    """
+    def __init__(self, processes):
+        self.processes = processes
+        self.process_index = array('i')
+        self.starts = array('q')
+        self.ends = array('q')
+    
+    def append(self, index, start, end, coalesce=False):
+        """Append a block for process ``index``, extending the last block if it continues it"""
+        if coalesce and self.process_index and self.process_index[-1] == index and self.ends[-1] == start:
+            self.ends[-1] = end
+            return
+        
+        self.process_index.append(index)
+        self.starts.append(start)
+        self.ends.append(end)
+    
+    def block(self, row):
+        """Read-only dict-like view of one block"""
+        index = self.process_index[row]
+        return MappingProxyType({
+            'pid': self.processes.pid(index),
+            'start': self.starts[row],
+            'end': self.ends[row],
+            'color': self.processes.color(index)
+        })
+    
+    def __len__(self):
+        return len(self.starts)
+    
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self.block(r) for r in range(*row.indices(len(self)))]
+        return self.block(row)
+    
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self.block(row)
+    
+    def makespan(self):
+        """Time at which the last block ends"""
+        return self.ends[-1] if self.ends else 0
+    
+    def busy_time(self):
+        """Total time the CPU spent executing processes"""
+        return sum(self.ends) - sum(self.starts)
+    
+    def slices(self, pid):
+        """(start, end) pairs of every block that ran ``pid``"""
+        index = self.processes.index_of(pid)
+        return [
+            (start, end)
+            for i, start, end in zip(self.process_index, self.starts, self.ends)
+            if i == index
+        ]
@@ -0,0 +1,322 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import sub
+
+from .algorithms import ScheduleResult
+from .process import PROCESS_COLORS, ProcessTable, process_color
+from .timeline import Timeline
+
+TRACE_MAGIC = b'CPUTRACE'
+TRACE_VERSION = 1
+TRACE_SUFFIX = '.cputrace'
+
+# magic, version, flags, time quantum, process count, segment count,
+# algorithm name size, pid blob size; padded to 64 bytes
+_HEADER = struct.Struct('<8sHHxxxxqqqqq')
+_HEADER_SIZE = 64
+_HAS_PIDS = 1
+_COALESCED = 2
+
+# Process columns stored one after another, each as little-endian int64
+_PROCESS_COLUMNS = ('arrival', 'burst', 'priority', 'start', 'finish')
+
+# A segment record is (process index, start, end) as three int64 values
+_SEGMENT_WORDS = 3
+
+# Segments interleaved per bulk write
+_WRITE_CHUNK = 1 << 20
+
+def _padded(size):
+    """``size`` rounded up to a multiple of 8 bytes"""
+    return (size + 7) & ~7
+
+def _little_endian(values):
+    """int64 array of ``values`` in little-endian byte order"""
+    values = array('q', values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def write_trace(path, result, algorithm, time_quantum=0, coalesced=True):
+    """Write a ScheduleResult to a binary trace file
+    
+    The file is a 64-byte header, the algorithm name and pids, the process
+    table as int64 columns (arrival, burst, priority, start, finish) and
+    then one fixed 24-byte (process index, start, end) record per timeline
+    segment, each section aligned to 8 bytes. Columns go out in single
+    writes and segments in large interleaved chunks.
+    """
+    table, timeline = result.table, result.timeline
+    n, m = len(table), len(timeline)
+    name = algorithm.encode('utf-8')
+    pids = '\n'.join(table.pids).encode('utf-8') if table.pids is not None else b''
+    flags = (_HAS_PIDS if table.pids is not None else 0) | (_COALESCED if coalesced else 0)
+    
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, flags, time_quantum, n, m, len(name), len(pids)))
+        f.write(bytes(_HEADER_SIZE - _HEADER.size))
+        for blob in (name, pids):
+            f.write(blob)
+            f.write(bytes(_padded(len(blob)) - len(blob)))
+        
+        for column in _PROCESS_COLUMNS:
+            f.write(_little_endian(getattr(table, column)).tobytes())
+        
+        for first in range(0, m, _WRITE_CHUNK):
+            last = min(first + _WRITE_CHUNK, m)
+            records = array('q', bytes(8 * _SEGMENT_WORDS * (last - first)))
+            view = memoryview(records)
+            view[0::_SEGMENT_WORDS] = memoryview(array('q', timeline.process_index[first:last]))
+            view[1::_SEGMENT_WORDS] = memoryview(timeline.starts[first:last])
+            view[2::_SEGMENT_WORDS] = memoryview(timeline.ends[first:last])
+            view.release()
+            if sys.byteorder == 'big':
+                records.byteswap()
+            f.write(records.tobytes())
+
+class TraceError(ValueError):
+    """A file is not a readable trace"""
+
+class TraceFile:
+    """Read-only, memory-mapped view of a binary trace file
+    
+    Opening a trace reads only the header; process columns and segments are
+    int64 views into the mapping, so the operating system pages in just the
+    parts that are touched. ``window(start, end)`` finds the segments
+    overlapping a time range by binary search, and ``timeline`` copies such
+    a range into a Timeline for the GUI. Like a ProcessTable it answers
+    ``pid``, ``color`` and ``index_of`` and reads like a Timeline, and
+    ``result()`` materialises the whole run as a ScheduleResult.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise TraceError(f"{path} is empty")
+        self._views = []
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+    
+    def _read_header(self):
+        if len(self._map) < _HEADER_SIZE:
+            raise TraceError(f"{self.path} is too short to be a trace")
+        magic, version, flags, quantum, n, m, name_size, pids_size = _HEADER.unpack_from(self._map)
+        if magic != TRACE_MAGIC:
+            raise TraceError(f"{self.path} is not a trace file")
+        if version != TRACE_VERSION:
+            raise TraceError(f"{self.path} has unsupported trace version {version}")
+        
+        if min(n, m, name_size, pids_size) < 0:
+            raise TraceError(f"{self.path} has a corrupt header")
+        offset = _HEADER_SIZE
+        name_offset = offset
+        offset += _padded(name_size)
+        pids_offset = offset
+        offset += _padded(pids_size)
+        if len(self._map) < offset + 8 * (len(_PROCESS_COLUMNS) * n + _SEGMENT_WORDS * m):
+            raise TraceError(f"{self.path} is truncated")
+        
+        try:
+            self.algorithm = self._map[name_offset:name_offset + name_size].decode('utf-8')
+            # Checked now so that the pids, decoded on first use, cannot fail later
+            pids = self._map[pids_offset:pids_offset + pids_size].decode('utf-8') if flags & _HAS_PIDS else None
+        except UnicodeDecodeError:
+            raise TraceError(f"{self.path} has a corrupt algorithm name or pids")
+        if pids is not None and pids.count('\n') != max(n - 1, 0):
+            raise TraceError(f"{self.path} does not store one pid per process")
+        self._pid_blob = (pids_offset, pids_size) if flags & _HAS_PIDS else None
+        self._pids = None
+        
+        self.time_quantum = quantum
+        self.coalesced = bool(flags & _COALESCED)
+        self.process_count = n
+        self.segment_count = m
+        
+        for column in _PROCESS_COLUMNS:
+            setattr(self, column, self._int64(offset, n))
+            offset += 8 * n
+        
+        segments = self._int64(offset, _SEGMENT_WORDS * m)
+        self.process_index = self._view(segments[0::_SEGMENT_WORDS])
+        self.starts = self._view(segments[1::_SEGMENT_WORDS])
+        self.ends = self._view(segments[2::_SEGMENT_WORDS])
+    
+    def _view(self, view):
+        """Remember a memoryview so close() can release it"""
+        self._views.append(view)
+        return view
+    
+    def _int64(self, offset, count):
+        """int64 column of ``count`` values at ``offset``, without copying on little-endian hosts"""
+        if sys.byteorder == 'big':
+            values = array('q', self._map[offset:offset + 8 * count])
+            values.byteswap()
+            return values
+        base = self._view(memoryview(self._map))
+        return self._view(base[offset:offset + 8 * count].cast('q'))
+    
+    def close(self):
+        """Release the mapping; views taken from the trace become invalid"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._map.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __len__(self):
+        return self.segment_count
+    
+    # Read-only Timeline interface, so a trace can be shown wherever a Timeline is
+    block = Timeline.block
+    __getitem__ = Timeline.__getitem__
+    __iter__ = Timeline.__iter__
+    busy_time = Timeline.busy_time
+    slices = Timeline.slices
+    
+    @property
+    def processes(self):
+        """The trace is its own process table for pid and color lookups"""
+        return self
+    
+    @property
+    def pids(self):
+        """Process IDs, decoded on first use; None when the trace stores defaults"""
+        if self._pids is None and self._pid_blob is not None:
+            offset, size = self._pid_blob
+            self._pids = self._map[offset:offset + size].decode('utf-8').split('\n') if self.process_count else []
+        return self._pids
+    
+    def pid(self, index):
+        """Process ID of the process at ``index``"""
+        return self.pids[index] if self._pid_blob is not None else f"P{index + 1}"
+    
+    def color(self, index):
+        """Color of the process at ``index``, as ProcessTable.color picks it"""
+        if self._pid_blob is None:
+            return PROCESS_COLORS[(index + 1) % len(PROCESS_COLORS)]
+        return process_color(self.pids[index], index + 1)
+    
+    def index_of(self, pid):
+        """Position of the process with the given pid"""
+        if self._pid_blob is not None:
+            return self.pids.index(pid)
+        index = int(pid[1:]) - 1
+        if not 0 <= index < self.process_count:
+            raise ValueError(f"{pid} is not in the trace")
+        return index
+    
+    def segment(self, row):
+        """(process index, start, end) of one segment"""
+        return self.process_index[row], self.starts[row], self.ends[row]
+    
+    def makespan(self):
+        """Time at which the last segment ends"""
+        return self.ends[-1] if self.segment_count else 0
+    
+    def window(self, start_time, end_time):
+        """Rows of the segments overlapping [start_time, end_time), as a range
+        
+        Segments are stored in time order and never overlap, so both their
+        starts and ends are sorted and two binary searches suffice.
+        """
+        first = bisect_right(self.ends, start_time)
+        last = bisect_left(self.starts, end_time, first)
+        return range(first, max(first, last))
+    
+    def timeline(self, start_time=None, end_time=None):
+        """Copy the segments of a time window (default: all) into a Timeline"""
+        if start_time is None and end_time is None:
+            rows = range(self.segment_count)
+        else:
+            rows = self.window(
+                start_time if start_time is not None else 0,
+                end_time if end_time is not None else self.makespan() + 1
+            )
+        
+        timeline = Timeline(self)
+        timeline.process_index = array('i', self.process_index[rows.start:rows.stop])
+        timeline.starts = array('q', self.starts[rows.start:rows.stop])
+        timeline.ends = array('q', self.ends[rows.start:rows.stop])
+        return timeline
+    
+    def table(self, copy=True):
+        """Copy the process table, results included, into a ProcessTable
+        
+        With ``copy=False`` a TraceTable reading the mapped columns is
+        returned instead; it is only valid while the trace is open.
+        """
+        if not copy:
+            return TraceTable(self)
+        table = ProcessTable(self.arrival, self.burst, self.priority, self.pids)
+        table.start = array('q', self.start)
+        table.finish = array('q', self.finish)
+        table.tat = array('q', [finish - arrival for finish, arrival in zip(table.finish, table.arrival)])
+        table.wt = array('q', [tat - burst for tat, burst in zip(table.tat, table.burst)])
+        return table
+    
+    def result(self):
+        """The whole run as a ScheduleResult, with ``order`` by finish time"""
+        table = self.table()
+        timeline = self.timeline()
+        timeline.processes = table
+        order = sorted(range(len(table)), key=table.finish.__getitem__)
+        return ScheduleResult(table, order, timeline)
+
+class TraceTable:
+    """Read-only ProcessTable interface over the mapped columns of a TraceFile
+    
+    Nothing is copied when it is made; turnaround and waiting times are not
+    stored in a trace, so they are computed on first use.
+    """
+    def __init__(self, trace):
+        self.trace = trace
+        for column in _PROCESS_COLUMNS:
+            setattr(self, column, getattr(trace, column))
+        self._tat = None
+        self._wt = None
+    
+    def __len__(self):
+        return self.trace.process_count
+    
+    @property
+    def pids(self):
+        return self.trace.pids if self.trace._pid_blob is not None else None
+    
+    @property
+    def tat(self):
+        if self._tat is None:
+            self._tat = array('q', map(sub, self.finish, self.arrival))
+        return self._tat
+    
+    @property
+    def wt(self):
+        if self._wt is None:
+            self._wt = array('q', map(sub, self.tat, self.burst))
+        return self._wt
+    
+    def pid(self, index):
+        """Process ID of the process at ``index``"""
+        return self.trace.pid(index)
+    
+    def color(self, index):
+        """Color of the process at ``index``"""
+        return self.trace.color(index)
+    
+    def index_of(self, pid):
+        """Position of the process with the given pid"""
+        return self.trace.index_of(pid)
@@ -0,0 +1,119 @@
+import queue
+import threading
+import time
+
+from .incremental import CheckpointedRun
+from .timeline import Timeline
+
+# Segments are sent at least this often while a run is in progress
+FLUSH_SECONDS = 0.05
+
+class _Cancelled(Exception):
+    """Raised in the worker thread to stop a cancelled run"""
+
+class SimulationWorker:
+    """One scheduling run on a background thread, reported through a queue
+    
+    The thread drives a CheckpointedRun and timeline segments go through the
+    queue in chunks; they are appended to ``timeline`` by ``poll``, which
+    must be called from the thread that reads the timeline (the Tk event
+    loop, with root.after). A Gantt view can therefore show the run while it
+    is still going, and the timeline is never touched by two threads.
+    ``cancel`` stops the run at the next check. Once ``poll`` returns False,
+    ``state`` is 'done' (with ``result``), 'cancelled' or 'failed' (with
+    ``error``).
+    
+    ``previous`` is the CheckpointedRun of an earlier, finished run with the
+    same algorithm and settings; ``table`` is then scheduled with
+    CheckpointedRun.rerun, so only the part of the run after the first edited
+    process is worked out again. The worker's run, ``checkpointed``, can be
+    passed on to the next worker once this one is done; after a cancelled or
+    failed run it must be dropped.
+    """
+    def __init__(self, algorithm, table, time_quantum=2, coalesce=True, previous=None):
+        self.algorithm = algorithm
+        self.table = table
+        self.time_quantum = time_quantum
+        self.coalesce = coalesce
+        if previous is None:
+            previous = CheckpointedRun(algorithm, table, time_quantum, coalesce)
+        self.checkpointed = previous
+        self.timeline = Timeline(table)
+        self.total = len(table)
+        self.finished = 0
+        self.state = 'running'
+        self.result = None
+        self.error = None
+        self._queue = queue.Queue()
+        self._cancel = threading.Event()
+        self._sent = 0
+        self._last_flush = 0.0  # The first check sends what a resumed run reuses
+        self._thread = threading.Thread(target=self._run, name='simulation', daemon=True)
+    
+    def start(self):
+        """Start the run; returns the worker"""
+        self._thread.start()
+        return self
+    
+    def cancel(self):
+        """Ask the run to stop; ``poll`` reports it once the thread has noticed"""
+        self._cancel.set()
+    
+    @property
+    def running(self):
+        return self.state == 'running'
+    
+    def _run(self):
+        run = self.checkpointed
+        try:
+            if run.table is self.table:
+                result = run.run(self._progress)
+            else:
+                result = run.rerun(self.table, self._progress)
+            self._send(len(result.timeline))
+            self._queue.put(('done', result))
+        except _Cancelled:
+            self._queue.put(('cancelled',))
+        except Exception as e:
+            self._queue.put(('failed', e))
+    
+    def _progress(self, run):
+        """Called by the run every few steps: stop if cancelled, send segments now and then"""
+        if self._cancel.is_set():
+            raise _Cancelled()
+        if time.perf_counter() - self._last_flush >= FLUSH_SECONDS:
+            # The last block may still be extended by coalescing
+            self._send(len(run.timeline) - 1)
+            self._last_flush = time.perf_counter()
+    
+    def _send(self, end):
+        """Send the blocks of the run's timeline from the last one sent up to ``end``"""
+        timeline = self.checkpointed.timeline
+        chunk = (timeline.process_index[self._sent:end], timeline.starts[self._sent:end], timeline.ends[self._sent:end])
+        self._sent = max(self._sent, end)
+        self._queue.put(('segments', chunk, len(self.checkpointed.completed)))
+    
+    def poll(self):
+        """Apply the messages sent so far, without blocking; True while the run goes on"""
+        while self.state == 'running':
+            try:
+                message = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            kind = message[0]
+            if kind == 'segments':
+                process_index, starts, ends = message[1]
+                self.timeline.process_index.extend(process_index)
+                self.timeline.starts.extend(starts)
+                self.timeline.ends.extend(ends)
+                self.finished = message[2]
+            elif kind == 'done':
+                self.result = message[1]
+                self.state = 'done'
+            elif kind == 'cancelled':
+                self.state = 'cancelled'
+            else:
+                self.error = message[1]
+                self.state = 'failed'
+        return self.state == 'running'
@@ -0,0 +1,188 @@
+import csv
+import gzip
+import json
+from array import array
+
+from .process import ProcessTable
+
+# Accepted header spellings for each column, compared case-insensitively
+COLUMN_ALIASES = {
+    'pid': ('pid', 'process id', 'process'),
+    'arrival': ('arrival', 'arrival_time', 'arrival time', 'at'),
+    'burst': ('burst', 'burst_time', 'burst time', 'bt'),
+    'priority': ('priority',),
+}
+
+# Rows per ProcessTable yielded by WorkloadReader
+DEFAULT_BATCH_SIZE = 65536
+
+class WorkloadError(ValueError):
+    """A workload file could not be read; ``line`` is the 1-based line number"""
+    def __init__(self, message, line=None):
+        super().__init__(f"line {line}: {message}" if line is not None else message)
+        self.line = line
+
+def open_workload(path):
+    """Open a workload file for reading as text, decompressing ``.gz`` files"""
+    if str(path).lower().endswith('.gz'):
+        return gzip.open(path, 'rt', newline='')
+    return open(path, newline='')
+
+def workload_format(path):
+    """'jsonl' for .jsonl/.ndjson files (optionally gzipped), else 'csv'"""
+    name = str(path).lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    return 'jsonl' if name.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+def _column_positions(header):
+    """Map each known column to its position in the header row"""
+    names = [name.strip().lower() for name in header]
+    positions = {}
+    for column, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in names:
+                positions[column] = names.index(alias)
+                break
+    
+    for column in ('arrival', 'burst'):
+        if column not in positions:
+            raise WorkloadError(f"missing '{column}' column", 1)
+    return positions
+
+def _csv_records(f):
+    """(line, fields) for each non-empty CSV row after the header"""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        raise WorkloadError("file is empty")
+    positions = _column_positions(header)
+    
+    for row in reader:
+        if not row:
+            continue
+        yield reader.line_num, {
+            column: row[position] if position < len(row) else None
+            for column, position in positions.items()
+        }
+
+def _jsonl_records(f):
+    """(line, fields) for each non-blank JSONL line; fields is None if it is not an object"""
+    columns = {alias: column for column, aliases in COLUMN_ALIASES.items() for alias in aliases}
+    
+    for line, text in enumerate(f, 1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            yield line, None
+            continue
+        if not isinstance(record, dict):
+            yield line, None
+            continue
+        
+        fields = {}
+        for key, value in record.items():
+            column = columns.get(key.strip().lower())
+            if column is not None and column not in fields:
+                fields[column] = value
+        yield line, fields
+
+def _whole_number(value):
+    """int() of a CSV string or JSON number, rejecting fractions and booleans"""
+    if isinstance(value, bool):
+        raise ValueError(value)
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(value)
+        return int(value)
+    return int(value)
+
+def _record_values(line, fields):
+    """Validated (pid, arrival, burst, priority) of one record"""
+    if fields is None:
+        raise WorkloadError("not a JSON object", line)
+    try:
+        at = _whole_number(fields.get('arrival'))
+        bt = _whole_number(fields.get('burst'))
+        pr = fields.get('priority')
+        pr = _whole_number(pr) if pr not in (None, '') else 0
+    except (TypeError, ValueError):
+        raise WorkloadError("arrival, burst and priority must be whole numbers", line)
+    if at < 0 or bt <= 0:
+        raise WorkloadError("times must be non-negative and burst time > 0", line)
+    
+    pid = fields.get('pid')
+    return (str(pid).strip() if pid not in (None, '') else None), at, bt, pr
+
+class WorkloadReader:
+    """Stream a workload file as ProcessTable batches in bounded memory
+    
+    CSV files need a header row with arrival and burst columns; JSONL files
+    hold one object per line with the same keys. Either may be gzipped. pid
+    and priority are optional, with pids defaulting to P1..Pn across the
+    whole file. Iterating yields tables of up to ``batch_size`` rows.
+    
+    With ``ordered`` (the default) rows must come in non-decreasing arrival
+    order, as in a recorded trace, so consecutive batches can be fed to a
+    streaming engine. A malformed row raises WorkloadError with its line
+    number, unless an ``errors`` list is given: bad rows are then skipped and
+    their errors appended to it.
+    """
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE, ordered=True, errors=None):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.path = path
+        self.format = workload_format(path)
+        self.batch_size = batch_size
+        self.ordered = ordered
+        self.errors = errors
+        self.rows = 0
+    
+    def __iter__(self):
+        self.rows = 0
+        with open_workload(self.path) as f:
+            records = _csv_records(f) if self.format == 'csv' else _jsonl_records(f)
+            arrival, burst, priority, pids = array('q'), array('q'), array('q'), []
+            last_arrival = 0
+            
+            for line, fields in records:
+                try:
+                    pid, at, bt, pr = _record_values(line, fields)
+                    if self.ordered and at < last_arrival:
+                        raise WorkloadError(f"arrival time {at} is before the previous row's {last_arrival}", line)
+                except WorkloadError as e:
+                    if self.errors is None:
+                        raise
+                    self.errors.append(e)
+                    continue
+                
+                last_arrival = at
+                self.rows += 1
+                arrival.append(at)
+                burst.append(bt)
+                priority.append(pr)
+                pids.append(pid if pid is not None else f"P{self.rows}")
+                
+                if len(arrival) == self.batch_size:
+                    yield ProcessTable(arrival, burst, priority, pids)
+                    arrival, burst, priority, pids = array('q'), array('q'), array('q'), []
+            
+            if arrival:
+                yield ProcessTable(arrival, burst, priority, pids)
+
+def load_workload(path, errors=None):
+    """Read a whole CSV or JSONL workload file (optionally gzipped) into one ProcessTable
+    
+    Rows may be in any order. Times must be non-negative integers and burst
+    times positive, as in the GUI. ``errors`` works as in WorkloadReader.
+    """
+    arrival, burst, priority, pids = array('q'), array('q'), array('q'), []
+    for table in WorkloadReader(path, ordered=False, errors=errors):
+        arrival.extend(table.arrival)
+        burst.extend(table.burst)
+        priority.extend(table.priority)
+        pids.extend(table.pids)
+    
+    return ProcessTable(arrival, burst, priority, pids)
@@ -0,0 +1,57 @@
+"""Import-time budgets: the engine stays GUI-free and the first window comes up quickly"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds, measured inside a fresh interpreter so that its own startup is not counted
+ENGINE_IMPORT_BUDGET = 0.5
+FIRST_WINDOW_BUDGET = 3.0
+
+def run_python(code):
+    """Run ``code`` in a fresh interpreter from the repository root and return its stdout"""
+    completed = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, timeout=60
+    )
+    if completed.returncode:
+        pytest.fail(completed.stderr)
+    return completed.stdout
+
+def test_engine_import_budget():
+    output = run_python(
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import scheduler_engine\n"
+        "print(time.perf_counter() - start)\n"
+        "print(' '.join(m for m in ('tkinter', 'matplotlib', 'numpy') if m in sys.modules))\n"
+    )
+    elapsed, loaded = output.split('\n')[:2]
+    assert float(elapsed) < ENGINE_IMPORT_BUDGET
+    assert loaded == ''
+
+def test_gui_first_window_budget():
+    tkinter = pytest.importorskip('tkinter')
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        pytest.skip("no display")
+
+    output = run_python(
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import tkinter as tk\n"
+        "from cpu_scheduler_visualizer import SchedulerVisualizerApp\n"
+        "root = tk.Tk()\n"
+        "app = SchedulerVisualizerApp(root)\n"
+        "root.update()\n"
+        "print(time.perf_counter() - start)\n"
+        "print('matplotlib' in sys.modules)\n"
+        "root.destroy()\n"
+    )
+    elapsed, charts_loaded = output.split('\n')[:2]
+    assert float(elapsed) < FIRST_WINDOW_BUDGET
+    # Matplotlib is only imported once the charts are first drawn
+    assert charts_loaded == 'False'
@@ -0,0 +1,85 @@
+"""iter_schedule yields the same run as SchedulingAlgorithm.run"""
+import random
+
+import pytest
+
+from scheduler_engine import Completion, ProcessTable, SchedulingAlgorithm, Segment, iter_schedule
+from scheduler_engine import stream
+
+WORKLOADS = 60
+
+def workloads(seed, sort=False):
+    """Random (arrival, burst, priority) columns, from idle to overloaded CPUs"""
+    rng = random.Random(seed)
+    for _ in range(WORKLOADS):
+        n = rng.randint(0, 40)
+        spread = rng.choice([5, 30, 200])
+        arrival = [rng.randint(0, spread) for _ in range(n)]
+        if sort:
+            arrival.sort()
+        burst = [rng.randint(1, rng.choice([3, 10, 40])) for _ in range(n)]
+        priority = [rng.randint(0, 3) for _ in range(n)]
+        yield arrival, burst, priority, rng.randint(1, 5)
+
+def assert_same_run(events, result):
+    """``events`` has the timeline, results and completion order of ``result``, each Completion after its last segment"""
+    timeline = result.timeline
+    segments = [event for event in events if type(event) is Segment]
+    completions = [event for event in events if type(event) is Completion]
+    assert [(s.index, s.start, s.end) for s in segments] == list(
+        zip(timeline.process_index, timeline.starts, timeline.ends)
+    )
+    assert [c.index for c in completions] == list(result.order)
+    for c in completions:
+        assert (c.start, c.finish) == (result.start[c.index], result.finish[c.index])
+
+    last = {}
+    for position, event in enumerate(events):
+        if type(event) is Segment:
+            last[event.index] = position
+        else:
+            assert last[event.index] == position - 1
+
+def expected(algorithm, arrival, burst, priority, quantum, coalesce, fast_forward=True):
+    table = ProcessTable(arrival, burst, priority)
+    if algorithm == "Round Robin":
+        return SchedulingAlgorithm.round_robin(table, quantum, fast_forward, coalesce)
+    return SchedulingAlgorithm.run(algorithm, table, quantum, coalesce)
+
+@pytest.fixture(params=[(1, 1), (3, 7), (4096, 1024)], ids=['tiny', 'small', 'default'])
+def window(request, monkeypatch):
+    """Read and flush sizes; tiny ones make every step refill the window"""
+    chunk, flush = request.param
+    monkeypatch.setattr(stream, 'STREAM_CHUNK', chunk)
+    monkeypatch.setattr(stream, 'FLUSH_EVENTS', flush)
+
+@pytest.mark.parametrize('coalesce', [True, False])
+@pytest.mark.parametrize('algorithm', SchedulingAlgorithm.ALGORITHMS)
+def test_table_source(window, algorithm, coalesce):
+    for arrival, burst, priority, quantum in workloads(1):
+        events = list(iter_schedule(algorithm, ProcessTable(arrival, burst, priority), quantum, coalesce))
+        assert_same_run(events, expected(algorithm, arrival, burst, priority, quantum, coalesce))
+
+@pytest.mark.parametrize('coalesce', [True, False])
+@pytest.mark.parametrize('algorithm', SchedulingAlgorithm.ALGORITHMS)
+def test_batch_source(window, algorithm, coalesce):
+    rng = random.Random(2)
+    for arrival, burst, priority, quantum in workloads(2, sort=True):
+        cuts = sorted(rng.sample(range(len(arrival) + 1), min(3, len(arrival) + 1)))
+        batches = [
+            ProcessTable(arrival[first:last], burst[first:last], priority[first:last])
+            for first, last in zip([0] + cuts, cuts + [len(arrival)])
+        ]
+        events = list(iter_schedule(algorithm, iter(batches), quantum, coalesce))
+        assert_same_run(events, expected(algorithm, arrival, burst, priority, quantum, coalesce))
+
+@pytest.mark.parametrize('coalesce', [True, False])
+def test_round_robin_without_fast_forward(window, coalesce):
+    for arrival, burst, priority, quantum in workloads(3):
+        table = ProcessTable(arrival, burst, priority)
+        events = list(iter_schedule("Round Robin", table, quantum, coalesce, fast_forward=False))
+        assert_same_run(events, expected("Round Robin", arrival, burst, priority, quantum, coalesce, False))
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        iter_schedule("Lottery", ProcessTable([0], [1]))
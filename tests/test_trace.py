@@ -0,0 +1,57 @@
+"""Damaged trace files are rejected with TraceError"""
+import os
+
+import pytest
+
+from scheduler_engine import ProcessTable, ResultCache, SchedulingAlgorithm, TraceError, TraceFile, write_trace
+from scheduler_engine.trace import _HEADER, _HEADER_SIZE
+
+NAME = "Round Robin"
+
+@pytest.fixture
+def trace_bytes(tmp_path):
+    table = ProcessTable([0, 1, 2], [3, 2, 1], pids=['A', 'Bb', 'C'])
+    path = tmp_path / 'run.cputrace'
+    write_trace(path, SchedulingAlgorithm.run(NAME, table, 2), NAME, 2)
+    return path.read_bytes()
+
+def open_damaged(tmp_path, data):
+    path = tmp_path / 'damaged.cputrace'
+    path.write_bytes(data)
+    with pytest.raises(TraceError):
+        TraceFile(path)
+
+def test_intact_trace_opens(tmp_path, trace_bytes):
+    path = tmp_path / 'intact.cputrace'
+    path.write_bytes(trace_bytes)
+    with TraceFile(path) as trace:
+        assert trace.algorithm == NAME
+        assert trace.pids == ['A', 'Bb', 'C']
+
+@pytest.mark.parametrize('offset, value', [
+    (_HEADER_SIZE, 0xff),  # Algorithm name
+    (_HEADER_SIZE + 16, 0xff),  # First pid
+    (_HEADER_SIZE + 18, ord('\n')),  # One pid too many
+])
+def test_corrupt_names(tmp_path, trace_bytes, offset, value):
+    data = bytearray(trace_bytes)
+    data[offset] = value
+    open_damaged(tmp_path, bytes(data))
+
+@pytest.mark.parametrize('field', [4, 5, 6, 7])  # Process, segment, name and pid counts
+@pytest.mark.parametrize('value', [-1, 1 << 60])
+def test_corrupt_counts(tmp_path, trace_bytes, field, value):
+    header = list(_HEADER.unpack_from(trace_bytes))
+    header[field] = value
+    open_damaged(tmp_path, _HEADER.pack(*header) + trace_bytes[_HEADER.size:])
+
+def test_cache_skips_damaged_trace(tmp_path):
+    cache = ResultCache(directory=tmp_path)
+    table = ProcessTable([0, 1], [2, 2])
+    cache.put('key', SchedulingAlgorithm.run(NAME, table, 2), NAME, 2, True)
+    for name in os.listdir(tmp_path):
+        path = tmp_path / name
+        data = bytearray(path.read_bytes())
+        data[_HEADER_SIZE] ^= 0xff
+        path.write_bytes(bytes(data))
+    assert ResultCache(directory=tmp_path).get('key', table) is None